@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Batch encryption benchmark.
+
+Times encrypt_many and decrypt_many on one large payload with an
+increasing number of worker processes and reports the speedup.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+from rsa_encryption.batch import decrypt_many, encrypt_many
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+MESSAGE_LENGTH = 400_000
+
+
+def main():
+    """Run the benchmark and print a speedup table."""
+    rng = random.Random(0)
+    public_key, private_key = generate_keys()
+    modulus, public_exp = public_key
+    message = "".join(rng.choices(ALPHABET, k=MESSAGE_LENGTH))
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count} & set(range(1, cpu_count + 1)))
+
+    baseline = None
+    print(f"{'workers':>8} {'encrypt s':>10} {'decrypt s':>10} {'speedup':>8}")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        (encrypted,) = encrypt_many(ALPHABET, modulus, public_exp, [message], workers)
+        encrypt_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        decrypt_many(ALPHABET, modulus, private_key, [encrypted], workers)
+        decrypt_time = time.perf_counter() - start
+
+        total = encrypt_time + decrypt_time
+        baseline = baseline or total
+        print(
+            f"{workers:>8} {encrypt_time:>10.2f} {decrypt_time:>10.2f} "
+            f"{baseline / total:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
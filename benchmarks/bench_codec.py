@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Codec throughput benchmark.
+
+Times rsa_encrypt and rsa_decrypt across message lengths and reports the
+cost per character, which should stay flat as messages grow.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys, rsa_decrypt, rsa_encrypt
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+MESSAGE_LENGTHS = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def main():
+    """Run the benchmark and print a throughput table."""
+    rng = random.Random(0)
+    public_key, private_key = generate_keys()
+    modulus, public_exp = public_key
+
+    print(f"{'chars':>10} {'encrypt ms':>12} {'decrypt ms':>12} {'ns/char':>10}")
+    for length in MESSAGE_LENGTHS:
+        message = "".join(rng.choices(ALPHABET, k=length))
+
+        start = time.perf_counter()
+        encrypted = rsa_encrypt(ALPHABET, modulus, public_exp, message)
+        encrypt_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rsa_decrypt(ALPHABET, modulus, private_key, encrypted)
+        decrypt_time = time.perf_counter() - start
+
+        per_char = (encrypt_time + decrypt_time) / length * 1e9
+        print(
+            f"{length:>10} {encrypt_time * 1e3:>12.1f} "
+            f"{decrypt_time * 1e3:>12.1f} {per_char:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Per-message latency benchmark for short messages.
+
+Compares building the codec setup on every call (the behaviour before
+contexts were cached) with the cached rsa_encrypt/rsa_decrypt functions and
+with a reused RSACodec.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys, rsa_decrypt, rsa_encrypt
+from rsa_encryption.codec import CodecContext, RSACodec
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789 "
+MESSAGE = "Hello World 123"
+RUNS = 20_000
+
+
+def uncached_round_trip(public_key, private_key):
+    """Encrypt and decrypt with the setup rebuilt on every call."""
+    encryptor = RSACodec(ALPHABET, public_key)
+    encryptor.context = CodecContext(ALPHABET, public_key[0])
+    decryptor = RSACodec(ALPHABET, private_key)
+    decryptor.context = CodecContext(ALPHABET, private_key[0])
+    return decryptor.decrypt(encryptor.encrypt(MESSAGE))
+
+
+def main():
+    """Run the benchmark and print per-message latency."""
+    public_key, private_key = generate_keys()
+    modulus, public_exp = public_key
+    encryptor = RSACodec(ALPHABET, public_key)
+    decryptor = RSACodec(ALPHABET, private_key)
+
+    cases = {
+        "setup per call": lambda: uncached_round_trip(public_key, private_key),
+        "rsa_encrypt/rsa_decrypt": lambda: rsa_decrypt(
+            ALPHABET,
+            modulus,
+            private_key,
+            rsa_encrypt(ALPHABET, modulus, public_exp, MESSAGE),
+        ),
+        "reused RSACodec": lambda: decryptor.decrypt(encryptor.encrypt(MESSAGE)),
+    }
+
+    print(f"{'path':<26} {'us/message':>10}")
+    for name, round_trip in cases.items():
+        seconds = min(timeit.repeat(round_trip, number=RUNS, repeat=3))
+        print(f"{name:<26} {seconds / RUNS * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Bulk data throughput benchmark.
+
+Compares encrypting every block with RSA (encrypt_bytes) against envelope
+mode, where only the session key goes through modular exponentiation.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+from rsa_encryption.byte_encryption import decrypt_bytes, encrypt_bytes
+from rsa_encryption.envelope import decrypt_envelope, encrypt_envelope
+
+KEY_BITS = 2048
+SIZES = [64 * 1024, 1024 * 1024, 16 * 1024 * 1024]
+
+# Per-block RSA is too slow to run on the largest payloads
+MAX_RSA_SIZE = 64 * 1024
+
+
+def throughput(func, size):
+    """Run func once and return its throughput in MB/s."""
+    start = time.perf_counter()
+    func()
+    return size / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    """Run the benchmark and print encryption and decryption throughput."""
+    public_key, private_key = generate_keys(KEY_BITS)
+    modulus, public_exp = public_key
+
+    print(f"{KEY_BITS}-bit key, throughput in MB/s")
+    print(f"{'size':>10} {'mode':<10} {'encrypt':>10} {'decrypt':>10}")
+    for size in SIZES:
+        data = os.urandom(size)
+        modes = {"envelope": (encrypt_envelope, decrypt_envelope)}
+        if size <= MAX_RSA_SIZE:
+            modes["rsa"] = (encrypt_bytes, decrypt_bytes)
+
+        for mode, (encrypt, decrypt) in modes.items():
+            encrypted = encrypt(modulus, public_exp, data)
+            encrypt_rate = throughput(lambda: encrypt(modulus, public_exp, data), size)
+            decrypt_rate = throughput(
+                lambda: decrypt(modulus, private_key, encrypted), size
+            )
+            print(f"{size:>10} {mode:<10} {encrypt_rate:>10.2f} {decrypt_rate:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Exponentiation backend benchmark.
+
+Times every available backend (built-in pow, the precomputed sliding-window
+engine and gmpy2 when installed) on the public exponent, the private
+exponent and the CRT path at several key sizes.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+from rsa_encryption.exponentiation import BACKENDS, make_exponentiator
+
+KEY_SIZES = [512, 1024, 2048]
+BLOCKS = 50
+
+
+def main():
+    """Run the benchmark and print microseconds per block."""
+    rng = random.Random(0)
+    print(f"{'bits':>5} {'exponent':<8} " + " ".join(f"{b:>10}" for b in BACKENDS))
+
+    for bits in KEY_SIZES:
+        public_key, private_key = generate_keys(bits)
+        modulus, public_exp = public_key
+        blocks = [rng.randrange(modulus) for _ in range(BLOCKS)]
+        cases = {"e": public_exp, "d": private_key.d, "crt": private_key}
+
+        for label, exponent in cases.items():
+            timings = []
+            for backend in BACKENDS:
+                exponentiate = make_exponentiator(modulus, exponent, backend)
+                seconds = min(
+                    timeit.repeat(
+                        lambda: [exponentiate(block) for block in blocks],
+                        number=1,
+                        repeat=3,
+                    )
+                )
+                timings.append(f"{seconds / BLOCKS * 1e6:>10.1f}")
+            print(f"{bits:>5} {label:<8} " + " ".join(timings))
+    print("(microseconds per block)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Fiat batch decryption benchmark.
+
+Measures per-ciphertext decryption time against one CRT decryption per
+ciphertext, as a function of batch size, at several key sizes.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.fiat_batch import fiat_decrypt_blocks
+from rsa_encryption.key_generation import PrivateKey, generate_key_family
+
+KEY_SIZES = [1024, 2048]
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64]
+CIPHERTEXTS = 128
+
+
+def best_time(func, repeat=3):
+    """Return the fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print per-ciphertext timings and speedups."""
+    rng = random.Random(0)
+    print(f"{'bits':>5} {'batch':>6} {'crt us':>10} {'fiat us':>10} {'speedup':>8}")
+
+    for bits in KEY_SIZES:
+        public_keys, private_key = generate_key_family(max(BATCH_SIZES), bits)
+        modulus = private_key.n
+        totient = (private_key.p - 1) * (private_key.q - 1)
+        exponents = [exponent for _, exponent in public_keys]
+
+        # One CRT private key per exponent, as a non-batched decrypter holds
+        private_keys = {
+            exponent: PrivateKey.from_primes(
+                private_key.p, private_key.q, pow(exponent, -1, totient)
+            )
+            for exponent in exponents
+        }
+
+        for batch_size in BATCH_SIZES:
+            batch_exponents = exponents[:batch_size]
+            batches = []
+            for _ in range(CIPHERTEXTS // batch_size):
+                messages = [rng.randrange(2, modulus) for _ in batch_exponents]
+                batches.append(
+                    [pow(m, e, modulus) for m, e in zip(messages, batch_exponents)]
+                )
+            count = len(batches) * batch_size
+
+            crt_seconds = best_time(
+                lambda: [
+                    private_keys[e].decrypt_block(c)
+                    for batch in batches
+                    for e, c in zip(batch_exponents, batch)
+                ]
+            )
+            fiat_seconds = best_time(
+                lambda: [
+                    fiat_decrypt_blocks(private_key, batch_exponents, batch)
+                    for batch in batches
+                ]
+            )
+            print(
+                f"{bits:>5} {batch_size:>6} {crt_seconds / count * 1e6:>10.1f} "
+                f"{fiat_seconds / count * 1e6:>10.1f} "
+                f"{crt_seconds / fiat_seconds:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Key store lookup benchmark.
+
+Fills a KeyStore with many key pairs and measures p50/p99 lookup latency
+for cold lookups (SQLite query and JSON parsing), warm lookups (served by
+the in-memory LRU) and loading a JSON key file per request.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import generate_keys, keys_from_dict, keys_to_dict
+from rsa_encryption.key_store import KeyStore
+
+LOOKUPS = 10000
+
+
+def percentiles(timings):
+    """Return the p50 and p99 of a list of timings, in microseconds."""
+    timings = sorted(timings)
+    return (
+        timings[len(timings) // 2] * 1e6,
+        timings[int(len(timings) * 0.99)] * 1e6,
+    )
+
+
+def time_lookups(lookup, key_ids):
+    """Time one lookup per key id."""
+    timings = []
+    for key_id in key_ids:
+        start = time.perf_counter()
+        lookup(key_id)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    """Run the benchmark and print lookup latencies."""
+    parser = argparse.ArgumentParser(description="Benchmark key store lookups")
+    parser.add_argument("--keys", type=int, default=100000, help="Stored key pairs")
+    parser.add_argument("--bits", type=int, default=1024, help="Key size in bits")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    # Key generation dominates setup, so a small pool is stored under many ids
+    pool = [generate_keys(args.bits) for _ in range(16)]
+    key_ids = [f"key-{i:06d}" for i in range(args.keys)]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "keys.db")
+        key_file = os.path.join(temp_dir, "keys.json")
+        with open(key_file, "w") as f:
+            json.dump(keys_to_dict(*pool[0]), f, indent=2)
+
+        with KeyStore(path) as store:
+            start = time.perf_counter()
+            store.add_many((pool[i % len(pool)] for i in range(args.keys)), key_ids)
+            fill_seconds = time.perf_counter() - start
+        print(f"Stored {args.keys} key pairs in {fill_seconds:.2f}s")
+
+        sample = rng.sample(key_ids, min(LOOKUPS, args.keys))
+        with KeyStore(path, cache_size=len(sample)) as store:
+            cold = time_lookups(store.get, sample)
+            warm = time_lookups(store.get, sample)
+
+        def load_key_file(_):
+            with open(key_file, "r") as f:
+                return keys_from_dict(json.load(f))
+
+        json_file = time_lookups(load_key_file, sample)
+
+    print(f"{'lookup':<12} {'p50 us':>10} {'p99 us':>10}")
+    for name, timings in (
+        ("cold store", cold),
+        ("warm LRU", warm),
+        ("json file", json_file),
+    ):
+        p50, p99 = percentiles(timings)
+        print(f"{name:<12} {p50:>10.1f} {p99:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
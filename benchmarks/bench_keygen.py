@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Key generation benchmark.
+
+Times generate_keys at each supported key size and exits with a non-zero
+status if the mean time at any size exceeds its budget.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+
+# Mean seconds allowed per key pair, and number of key pairs timed
+KEYGEN_BUDGETS = {1024: 0.5, 2048: 2.0, 4096: 20.0}
+KEYGEN_RUNS = {1024: 10, 2048: 5, 4096: 2}
+
+
+def main():
+    """Run the benchmark and check each size against its budget."""
+    parser = argparse.ArgumentParser(description="Benchmark RSA key generation")
+    parser.add_argument(
+        "--bits",
+        type=int,
+        nargs="+",
+        default=sorted(KEYGEN_BUDGETS),
+        choices=sorted(KEYGEN_BUDGETS),
+        help="Key sizes to benchmark",
+    )
+    args = parser.parse_args()
+
+    over_budget = False
+    print(f"{'bits':>6} {'runs':>5} {'mean s':>8} {'max s':>8} {'budget s':>9}")
+    for bits in args.bits:
+        timings = []
+        for _ in range(KEYGEN_RUNS[bits]):
+            start = time.perf_counter()
+            generate_keys(bits)
+            timings.append(time.perf_counter() - start)
+
+        mean = sum(timings) / len(timings)
+        budget = KEYGEN_BUDGETS[bits]
+        status = "" if mean <= budget else "  OVER BUDGET"
+        over_budget = over_budget or mean > budget
+        print(
+            f"{bits:>6} {len(timings):>5} {mean:>8.3f} {max(timings):>8.3f} "
+            f"{budget:>9.1f}{status}"
+        )
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Memoization benchmark.
+
+Encrypts and decrypts repetitive traffic (a few fixed headers, common
+phrases and identical short messages) with and without a MemoCache, and
+prints throughput and the cache counters.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.memo import MemoCache
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+HEADERS = ["order status update ", "payment received for ", "shipment left depot "]
+PHRASES = ["thank you", "your order", "has shipped", "is delayed", "see details"]
+
+
+def make_traffic(count, rng):
+    """Build messages where most content repeats."""
+    messages = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            messages.append(rng.choice(PHRASES))
+        else:
+            words = " ".join(rng.choice(PHRASES) for _ in range(rng.randint(1, 4)))
+            messages.append(rng.choice(HEADERS) + words)
+    return messages
+
+
+def rate(method, inputs):
+    """Call method on every input, returning calls per second."""
+    start = time.perf_counter()
+    for text in inputs:
+        method(text)
+    return len(inputs) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print throughput with and without the cache."""
+    parser = argparse.ArgumentParser(description="Benchmark memoization")
+    parser.add_argument("--messages", type=int, default=2000, help="Messages")
+    args = parser.parse_args()
+
+    messages = make_traffic(args.messages, random.Random(0))
+
+    print(
+        f"{'key':<6} {'operation':<10} {'uncached/s':>11} {'cached/s':>10} "
+        f"{'block hits':>11} {'msg hits':>9}"
+    )
+    for bits in (None, 2048):
+        public_key, private_key = generate_keys(bits)
+        encrypted = [RSACodec(ALPHABET, public_key).encrypt(m) for m in messages]
+
+        for name, key, inputs in (
+            ("encrypt", public_key, messages),
+            ("decrypt", private_key, encrypted),
+        ):
+            cache = MemoCache()
+            uncached = getattr(RSACodec(ALPHABET, key), name)
+            cached = getattr(RSACodec(ALPHABET, key, cache=cache), name)
+            uncached_rate = rate(uncached, inputs)
+            cached_rate = rate(cached, inputs)
+            message_hits = cache.message_hits / len(inputs)
+            print(
+                f"{bits or 'demo'!s:<6} {name:<10} {uncached_rate:>11.0f} "
+                f"{cached_rate:>10.0f} {cache.hit_rate:>11.1%} {message_hits:>9.1%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
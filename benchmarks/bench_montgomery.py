@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Montgomery batch exponentiation benchmark.
+
+Compares one pow() call per block with stepping all blocks of a message
+through the exponent together in Montgomery form, for the public exponent
+and the CRT private key at several key sizes and block counts.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+from rsa_encryption.codec import block_exponentiator
+from rsa_encryption.montgomery import montgomery_pow_blocks
+
+KEY_SIZES = [None, 512, 1024, 2048]
+BLOCK_COUNTS = [16, 256, 2048]
+
+# Skip private-key cases that would take longer than this many pow calls
+MAX_PRIVATE_BLOCKS = {2048: 256}
+
+
+def best_time(func, repeat=3):
+    """Return the fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print per-block timings and speedups."""
+    rng = random.Random(0)
+    header = f"{'key':>6} {'exp':<4} {'blocks':>7} {'pow us':>10} {'batch us':>10}"
+    print(header + f" {'speedup':>8}")
+
+    for bits in KEY_SIZES:
+        public_key, private_key = generate_keys(bits)
+        modulus, public_exp = public_key
+        label = "demo" if bits is None else str(bits)
+
+        for exp_label, exponent in [("e", public_exp), ("crt", private_key)]:
+            exponentiate_block = block_exponentiator(modulus, exponent)
+            for count in BLOCK_COUNTS:
+                if exp_label == "crt" and count > MAX_PRIVATE_BLOCKS.get(bits, count):
+                    continue
+                blocks = [rng.randrange(modulus) for _ in range(count)]
+                pow_seconds = best_time(lambda: list(map(exponentiate_block, blocks)))
+                batch_seconds = best_time(
+                    lambda: montgomery_pow_blocks(blocks, exponent, modulus)
+                )
+                print(
+                    f"{label:>6} {exp_label:<4} {count:>7} "
+                    f"{pow_seconds / count * 1e6:>10.2f} "
+                    f"{batch_seconds / count * 1e6:>10.2f} "
+                    f"{pow_seconds / batch_seconds:>7.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
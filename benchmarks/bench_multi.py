@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Multi-recipient encryption benchmark.
+
+Encrypts one message for many recipients with rsa_encrypt_multi, which
+encodes the message once per block size, and with one rsa_encrypt call per
+recipient, and prints the time per message for each.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.encryption import rsa_encrypt, rsa_encrypt_multi
+from rsa_encryption.key_generation import generate_keys
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+def best_time(function, repeat):
+    """Return the fastest of several runs of function, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print per-message times for both approaches."""
+    parser = argparse.ArgumentParser(description="Benchmark multi-recipient mode")
+    parser.add_argument("--recipients", type=int, default=50, help="Recipients")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes")
+    args = parser.parse_args()
+
+    message = "quarterly results are ready for review " * 200
+
+    print(
+        f"{'key':<6} {'length':>7} {'loop ms':>9} {'multi ms':>9} "
+        f"{'workers ms':>11} {'speedup':>8}"
+    )
+    for bits in (None, 1024):
+        public_keys = [generate_keys(bits)[0] for _ in range(args.recipients)]
+        for length in (40, len(message)):
+            text = message[:length]
+            loop = best_time(
+                lambda: [rsa_encrypt(ALPHABET, n, e, text) for n, e in public_keys],
+                args.repeat,
+            )
+            multi = best_time(
+                lambda: rsa_encrypt_multi(ALPHABET, public_keys, text), args.repeat
+            )
+            parallel = best_time(
+                lambda: rsa_encrypt_multi(ALPHABET, public_keys, text, args.workers),
+                args.repeat,
+            )
+            print(
+                f"{bits or 'demo'!s:<6} {length:>7} {loop * 1000:>9.2f} "
+                f"{multi * 1000:>9.2f} {parallel * 1000:>11.2f} "
+                f"{loop / min(multi, parallel):>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
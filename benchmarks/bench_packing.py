@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Block packing benchmark.
+
+Encrypts and decrypts the same messages with two-digit decimal packing and
+with radix packing, for the basic and numeric alphabets (and a 300-character
+alphabet that only radix packing supports), and prints blocks per message
+and messages per second for each.
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.key_generation import generate_keys
+
+ALPHABETS = {
+    "basic": "abcdefghijklmnopqrstuvwxyz ",
+    "numeric": "0123456789 ",
+    "cjk300": "".join(chr(0x4E00 + i) for i in range(300)),
+}
+
+
+def round_trip_rate(alphabet, public_key, private_key, packing, messages):
+    """Encrypt and decrypt every message, returning messages per second."""
+    encryptor = RSACodec(alphabet, public_key, packing=packing)
+    decryptor = RSACodec(alphabet, private_key, packing=packing)
+    start = time.perf_counter()
+    for message in messages:
+        decryptor.decrypt(encryptor.encrypt(message))
+    return len(messages) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print block counts and throughput."""
+    parser = argparse.ArgumentParser(description="Benchmark block packing")
+    parser.add_argument("--messages", type=int, default=50, help="Messages per run")
+    parser.add_argument("--length", type=int, default=1000, help="Characters each")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    print(
+        f"{'key':<6} {'alphabet':<9} {'blocks dec':>10} {'blocks rad':>10} "
+        f"{'dec msg/s':>10} {'rad msg/s':>10} {'speedup':>8}"
+    )
+    for bits in (None, 1024, 2048):
+        public_key, private_key = generate_keys(bits)
+        for name, alphabet in ALPHABETS.items():
+            messages = [
+                "".join(rng.choice(alphabet) for _ in range(args.length))
+                for _ in range(args.messages)
+            ]
+            radix_blocks = len(
+                RSACodec(alphabet, public_key, packing="radix").encrypt_blocks(
+                    messages[0]
+                )
+            )
+            radix_rate = round_trip_rate(
+                alphabet, public_key, private_key, "radix", messages
+            )
+
+            if len(alphabet) > 100:
+                # Two decimal digits cannot address this alphabet
+                print(
+                    f"{bits or 'demo'!s:<6} {name:<9} {'-':>10} {radix_blocks:>10} "
+                    f"{'-':>10} {radix_rate:>10.0f} {'-':>8}"
+                )
+                continue
+
+            decimal_blocks = len(
+                RSACodec(alphabet, public_key).encrypt_blocks(messages[0])
+            )
+            decimal_rate = round_trip_rate(
+                alphabet, public_key, private_key, "decimal", messages
+            )
+            print(
+                f"{bits or 'demo'!s:<6} {name:<9} {decimal_blocks:>10} "
+                f"{radix_blocks:>10} {decimal_rate:>10.0f} {radix_rate:>10.0f} "
+                f"{radix_rate / decimal_rate:>7.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
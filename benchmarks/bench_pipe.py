@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Pipe mode benchmark.
+
+Compares encrypting many records with one `main.py encrypt` process per
+record against piping them all through one `main.py serve-stdio` process.
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+sys.path.insert(0, ROOT)
+
+from rsa_encryption.key_generation import generate_keys, keys_to_dict
+
+
+def record(index):
+    """Return a short record in the basic alphabet."""
+    return "record " + "".join(chr(97 + int(digit)) for digit in str(index))
+
+
+def main():
+    """Run the benchmark and print records per second for both modes."""
+    parser = argparse.ArgumentParser(description="Benchmark serve-stdio")
+    parser.add_argument("--records", type=int, default=100000, help="Piped records")
+    parser.add_argument(
+        "--spawned", type=int, default=50, help="Records run one process each"
+    )
+    parser.add_argument("--bits", type=int, default=1024, help="Key size in bits")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        key_file = os.path.join(temp_dir, "keys.json")
+        with open(key_file, "w") as f:
+            json.dump(keys_to_dict(*generate_keys(args.bits)), f)
+
+        start = time.perf_counter()
+        for i in range(args.spawned):
+            subprocess.run(
+                [sys.executable, MAIN, "encrypt", "-k", key_file, "-m", record(i)],
+                capture_output=True,
+                check=True,
+            )
+        spawned_rate = args.spawned / (time.perf_counter() - start)
+
+        requests = "".join(
+            json.dumps({"id": i, "op": "encrypt", "message": record(i)}) + "\n"
+            for i in range(args.records)
+        ).encode("utf-8")
+        start = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, MAIN, "serve-stdio", "-k", key_file],
+            input=requests,
+            capture_output=True,
+            check=True,
+        )
+        piped_rate = args.records / (time.perf_counter() - start)
+        assert result.stdout.count(b"\n") == args.records
+
+    print(f"{'mode':<22} {'records/s':>10}")
+    print(f"{'process per record':<22} {spawned_rate:>10.1f}")
+    print(f"{'serve-stdio':<22} {piped_rate:>10.1f}")
+    print(f"speedup: {piped_rate / spawned_rate:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Signature verification benchmark.
+
+Verifies a batch of valid signatures one at a time, with the randomized
+small-exponent batch test (verify_batch), and with verify_many, which picks
+whichever is cheaper, and prints signatures verified per second on one core.
+Keys with the default public exponent 65537 are compared with keys whose
+public exponent is as wide as the modulus.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import PrivateKey, gcd, generate_keys
+from rsa_encryption.signing import sign_many, verify, verify_batch, verify_many
+
+
+def wide_exponent_keys(private_key):
+    """Re-key the primes of private_key with a modulus-sized public exponent."""
+    totient = (private_key.p - 1) * (private_key.q - 1)
+    public_exp = totient // 3 | 1
+    while gcd(public_exp, totient) != 1:
+        public_exp += 2
+    private_exp = pow(public_exp, -1, totient)
+    return (
+        (private_key.n, public_exp),
+        PrivateKey.from_primes(private_key.p, private_key.q, private_exp),
+    )
+
+
+def rate(function, count):
+    """Call function once, returning count per second."""
+    start = time.perf_counter()
+    function()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    """Run the benchmark and print verification throughput."""
+    parser = argparse.ArgumentParser(description="Benchmark batch verification")
+    parser.add_argument("--signatures", type=int, default=1000, help="Batch size")
+    args = parser.parse_args()
+
+    messages = [f"record {i} of the audit log".encode() for i in range(args.signatures)]
+
+    print(
+        f"{'bits':<5} {'exponent':<9} {'single/s':>9} {'batch/s':>9} "
+        f"{'many/s':>9} {'speedup':>8}"
+    )
+    for bits in (1024, 2048):
+        public_key, private_key = generate_keys(bits)
+        for name, (public, private) in (
+            ("65537", (public_key, private_key)),
+            ("wide", wide_exponent_keys(private_key)),
+        ):
+            signatures = sign_many(private, messages)
+            count = len(messages)
+            single = rate(
+                lambda: [verify(public, m, s) for m, s in zip(messages, signatures)],
+                count,
+            )
+            batch = rate(lambda: verify_batch(public, messages, signatures), count)
+            many = rate(lambda: verify_many(public, messages, signatures), count)
+            print(
+                f"{bits:<5} {name:<9} {single:>9.0f} {batch:>9.0f} "
+                f"{many:>9.0f} {many / single:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+CLI startup benchmark.
+
+Runs one-shot main.py commands in fresh interpreters and exits with a
+non-zero status if the time any of them adds on top of bare interpreter
+startup exceeds the budget. With --importtime, also lists the slowest
+imports of each command as reported by ``python -X importtime``.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MAIN = os.path.join(ROOT, "main.py")
+
+# Milliseconds a command may add to bare interpreter startup
+STARTUP_BUDGET_MS = 75
+STARTUP_RUNS = 10
+
+COMMANDS = {
+    "help": ["--help"],
+    "alphabet-info": ["alphabet-info"],
+    "encrypt": ["encrypt", "--n", "1091218173", "--e", "65537", "-m", "hello"],
+    "decrypt": ["decrypt", "--n", "1091218173", "--d", "1", "-m", "0000000000"],
+}
+
+
+def best_time(command, runs=STARTUP_RUNS):
+    """Return the fastest wall time of a command over several runs, in ms."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, capture_output=True, cwd=ROOT)
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def slowest_imports(arguments, count=8):
+    """Return the top-level imports with the largest cumulative time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", MAIN, *arguments],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented; keep only the command's own imports
+        if name.startswith("   "):
+            continue
+        imports.append((int(cumulative), name.strip()))
+    return sorted(imports, reverse=True)[:count]
+
+
+def main():
+    """Run the benchmark and check each command against the budget."""
+    parser = argparse.ArgumentParser(description="Benchmark CLI startup time")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=STARTUP_BUDGET_MS,
+        help=f"Allowed ms over bare startup (default: {STARTUP_BUDGET_MS})",
+    )
+    parser.add_argument(
+        "--importtime",
+        action="store_true",
+        help="List the slowest imports of each command",
+    )
+    args = parser.parse_args()
+
+    bare = best_time([sys.executable, "-c", "pass"])
+    print(f"bare interpreter: {bare:.1f} ms")
+
+    over_budget = False
+    print(f"{'command':<14} {'total ms':>9} {'added ms':>9} {'budget ms':>10}")
+    for name, arguments in COMMANDS.items():
+        total = best_time([sys.executable, MAIN, *arguments])
+        added = total - bare
+        status = "" if added <= args.budget else "  OVER BUDGET"
+        over_budget = over_budget or added > args.budget
+        print(f"{name:<14} {total:>9.1f} {added:>9.1f} {args.budget:>10.1f}{status}")
+
+        if args.importtime:
+            for cumulative, module in slowest_imports(arguments):
+                print(f"    {cumulative / 1000:>7.1f} ms  {module}")
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == "__main__":
+    main()
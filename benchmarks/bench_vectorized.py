@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Vectorized exponentiation benchmark.
+
+Compares one Python pow() per block against one NumPy square-and-multiply
+pass over all blocks, for the small demo keys, by number of blocks, and
+reports end-to-end bulk encryption throughput with each path.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import vectorized
+from rsa_encryption.batch import encrypt_many
+from rsa_encryption.key_generation import generate_keys
+
+BLOCK_COUNTS = [16, 32, 64, 256, 1024, 4096, 65536]
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+BULK_MESSAGES = 10000
+
+
+def best_time(func, repeat=5):
+    """Return the fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Run the benchmark and print timings and speedups."""
+    if vectorized.load_numpy() is None:
+        print("NumPy is not installed; nothing to compare")
+        return
+
+    rng = random.Random(0)
+    public_key, private_key = generate_keys()
+    modulus, public_exp = public_key
+
+    print(f"{'blocks':>7} {'key':>8} {'pow us':>10} {'numpy us':>10} {'speedup':>8}")
+    for count in BLOCK_COUNTS:
+        blocks = [rng.randrange(modulus) for _ in range(count)]
+        for name, exponent, per_block in (
+            ("public", public_exp, lambda b: pow(b, public_exp, modulus)),
+            ("private", private_key, private_key.decrypt_block),
+        ):
+            pow_seconds = best_time(lambda: list(map(per_block, blocks)))
+            numpy_seconds = best_time(
+                lambda: vectorized.numpy_pow_blocks(blocks, exponent, modulus)
+            )
+            print(
+                f"{count:>7} {name:>8} {pow_seconds * 1e6:>10.1f} "
+                f"{numpy_seconds * 1e6:>10.1f} {pow_seconds / numpy_seconds:>7.2f}x"
+            )
+
+    messages = [f"record {i % 997} of the bulk feed" for i in range(BULK_MESSAGES)]
+    messages = ["".join(c for c in m if c in ALPHABET) for m in messages]
+    numpy_seconds = best_time(
+        lambda: encrypt_many(ALPHABET, modulus, public_exp, messages, 1), repeat=3
+    )
+    threshold = vectorized.VECTORIZED_BLOCK_THRESHOLD
+    vectorized.VECTORIZED_BLOCK_THRESHOLD = None
+    try:
+        pow_seconds = best_time(
+            lambda: encrypt_many(ALPHABET, modulus, public_exp, messages, 1), repeat=3
+        )
+    finally:
+        vectorized.VECTORIZED_BLOCK_THRESHOLD = threshold
+
+    print(
+        f"\nencrypt_many, {BULK_MESSAGES} messages: "
+        f"{BULK_MESSAGES / pow_seconds:,.0f}/s with pow, "
+        f"{BULK_MESSAGES / numpy_seconds:,.0f}/s with NumPy"
+    )
+
+
+if __name__ == "__main__":
+    main()
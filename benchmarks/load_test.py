@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Load test for the asyncio RSA service.
+
+Opens several concurrent client connections, each sending encrypt requests
+one after another, and reports p50/p99 latency and total throughput. Starts
+an in-process server unless --port or --unix points at a running one.
+
+Usage:
+    python benchmarks/load_test.py --clients 64 --requests 200
+    python benchmarks/load_test.py --port 8765 --bits 2048
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import generate_keys
+from rsa_encryption.key_generation import keys_to_dict
+from rsa_encryption.server import RSAServer, encode_frame, read_frame
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+MESSAGE = "the quick brown fox jumps over the lazy dog"
+
+
+async def run_client(connect, request, count, latencies, errors):
+    """Send count requests on one connection, recording each latency."""
+    reader, writer = await connect()
+    try:
+        for i in range(count):
+            start = time.perf_counter()
+            writer.write(encode_frame({**request, "id": i}))
+            await writer.drain()
+            response = await read_frame(reader)
+            latencies.append(time.perf_counter() - start)
+            if not response["ok"]:
+                errors.append(response["error"])
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_load_test(args):
+    """Run the load test and print the latency report."""
+    public_key, private_key = generate_keys(args.bits)
+    request = {
+        "op": "encrypt",
+        "alphabet": ALPHABET,
+        "key": keys_to_dict(public_key, private_key)["public_key"],
+        "message": MESSAGE,
+    }
+
+    server = None
+    if args.unix:
+        connect = lambda: asyncio.open_unix_connection(args.unix)  # noqa: E731
+    elif args.port:
+        connect = lambda: asyncio.open_connection(args.host, args.port)  # noqa: E731
+    else:
+        server = RSAServer(workers=args.workers)
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+        connect = lambda: asyncio.open_connection("127.0.0.1", port)  # noqa: E731
+
+    latencies, errors = [], []
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(
+            *[
+                run_client(connect, request, args.requests, latencies, errors)
+                for _ in range(args.clients)
+            ]
+        )
+    finally:
+        if server is not None:
+            await server.close()
+    elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"clients:    {args.clients}")
+    print(f"requests:   {len(latencies)} ({len(errors)} errors)")
+    print(f"throughput: {len(latencies) / elapsed:.0f} requests/s")
+    print(f"p50:        {percentiles[49] * 1e3:.2f} ms")
+    print(f"p99:        {percentiles[98] * 1e3:.2f} ms")
+    if errors:
+        print(f"first error: {errors[0]}")
+
+
+def main():
+    """Parse arguments and run the load test."""
+    parser = argparse.ArgumentParser(description="Load test the RSA service")
+    parser.add_argument("--clients", "-c", type=int, default=32)
+    parser.add_argument("--requests", "-r", type=int, default=100)
+    parser.add_argument("--bits", "-b", type=int, help="Key size (default: demo key)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="Port of a running server")
+    parser.add_argument("--unix", help="Unix socket of a running server")
+    parser.add_argument(
+        "--workers", "-w", type=int, help="Workers for the in-process server"
+    )
+    asyncio.run(run_load_test(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
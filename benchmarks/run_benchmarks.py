@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite with regression gating.
+
+Times the hot paths (key generation, encryption, decryption, chunking and
+character mapping) across message sizes, alphabets and key sizes, writes the
+results as JSON and compares them against a stored baseline. Exits with a
+non-zero status if any benchmark is slower than its baseline by more than
+the allowed tolerance, and by more than a small absolute noise floor.
+
+Encryption and decryption are timed with the fixed key pairs in keys.json,
+so runs compare the same work.
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # compare to baseline
+    python benchmarks/run_benchmarks.py --output run.json   # also save results
+    python benchmarks/run_benchmarks.py --save-baseline     # record new baseline
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import timeit
+from functools import partial
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import get_alphabet
+from rsa_encryption import generate_keys, rsa_decrypt, rsa_encrypt
+from rsa_encryption.key_generation import keys_from_dict, keys_to_dict
+from rsa_encryption.utils import create_char_mappings, split_into_chunks
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(BENCHMARK_DIR, "baseline.json")
+
+# Fixed key pairs for the encrypt and decrypt benchmarks. Their timings
+# depend on the key (the size of d above all), so fresh random keys would
+# make runs differ by far more than the tolerance
+KEYS_PATH = os.path.join(BENCHMARK_DIR, "keys.json")
+
+ALPHABET_TYPES = ["basic", "extended", "full", "numeric"]
+MESSAGE_SIZES = [100, 10_000]
+KEY_SIZES = [None, 1024]
+
+# Allowed slowdown over the baseline before a benchmark counts as a regression
+DEFAULT_TOLERANCE = 0.25
+
+# Slowdown always allowed on top of the tolerance; timings of a few
+# microseconds vary by more than DEFAULT_TOLERANCE from run to run
+NOISE_FLOOR_SECONDS = 20e-6
+
+# Key generation time depends on how far the next prime is, so it is noisy
+KEYGEN_TOLERANCE = 1.0
+KEYGEN_RUNS = 10
+
+# Number of timing samples per benchmark; the fastest one is reported
+TIMING_SAMPLES = 10
+
+# Target duration of one timing sample
+SAMPLE_SECONDS = 0.025
+
+
+def time_calls(funcs: dict) -> dict:
+    """
+    Time calls with timeit, taking the best of several samples of each.
+
+    The samples are taken in rounds over all the calls, so that a slow
+    stretch on a busy machine costs each call one sample rather than all of
+    its samples.
+
+    Args:
+        funcs (dict): Name -> zero-argument function to time
+
+    Returns:
+        dict: Name -> seconds per call
+    """
+    timers = {}
+    for name, func in funcs.items():
+        timer = timeit.Timer(func)
+        calibration = timer.timeit(number=1)
+        timers[name] = (timer, max(1, int(SAMPLE_SECONDS / max(calibration, 1e-9))))
+
+    best = dict.fromkeys(funcs, float("inf"))
+    for _ in range(TIMING_SAMPLES):
+        for name, (timer, number) in timers.items():
+            best[name] = min(best[name], timer.timeit(number=number) / number)
+    return best
+
+
+def time_median(func, runs: int) -> float:
+    """
+    Time a call with a variable running time by its median over several runs.
+
+    Args:
+        func (Callable): Zero-argument function to time
+        runs (int): Number of runs
+
+    Returns:
+        float: Median seconds per call
+    """
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def key_label(bits) -> str:
+    """Label a key size for benchmark names."""
+    return "demo" if bits is None else f"{bits}bit"
+
+
+def load_benchmark_keys(key_sizes: list) -> dict:
+    """
+    Load the fixed key pairs, generating and saving any that are missing.
+
+    Args:
+        key_sizes (list): Key sizes as in KEY_SIZES
+
+    Returns:
+        dict: Key size -> ((n, e), private_key)
+    """
+    keys_data = {}
+    if os.path.exists(KEYS_PATH):
+        with open(KEYS_PATH, "r") as f:
+            keys_data = json.load(f)
+
+    missing = [bits for bits in key_sizes if key_label(bits) not in keys_data]
+    for bits in missing:
+        keys_data[key_label(bits)] = keys_to_dict(*generate_keys(bits))
+    if missing:
+        with open(KEYS_PATH, "w") as f:
+            json.dump(keys_data, f, indent=2)
+
+    return {bits: keys_from_dict(keys_data[key_label(bits)]) for bits in key_sizes}
+
+
+def run_benchmarks(quick: bool = False) -> dict:
+    """
+    Run every benchmark.
+
+    Args:
+        quick (bool): Only use the smallest message size and key size
+
+    Returns:
+        dict: Benchmark name -> {"seconds": float, "tolerance": float}
+    """
+    rng = random.Random(0)
+    message_sizes = MESSAGE_SIZES[:1] if quick else MESSAGE_SIZES
+    key_sizes = KEY_SIZES[:1] if quick else KEY_SIZES
+    results = {}
+    timed = {}
+
+    def record(name, seconds, tolerance=DEFAULT_TOLERANCE):
+        results[name] = {"seconds": seconds, "tolerance": tolerance}
+        print(f"  {name:<48} {seconds * 1e6:>14.2f} us")
+
+    for bits in key_sizes:
+        record(
+            f"generate_keys/{key_label(bits)}",
+            time_median(lambda: generate_keys(bits), KEYGEN_RUNS),
+            KEYGEN_TOLERANCE,
+        )
+
+    for alphabet_type in ALPHABET_TYPES:
+        alphabet = get_alphabet(alphabet_type)
+        timed[f"create_char_mappings/{alphabet_type}"] = partial(
+            create_char_mappings, alphabet
+        )
+
+    for size in message_sizes:
+        text = "".join(rng.choices("0123456789", k=size * 2))
+        timed[f"split_into_chunks/{size}"] = partial(split_into_chunks, text, 8)
+
+    key_pairs = load_benchmark_keys(key_sizes)
+    for bits in key_sizes:
+        public_key, private_key = key_pairs[bits]
+        modulus, public_exp = public_key
+        for alphabet_type in ALPHABET_TYPES:
+            alphabet = get_alphabet(alphabet_type)
+            for size in message_sizes:
+                message = "".join(rng.choices(alphabet, k=size))
+                encrypted = rsa_encrypt(alphabet, modulus, public_exp, message)
+                suffix = f"{key_label(bits)}/{alphabet_type}/{size}"
+                timed[f"rsa_encrypt/{suffix}"] = partial(
+                    rsa_encrypt, alphabet, modulus, public_exp, message
+                )
+                timed[f"rsa_decrypt/{suffix}"] = partial(
+                    rsa_decrypt, alphabet, modulus, private_key, encrypted
+                )
+
+    for name, seconds in time_calls(timed).items():
+        record(name, seconds)
+    return results
+
+
+def compare_to_baseline(
+    results: dict, baseline: dict, tolerance: float = None
+) -> list:
+    """
+    Find benchmarks that regressed against the baseline.
+
+    A benchmark regresses when it is slower than its baseline by more than
+    the tolerance and by more than NOISE_FLOOR_SECONDS.
+
+    Args:
+        results (dict): Current results from run_benchmarks
+        baseline (dict): Baseline results in the same layout
+        tolerance (float, optional): Allowed slowdown for every benchmark,
+            overriding the per-benchmark tolerance
+
+    Returns:
+        list: (name, baseline seconds, current seconds) for each regression
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        baseline_seconds = baseline[name]["seconds"]
+        allowed = result["tolerance"] if tolerance is None else tolerance
+        slowdown = result["seconds"] - baseline_seconds
+        if slowdown > max(baseline_seconds * allowed, NOISE_FLOOR_SECONDS):
+            regressions.append((name, baseline_seconds, result["seconds"]))
+    return regressions
+
+
+def main():
+    """Run the suite, save results and gate on the baseline."""
+    parser = argparse.ArgumentParser(description="Run the RSA benchmark suite")
+    parser.add_argument("--output", "-o", help="Write results to this JSON file")
+    parser.add_argument(
+        "--baseline",
+        default=BASELINE_PATH,
+        help="Baseline JSON file to compare against",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        help="Allowed slowdown for every benchmark, e.g. 0.5 for 50%% "
+        f"(default: {DEFAULT_TOLERANCE}, {KEYGEN_TOLERANCE} for key generation)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Only run the smallest sizes"
+    )
+    args = parser.parse_args()
+
+    print("Running benchmarks:")
+    results = run_benchmarks(args.quick)
+    report = {
+        "metadata": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline first")
+        return
+
+    with open(args.baseline, "r") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare_to_baseline(results, baseline, args.tolerance)
+    for name, baseline_seconds, seconds in regressions:
+        print(
+            f"REGRESSION {name}: {baseline_seconds * 1e6:.2f} us -> "
+            f"{seconds * 1e6:.2f} us ({seconds / baseline_seconds:.2f}x)"
+        )
+
+    if regressions:
+        sys.exit(1)
+    print("No regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,13 @@ message encryption, and message decryption with configurable alphabet sizes.
 """
 
 import argparse
+import os
 import sys
-import json
-from rsa_encryption import generate_keys, rsa_encrypt, rsa_decrypt
+
+# Subcommands import what they need when they run, so that a one-shot call
+# only pays for the modules it uses. Keep module-level imports cheap.
+from rsa_encryption.formats import CIPHERTEXT_FORMATS
+from rsa_encryption.packing import PACKINGS
 
 
 def get_alphabet(alphabet_type):
@@ -36,14 +40,166 @@ def get_alphabet(alphabet_type):
         return alphabet_type
 
 
+def parse_range(text):
+    """
+    Parse a "START:END" range; either side may be left empty.
+
+    Args:
+        text (str): The range, e.g. "100:200", "100:" or ":50"
+
+    Returns:
+        tuple: (start, end), with None for an open end
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    start, separator, end = text.partition(":")
+    if not separator:
+        raise ValueError(f"Error: Range '{text}' must look like START:END")
+    return int(start) if start else 0, int(end) if end else None
+
+
+def load_stored_keys(args):
+    """
+    Look up the key pair named by --key-id in the --key-store database.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+
+    Returns:
+        tuple: ((n, e), private_key); private_key may be None
+    """
+    from rsa_encryption.key_store import KeyStore
+
+    if not os.path.exists(args.key_store):
+        print(f"Error: Key store {args.key_store} does not exist")
+        sys.exit(1)
+
+    with KeyStore(args.key_store) as store:
+        try:
+            return store.get(args.key_id)
+        except KeyError:
+            print(f"Error: No key with id '{args.key_id}' in {args.key_store}")
+            sys.exit(1)
+
+
+def load_key_pair(args):
+    """
+    Load the keys named by --key-id or --key-file, if either is given.
+
+    Args:
+        args (argparse.Namespace): Parsed arguments
+
+    Returns:
+        tuple: ((n, e), private_key); either may be None
+    """
+    if args.key_id:
+        return load_stored_keys(args)
+    if not args.key_file:
+        return None, None
+
+    import json
+    from rsa_encryption.key_generation import private_key_from_dict
+
+    with open(args.key_file, "r") as f:
+        keys_data = json.load(f)
+    public_key = (keys_data["public_key"]["n"], keys_data["public_key"]["e"])
+    private_key = None
+    if "private_key" in keys_data:
+        private_key = private_key_from_dict(keys_data["private_key"])
+    return public_key, private_key
+
+
+def read_lines(input_path):
+    """
+    Read newline-delimited records from a file, or from stdin.
+
+    Args:
+        input_path (str): File to read, or None for stdin
+
+    Returns:
+        List[bytes]: The lines, without their line endings
+    """
+    if input_path:
+        with open(input_path, "rb") as f:
+            return f.read().splitlines()
+    return sys.stdin.buffer.read().splitlines()
+
+
+def write_stream(chunks, output_path, label):
+    """
+    Write streamed output to a file, or to stdout after a label.
+
+    Args:
+        chunks (Iterable[str]): Output pieces, written as they are produced
+        output_path (str): Output file, or None for stdout
+        label (str): Description of the output, e.g. "Encrypted message"
+    """
+    if output_path:
+        with open(output_path, "w") as f:
+            for chunk in chunks:
+                f.write(chunk)
+        print(f"{label} saved to {output_path}")
+    else:
+        sys.stdout.write(f"{label}: ")
+        try:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+        finally:
+            sys.stdout.write("\n")
+
+
+def run_with_stats(command, args):
+    """
+    Run a command, printing its per-stage timings to stderr if --stats is set.
+
+    Args:
+        command (Callable): The command function
+        args (argparse.Namespace): Parsed arguments
+    """
+    if not args.stats:
+        command(args)
+        return
+
+    from rsa_encryption.instrumentation import record_stages
+
+    with record_stages() as recorder:
+        command(args)
+
+    if not recorder.stages:
+        print("No stages recorded (work ran in worker processes)", file=sys.stderr)
+    elif args.stats == "json":
+        print(recorder.to_json(), file=sys.stderr)
+    elif args.stats == "prometheus":
+        sys.stderr.write(recorder.to_prometheus())
+    else:
+        print(recorder.format_table(), file=sys.stderr)
+
+
 def generate_keys_command(args):
     """Generate RSA key pair and optionally save to files."""
-    public_key, private_key = generate_keys()
+    if args.count > 1:
+        generate_many_keys_command(args)
+        return
 
-    keys_data = {
-        "public_key": {"n": public_key[0], "e": public_key[1]},
-        "private_key": {"n": private_key[0], "d": private_key[1]},
-    }
+    import json
+    from rsa_encryption.key_generation import generate_keys, keys_to_dict
+
+    try:
+        public_key, private_key = generate_keys(args.bits)
+    except ValueError as error:
+        print(f"Key generation error: {error}")
+        sys.exit(1)
+
+    if args.key_store:
+        from rsa_encryption.key_store import KeyStore
+
+        with KeyStore(args.key_store) as store:
+            key_id = store.add((public_key, private_key), args.key_id)
+        print(f"Keys saved to {args.key_store} with id {key_id}")
+        return
+
+    keys_data = keys_to_dict(public_key, private_key)
 
     if args.output:
         # Save keys to file
@@ -59,16 +215,46 @@ def generate_keys_command(args):
         print(json.dumps(keys_data, indent=2))
 
 
+def generate_many_keys_command(args):
+    """Generate several RSA key pairs in parallel for bulk issuance."""
+    import json
+    from rsa_encryption.key_generation import keys_to_dict
+    from rsa_encryption.key_pool import generate_keys_many, save_keys
+
+    try:
+        key_pairs = generate_keys_many(args.count, args.bits, args.workers)
+    except ValueError as error:
+        print(f"Key generation error: {error}")
+        sys.exit(1)
+
+    if args.key_store:
+        from rsa_encryption.key_store import KeyStore
+
+        with KeyStore(args.key_store) as store:
+            key_ids = store.add_many(key_pairs)
+        print(f"{len(key_pairs)} key pairs saved to {args.key_store}:")
+        print("\n".join(key_ids))
+    elif args.output:
+        save_keys(key_pairs, args.output)
+        print(f"{len(key_pairs)} key pairs saved to {args.output}")
+    else:
+        keys_data = [keys_to_dict(*key_pair) for key_pair in key_pairs]
+        print(json.dumps(keys_data, indent=2))
+
+
 def encrypt_command(args):
     """Encrypt a message using RSA encryption."""
     alphabet = get_alphabet(args.alphabet)
 
+    if args.key_file and len(args.key_file) > 1 and not args.key_id:
+        multi_encrypt_command(args, alphabet)
+        return
+
     # Load keys
-    if args.key_file:
-        with open(args.key_file, "r") as f:
-            keys_data = json.load(f)
-        n = keys_data["public_key"]["n"]
-        e = keys_data["public_key"]["e"]
+    if args.key_id:
+        (n, e), _ = load_stored_keys(args)
+    elif args.key_file:
+        n, e = load_public_key_file(args.key_file[0])
     else:
         n = args.n
         e = args.e
@@ -79,11 +265,67 @@ def encrypt_command(args):
         )
         sys.exit(1)
 
+    if args.envelope:
+        envelope_encrypt_command(args, n, e)
+        return
+
+    if args.format == "binary" and not args.output:
+        print("Error: --format binary requires --output")
+        sys.exit(1)
+
+    # Stream file input so large messages are never loaded whole
+    streamable = args.format == "decimal" and args.packing == "decimal"
+    if not args.message and args.input and streamable:
+        from rsa_encryption.streaming import rsa_encrypt_stream
+
+        try:
+            with open(args.input, "r") as f:
+                write_stream(
+                    rsa_encrypt_stream(alphabet, n, e, f, strip_line_ending=True),
+                    args.output,
+                    "Encrypted message",
+                )
+        except ValueError as error:
+            print(f"Encryption error: {error}")
+            sys.exit(1)
+        return
+
     # Get message
-    message = args.message or input("Enter message to encrypt: ")
+    if args.message:
+        message = args.message
+    elif args.input:
+        from rsa_encryption.utils import drop_line_ending
+
+        with open(args.input, "r") as f:
+            message = drop_line_ending(f.read())
+    else:
+        message = input("Enter message to encrypt: ")
 
     try:
-        encrypted = rsa_encrypt(alphabet, n, e, message)
+        if args.format != "decimal":
+            from rsa_encryption.codec import RSACodec
+            from rsa_encryption.formats import pack_ciphertext
+
+            codec = RSACodec(alphabet, (n, e), packing=args.packing)
+            block_values = codec.encrypt_blocks(message)
+            encrypted = pack_ciphertext(block_values, n, args.format)
+        elif args.workers > 1:
+            from rsa_encryption.batch import encrypt_many
+
+            (encrypted,) = encrypt_many(
+                alphabet, n, e, [message], args.workers, args.packing
+            )
+        else:
+            from rsa_encryption.encryption import rsa_encrypt
+
+            encrypted = rsa_encrypt(alphabet, n, e, message, packing=args.packing)
+
+        if isinstance(encrypted, bytes):
+            with open(args.output, "wb") as f:
+                f.write(encrypted)
+            print(f"Encrypted message saved to {args.output}")
+            return
+
         print(f"Encrypted message: {encrypted}")
 
         if args.output:
@@ -96,16 +338,85 @@ def encrypt_command(args):
         sys.exit(1)
 
 
+def load_public_key_file(key_file):
+    """
+    Read the public key from a key file.
+
+    Args:
+        key_file (str): Path of a JSON file written by generate-keys
+
+    Returns:
+        tuple: (n, e)
+    """
+    import json
+
+    with open(key_file, "r") as f:
+        keys_data = json.load(f)
+    return keys_data["public_key"]["n"], keys_data["public_key"]["e"]
+
+
+def multi_encrypt_command(args, alphabet):
+    """Encrypt one message for every --key-file given."""
+    if args.envelope or args.format != "decimal":
+        print("Error: Several --key-file options need the decimal format")
+        sys.exit(1)
+
+    public_keys = [load_public_key_file(key_file) for key_file in args.key_file]
+
+    if args.message:
+        message = args.message
+    elif args.input:
+        from rsa_encryption.utils import drop_line_ending
+
+        with open(args.input, "r") as f:
+            message = drop_line_ending(f.read())
+    else:
+        message = input("Enter message to encrypt: ")
+
+    from rsa_encryption.encryption import rsa_encrypt_multi
+
+    try:
+        encrypted_messages = rsa_encrypt_multi(
+            alphabet, public_keys, message, args.workers, args.packing
+        )
+    except ValueError as error:
+        print(f"Encryption error: {error}")
+        sys.exit(1)
+
+    for key_file, encrypted in zip(args.key_file, encrypted_messages):
+        print(f"{key_file}: {encrypted}")
+
+    if args.output:
+        import json
+
+        with open(args.output, "w") as f:
+            json.dump(dict(zip(args.key_file, encrypted_messages)), f, indent=2)
+        print(f"Encrypted messages saved to {args.output}")
+
+
 def decrypt_command(args):
     """Decrypt a message using RSA decryption."""
     alphabet = get_alphabet(args.alphabet)
 
     # Load keys
-    if args.key_file:
+    private_key = None
+    if args.key_id:
+        _, private_key = load_stored_keys(args)
+    elif args.key_file:
+        import json
+        from rsa_encryption.key_generation import private_key_from_dict
+
         with open(args.key_file, "r") as f:
             keys_data = json.load(f)
-        n = keys_data["private_key"]["n"]
-        d = keys_data["private_key"]["d"]
+        private_key = private_key_from_dict(keys_data["private_key"])
+
+    if private_key is not None:
+        from rsa_encryption.key_generation import PrivateKey
+
+        n, d = private_key
+        # Keep the whole key so the CRT parameters are used when available
+        if isinstance(private_key, PrivateKey):
+            d = private_key
     else:
         n = args.n
         d = args.d
@@ -116,8 +427,60 @@ def decrypt_command(args):
         )
         sys.exit(1)
 
+    if args.envelope:
+        envelope_decrypt_command(args, n, d)
+        return
+
+    # Decrypt only the requested characters, straight from the mapped file
+    if args.chars:
+        if not args.input or args.format == "base64":
+            print("Error: --chars needs a decimal or binary --input file")
+            sys.exit(1)
+        if args.packing != "decimal":
+            print("Error: --chars needs the decimal packing")
+            sys.exit(1)
+
+        from rsa_encryption.codec import make_key
+        from rsa_encryption.random_access import CiphertextReader
+
+        try:
+            start, end = parse_range(args.chars)
+            with CiphertextReader(
+                args.input, alphabet, make_key(n, d), args.format
+            ) as reader:
+                decrypted = reader.read_chars(start, end)
+        except ValueError as error:
+            print(f"Decryption error: {error}")
+            sys.exit(1)
+        print(f"Decrypted message: {decrypted}")
+        return
+
+    if args.format == "binary" and not args.input:
+        print("Error: --format binary requires --input")
+        sys.exit(1)
+
+    # Stream file input so large ciphertexts are never loaded whole
+    streamable = args.format == "decimal" and args.packing == "decimal"
+    if not args.message and args.input and streamable:
+        from rsa_encryption.streaming import rsa_decrypt_stream
+
+        try:
+            with open(args.input, "r") as f:
+                write_stream(
+                    rsa_decrypt_stream(alphabet, n, d, f),
+                    args.output,
+                    "Decrypted message",
+                )
+        except ValueError as error:
+            print(f"Decryption error: {error}")
+            sys.exit(1)
+        return
+
     # Get encrypted message
-    if args.message:
+    if args.format == "binary":
+        with open(args.input, "rb") as f:
+            encrypted_message = f.read()
+    elif args.message:
         encrypted_message = args.message
     elif args.input:
         with open(args.input, "r") as f:
@@ -126,7 +489,25 @@ def decrypt_command(args):
         encrypted_message = input("Enter encrypted message: ")
 
     try:
-        decrypted = rsa_decrypt(alphabet, n, d, encrypted_message)
+        if args.format != "decimal":
+            from rsa_encryption.codec import RSACodec, make_key
+            from rsa_encryption.formats import unpack_ciphertext
+
+            block_values = unpack_ciphertext(encrypted_message, n, args.format)
+            codec = RSACodec(alphabet, make_key(n, d), packing=args.packing)
+            decrypted = codec.decrypt_blocks(block_values)
+        elif args.workers > 1:
+            from rsa_encryption.batch import decrypt_many
+
+            (decrypted,) = decrypt_many(
+                alphabet, n, d, [encrypted_message], args.workers, args.packing
+            )
+        else:
+            from rsa_encryption.decryption import rsa_decrypt
+
+            decrypted = rsa_decrypt(
+                alphabet, n, d, encrypted_message, packing=args.packing
+            )
         print(f"Decrypted message: {decrypted}")
 
         if args.output:
@@ -139,6 +520,138 @@ def decrypt_command(args):
         sys.exit(1)
 
 
+def envelope_encrypt_command(args, n, e):
+    """Encrypt bytes in envelope mode, reading and writing binary files."""
+    from rsa_encryption.envelope import encrypt_envelope
+
+    if not args.output:
+        print("Error: --envelope requires --output")
+        sys.exit(1)
+
+    if args.message:
+        data = args.message.encode("utf-8")
+    elif args.input:
+        with open(args.input, "rb") as f:
+            data = f.read()
+    else:
+        data = input("Enter message to encrypt: ").encode("utf-8")
+
+    try:
+        envelope = encrypt_envelope(n, e, data)
+    except ValueError as error:
+        print(f"Encryption error: {error}")
+        sys.exit(1)
+
+    with open(args.output, "wb") as f:
+        f.write(envelope)
+    print(f"Encrypted {len(data)} bytes saved to {args.output}")
+
+
+def envelope_decrypt_command(args, n, d):
+    """Decrypt an envelope file, writing the raw bytes or printing text."""
+    from rsa_encryption.envelope import decrypt_envelope
+
+    if not args.input:
+        print("Error: --envelope requires --input")
+        sys.exit(1)
+
+    with open(args.input, "rb") as f:
+        envelope = f.read()
+
+    try:
+        data = decrypt_envelope(n, d, envelope)
+    except ValueError as error:
+        print(f"Decryption error: {error}")
+        sys.exit(1)
+
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(data)
+        print(f"Decrypted {len(data)} bytes saved to {args.output}")
+    else:
+        print(f"Decrypted message: {data.decode('utf-8', errors='replace')}")
+
+
+def serve_stdio_command(args):
+    """Answer newline-delimited JSON requests from stdin until end of input."""
+    from rsa_encryption.pipe import PipeHandler
+
+    # Load the default keys once for every request that does not carry a key
+    public_key, private_key = load_key_pair(args)
+
+    try:
+        handler = PipeHandler(
+            get_alphabet(args.alphabet), public_key, private_key, args.flush_lines
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        handler.serve(sys.stdin.buffer, sys.stdout)
+    except KeyboardInterrupt:
+        pass
+
+
+def sign_command(args):
+    """Sign every line of the input, writing one signature per line."""
+    from rsa_encryption.signing import sign_many
+
+    _, private_key = load_key_pair(args)
+    if private_key is None:
+        print("Error: A private key must be provided via --key-file or --key-id")
+        sys.exit(1)
+
+    signatures = sign_many(private_key, read_lines(args.input))
+    output = "".join(f"{signature}\n" for signature in signatures)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+        print(f"{len(signatures)} signatures saved to {args.output}")
+    else:
+        sys.stdout.write(output)
+
+
+def verify_command(args):
+    """Check one signature per line of the input."""
+    from rsa_encryption.signing import verify, verify_many
+
+    public_key, _ = load_key_pair(args)
+    if public_key is None:
+        print("Error: A public key must be provided via --key-file or --key-id")
+        sys.exit(1)
+
+    messages = read_lines(args.input)
+    with open(args.signatures, "r") as f:
+        signature_lines = f.read().split()
+    if len(signature_lines) != len(messages):
+        print(f"Error: {len(messages)} messages but {len(signature_lines)} signatures")
+        sys.exit(1)
+
+    try:
+        signatures = [int(line) for line in signature_lines]
+    except ValueError:
+        print("Error: Signatures must be decimal numbers, one per line")
+        sys.exit(1)
+
+    if args.batch:
+        results = verify_many(public_key, messages, signatures)
+    else:
+        results = [
+            verify(public_key, message, signature)
+            for message, signature in zip(messages, signatures)
+        ]
+
+    for line_number, valid in enumerate(results, 1):
+        if not valid:
+            print(f"Line {line_number}: invalid signature")
+    valid_count = sum(results)
+    print(f"{valid_count} of {len(results)} signatures valid")
+    if valid_count != len(results):
+        sys.exit(1)
+
+
 def alphabet_info_command(args):
     """Show information about available alphabets."""
     alphabets = {
@@ -167,16 +680,54 @@ Examples:
   
   # Generate keys and print to console
   python main.py generate-keys
+
+  # Generate a 2048-bit key pair
+  python main.py generate-keys --bits 2048 --output keys.json
+
+  # Generate 100 key pairs on 8 worker processes
+  python main.py generate-keys --bits 2048 --count 100 --workers 8 --output pool.json
   
   # Encrypt with key file
   python main.py encrypt --key-file keys.json --message "hello world" --alphabet basic
   
+  # Encrypt one message for several recipients
+  python main.py encrypt -k alice.json -k bob.json -m "hello" -o hello.json
+  
+  # Keep many keys in one key store and use them by id
+  python main.py generate-keys --bits 2048 --key-store keys.db --key-id tenant-42
+  python main.py encrypt --key-store keys.db --key-id tenant-42 --message "hello"
+
   # Encrypt with explicit keys
   python main.py encrypt --n 1091218173 --e 65537 --message "hello" --alphabet basic
   
   # Decrypt with key file
   python main.py decrypt --key-file keys.json --message "123456789" --alphabet basic
+
+  # Encrypt to compact binary ciphertext and back
+  python main.py encrypt --key-file keys.json -m "hello" --format binary -o msg.bin
+  python main.py decrypt --key-file keys.json --input msg.bin --format binary
+
+  # Show where the time goes, per stage
+  python main.py encrypt --key-file keys.json --input large.txt -o large.enc --stats
+
+  # Decrypt characters 1000 to 1080 of a large file without reading it all
+  python main.py decrypt --key-file keys.json --input big.enc --chars 1000:1080
+
+  # Encrypt a large file in envelope mode and back
+  python main.py encrypt --key-file keys.json --input data.tar --envelope -o data.env
+  python main.py decrypt --key-file keys.json --input data.env --envelope -o data.tar
   
+  # Answer newline-delimited JSON requests until end of input
+  python main.py serve-stdio --key-file keys.json < requests.ndjson > results.ndjson
+
+  # Pack characters densely, for fewer blocks per message
+  python main.py encrypt --key-file keys.json -m "hello" --packing radix
+  python main.py decrypt --key-file keys.json -m "..." --packing radix
+
+  # Sign one message per line, then check the signatures in batches
+  python main.py sign --key-file keys.json --input records.txt -o records.sig
+  python main.py verify --key-file keys.json -i records.txt -s records.sig --batch
+
   # Show alphabet information
   python main.py alphabet-info
         """,
@@ -187,17 +738,57 @@ Examples:
     # Generate keys command
     gen_parser = subparsers.add_parser("generate-keys", help="Generate RSA key pair")
     gen_parser.add_argument("--output", "-o", help="Output file for keys (JSON format)")
+    gen_parser.add_argument(
+        "--bits",
+        "-b",
+        type=int,
+        help="Modulus size in bits, e.g. 1024, 2048 or 4096 (default: small demo key)",
+    )
+    gen_parser.add_argument(
+        "--count",
+        "-n",
+        type=int,
+        default=1,
+        help="Number of key pairs to generate (default: 1)",
+    )
+    gen_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes for bulk generation (default: 1)",
+    )
+    gen_parser.add_argument(
+        "--key-store", help="Add the keys to this key store database instead"
+    )
+    gen_parser.add_argument(
+        "--key-id", help="Id for the key in the key store (default: from modulus)"
+    )
 
     # Encrypt command
     encrypt_parser = subparsers.add_parser("encrypt", help="Encrypt a message")
     encrypt_parser.add_argument("--message", "-m", help="Message to encrypt")
+    encrypt_parser.add_argument(
+        "--input", "-i", help="Input file containing message (streamed)"
+    )
     encrypt_parser.add_argument(
         "--alphabet",
         "-a",
         default="basic",
         help="Alphabet type: basic, extended, full, numeric, or custom string",
     )
-    encrypt_parser.add_argument("--key-file", "-k", help="JSON file containing keys")
+    encrypt_parser.add_argument(
+        "--key-file",
+        "-k",
+        action="append",
+        help="JSON file containing keys; repeat to encrypt for several recipients",
+    )
+    encrypt_parser.add_argument("--key-id", help="Id of the key in the key store")
+    encrypt_parser.add_argument(
+        "--key-store",
+        default="keys.db",
+        help="Key store database for --key-id (default: keys.db)",
+    )
     encrypt_parser.add_argument(
         "--n", type=int, help="Public key modulus (if not using key file)"
     )
@@ -207,12 +798,44 @@ Examples:
     encrypt_parser.add_argument(
         "--output", "-o", help="Output file for encrypted message"
     )
+    encrypt_parser.add_argument(
+        "--format",
+        "-f",
+        choices=CIPHERTEXT_FORMATS,
+        default="decimal",
+        help="Ciphertext format (default: decimal); binary needs a file",
+    )
+    encrypt_parser.add_argument(
+        "--packing",
+        choices=PACKINGS,
+        default="decimal",
+        help="Block packing (default: decimal); radix fits more characters per block",
+    )
+    encrypt_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes for large messages (default: 1)",
+    )
+    encrypt_parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="text",
+        choices=("text", "json", "prometheus"),
+        help="Print time per stage to stderr (default format: text)",
+    )
+    encrypt_parser.add_argument(
+        "--envelope",
+        action="store_true",
+        help="Encrypt any bytes with an RSA-wrapped session key (needs --output)",
+    )
 
     # Decrypt command
     decrypt_parser = subparsers.add_parser("decrypt", help="Decrypt a message")
     decrypt_parser.add_argument("--message", "-m", help="Encrypted message to decrypt")
     decrypt_parser.add_argument(
-        "--input", "-i", help="Input file containing encrypted message"
+        "--input", "-i", help="Input file containing encrypted message (streamed)"
     )
     decrypt_parser.add_argument(
         "--alphabet",
@@ -221,6 +844,12 @@ Examples:
         help="Alphabet type: basic, extended, full, numeric, or custom string",
     )
     decrypt_parser.add_argument("--key-file", "-k", help="JSON file containing keys")
+    decrypt_parser.add_argument("--key-id", help="Id of the key in the key store")
+    decrypt_parser.add_argument(
+        "--key-store",
+        default="keys.db",
+        help="Key store database for --key-id (default: keys.db)",
+    )
     decrypt_parser.add_argument(
         "--n", type=int, help="Private key modulus (if not using key file)"
     )
@@ -230,6 +859,113 @@ Examples:
     decrypt_parser.add_argument(
         "--output", "-o", help="Output file for decrypted message"
     )
+    decrypt_parser.add_argument(
+        "--format",
+        "-f",
+        choices=CIPHERTEXT_FORMATS,
+        default="decimal",
+        help="Ciphertext format (default: decimal); binary needs a file",
+    )
+    decrypt_parser.add_argument(
+        "--packing",
+        choices=PACKINGS,
+        default="decimal",
+        help="Block packing (default: decimal); radix fits more characters per block",
+    )
+    decrypt_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Worker processes for large messages (default: 1)",
+    )
+    decrypt_parser.add_argument(
+        "--stats",
+        nargs="?",
+        const="text",
+        choices=("text", "json", "prometheus"),
+        help="Print time per stage to stderr (default format: text)",
+    )
+    decrypt_parser.add_argument(
+        "--envelope",
+        action="store_true",
+        help="Decrypt an envelope file made with encrypt --envelope",
+    )
+    decrypt_parser.add_argument(
+        "--chars",
+        help="Only decrypt characters START:END of the --input file (random access)",
+    )
+
+    # Serve stdio command
+    stdio_parser = subparsers.add_parser(
+        "serve-stdio",
+        help="Answer newline-delimited JSON requests from stdin until EOF",
+    )
+    stdio_parser.add_argument(
+        "--alphabet",
+        "-a",
+        default="basic",
+        help="Alphabet for requests without one (default: basic)",
+    )
+    stdio_parser.add_argument(
+        "--key-file", "-k", help="JSON file with the keys for requests without one"
+    )
+    stdio_parser.add_argument("--key-id", help="Id of the key in the key store")
+    stdio_parser.add_argument(
+        "--key-store",
+        default="keys.db",
+        help="Key store database for --key-id (default: keys.db)",
+    )
+    stdio_parser.add_argument(
+        "--flush-lines",
+        type=int,
+        default=1024,
+        help="Most responses written per flush (default: 1024)",
+    )
+
+    # Sign command
+    sign_parser = subparsers.add_parser(
+        "sign", help="Sign each line of the input with the private key"
+    )
+    sign_parser.add_argument(
+        "--input", "-i", help="File with one message per line (default: stdin)"
+    )
+    sign_parser.add_argument("--key-file", "-k", help="JSON file containing keys")
+    sign_parser.add_argument("--key-id", help="Id of the key in the key store")
+    sign_parser.add_argument(
+        "--key-store",
+        default="keys.db",
+        help="Key store database for --key-id (default: keys.db)",
+    )
+    sign_parser.add_argument(
+        "--output", "-o", help="Output file for the signatures, one per line"
+    )
+
+    # Verify command
+    verify_parser = subparsers.add_parser(
+        "verify", help="Check one signature per line of the input"
+    )
+    verify_parser.add_argument(
+        "--input", "-i", help="File with one message per line (default: stdin)"
+    )
+    verify_parser.add_argument(
+        "--signatures",
+        "-s",
+        required=True,
+        help="File with one signature per line, as written by sign",
+    )
+    verify_parser.add_argument("--key-file", "-k", help="JSON file containing keys")
+    verify_parser.add_argument("--key-id", help="Id of the key in the key store")
+    verify_parser.add_argument(
+        "--key-store",
+        default="keys.db",
+        help="Key store database for --key-id (default: keys.db)",
+    )
+    verify_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Use the randomized batch test where it is faster than single checks",
+    )
 
     # Alphabet info command
     subparsers.add_parser("alphabet-info", help="Show available alphabet types")
@@ -243,9 +979,15 @@ Examples:
     if args.command == "generate-keys":
         generate_keys_command(args)
     elif args.command == "encrypt":
-        encrypt_command(args)
+        run_with_stats(encrypt_command, args)
     elif args.command == "decrypt":
-        decrypt_command(args)
+        run_with_stats(decrypt_command, args)
+    elif args.command == "serve-stdio":
+        serve_stdio_command(args)
+    elif args.command == "sign":
+        sign_command(args)
+    elif args.command == "verify":
+        verify_command(args)
     elif args.command == "alphabet-info":
         alphabet_info_command(args)
     else:
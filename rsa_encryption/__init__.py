@@ -2,11 +2,46 @@
 RSA Encryption Package
 
 A Python implementation of RSA encryption for educational purposes.
+
+The public names are imported on first use (PEP 562), so importing the
+package, or a single submodule of it, does not load the codec and its
+dependencies until they are needed.
 """
 
-from .key_generation import generate_keys, gcd
-from .encryption import rsa_encrypt
-from .decryption import rsa_decrypt
+import importlib
 
 __version__ = "1.0.0"
-__all__ = ["generate_keys", "gcd", "rsa_encrypt", "rsa_decrypt"]
+__all__ = [
+    "generate_keys",
+    "gcd",
+    "PrivateKey",
+    "rsa_encrypt",
+    "rsa_encrypt_multi",
+    "rsa_decrypt",
+]
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    "generate_keys": ".key_generation",
+    "gcd": ".key_generation",
+    "PrivateKey": ".key_generation",
+    "rsa_encrypt": ".encryption",
+    "rsa_encrypt_multi": ".encryption",
+    "rsa_decrypt": ".decryption",
+}
+
+
+def __getattr__(name: str):
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    # Cache it so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,182 @@
+"""
+Batch RSA Encryption and Decryption
+This module spreads the block exponentiations of many messages (or of one
+large message) across a process pool while keeping results in order.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional, Sequence, Union
+
+from .codec import block_exponentiator, get_codec_context
+from .key_generation import PrivateKey
+from .utils import split_into_chunks
+from .vectorized import numpy_pow_blocks, use_vectorized
+
+# Below this many blocks the pool startup costs more than it saves
+PARALLEL_BLOCK_THRESHOLD = 2048
+
+# Number of chunks handed to each worker, to even out uneven workloads
+CHUNKS_PER_WORKER = 4
+
+
+def _apply_exponent(
+    block_values: List[int], exponent: Union[int, PrivateKey], modulus: int
+) -> List[int]:
+    """
+    Raise every block value to the given exponent modulo the modulus.
+
+    Args:
+        block_values (List[int]): Block values to transform
+        exponent (int or PrivateKey): Exponent, or a PrivateKey for the CRT path
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        List[int]: Transformed block values, in input order
+    """
+    return list(map(block_exponentiator(modulus, exponent), block_values))
+
+
+def pow_blocks(
+    block_values: List[int],
+    exponent: Union[int, PrivateKey],
+    modulus: int,
+    workers: Optional[int] = None,
+) -> List[int]:
+    """
+    Exponentiate block values, using a process pool for large inputs.
+
+    Under a modulus small enough for rsa_encryption.vectorized, the blocks
+    are exponentiated as one NumPy array instead when NumPy is installed.
+
+    Args:
+        block_values (List[int]): Block values to transform
+        exponent (int or PrivateKey): Exponent, or a PrivateKey for the CRT path
+        modulus (int): The RSA modulus (n)
+        workers (int, optional): Number of worker processes; defaults to the
+            CPU count. Values of 1 or less keep the work in-process.
+
+    Returns:
+        List[int]: Transformed block values, in input order
+    """
+    # One NumPy pass over a small modulus beats starting a process pool
+    if use_vectorized(modulus, len(block_values)):
+        return numpy_pow_blocks(block_values, exponent, modulus)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(block_values) < PARALLEL_BLOCK_THRESHOLD:
+        return _apply_exponent(block_values, exponent, modulus)
+
+    chunk_size = -(-len(block_values) // (workers * CHUNKS_PER_WORKER))
+    chunks = split_into_chunks(block_values, chunk_size)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_result in executor.map(
+            _apply_exponent, chunks, repeat(exponent), repeat(modulus)
+        ):
+            results.extend(chunk_result)
+    return results
+
+
+def encrypt_many(
+    alphabet: str,
+    modulus: int,
+    public_exponent: int,
+    messages: Sequence[str],
+    workers: Optional[int] = None,
+    packing: str = "decimal",
+) -> List[str]:
+    """
+    Encrypt many messages with the same public key.
+
+    Blocks from all messages are pooled so that both many small messages and
+    a single large message are spread evenly across the workers.
+
+    Args:
+        alphabet (str): The alphabet to use for encoding
+        modulus (int): The RSA modulus (n)
+        public_exponent (int): The RSA public exponent (e)
+        messages (Sequence[str]): The messages to encrypt
+        workers (int, optional): Number of worker processes
+        packing (str): "decimal" or "radix", see rsa_encrypt
+
+    Returns:
+        List[str]: The encrypted messages, in input order
+
+    Raises:
+        ValueError: If a message is empty or contains invalid characters
+    """
+    context = get_codec_context(alphabet, modulus, packing)
+
+    # Encode every message up front, remembering where each one ends
+    all_blocks = []
+    block_counts = []
+    for message in messages:
+        block_values = context.encode(message)
+        all_blocks.extend(block_values)
+        block_counts.append(len(block_values))
+
+    encrypted_values = pow_blocks(all_blocks, public_exponent, modulus, workers)
+
+    encrypted_messages = []
+    position = 0
+    for count in block_counts:
+        encrypted_messages.append(
+            context.format_ciphertext(encrypted_values[position : position + count])
+        )
+        position += count
+    return encrypted_messages
+
+
+def decrypt_many(
+    alphabet: str,
+    modulus: int,
+    private_exponent: Union[int, PrivateKey],
+    encrypted_messages: Sequence[str],
+    workers: Optional[int] = None,
+    packing: str = "decimal",
+) -> List[str]:
+    """
+    Decrypt many messages with the same private key.
+
+    Args:
+        alphabet (str): The alphabet used for encoding
+        modulus (int): The RSA modulus (n)
+        private_exponent (int or PrivateKey): The RSA private exponent (d),
+            or a PrivateKey holding the CRT parameters
+        encrypted_messages (Sequence[str]): The encrypted messages
+        workers (int, optional): Number of worker processes
+        packing (str): "decimal" or "radix", see rsa_encrypt
+
+    Returns:
+        List[str]: The decrypted messages, in input order
+
+    Raises:
+        ValueError: If decryption fails or input is invalid
+    """
+    context = get_codec_context(alphabet, modulus, packing)
+
+    all_blocks = []
+    block_counts = []
+    try:
+        for encrypted_message in encrypted_messages:
+            block_values = context.parse_ciphertext(encrypted_message)
+            all_blocks.extend(block_values)
+            block_counts.append(len(block_values))
+    except ValueError as e:
+        raise ValueError(f"Decryption failed: {str(e)}")
+
+    decrypted_values = pow_blocks(all_blocks, private_exponent, modulus, workers)
+
+    decrypted_messages = []
+    position = 0
+    for count in block_counts:
+        decrypted_messages.append(
+            context.decode(decrypted_values[position : position + count])
+        )
+        position += count
+    return decrypted_messages
@@ -0,0 +1,109 @@
+"""
+RSA Byte Encryption
+This module encrypts arbitrary bytes (UTF-8 text, binary files) by packing
+them straight into integers, without going through an alphabet.
+"""
+
+from typing import Union
+
+from .codec import block_exponentiator
+from .formats import binary_block_size
+from .key_generation import PrivateKey
+
+# ISO/IEC 7816-4 padding: a marker byte followed by zero bytes
+PADDING_MARKER = b"\x80"
+
+
+def plaintext_block_size(modulus: int) -> int:
+    """
+    Calculate how many plaintext bytes fit in one block.
+
+    One byte less than the modulus width guarantees every block value is
+    below the modulus.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        int: Number of plaintext bytes per block
+
+    Raises:
+        ValueError: If the modulus is too small to hold a single byte
+    """
+    block_size = binary_block_size(modulus) - 1
+    if block_size < 1:
+        raise ValueError("Error: Modulus is too small for byte encryption!")
+    return block_size
+
+
+def encrypt_bytes(modulus: int, public_exponent: int, data: bytes) -> bytes:
+    """
+    Encrypt bytes using RSA.
+
+    The data is padded to a whole number of blocks with ISO/IEC 7816-4
+    padding, so any byte string (including an empty one) round-trips
+    exactly. The padding is deterministic; it is not a substitute for OAEP.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        public_exponent (int): The RSA public exponent (e)
+        data (bytes): The data to encrypt
+
+    Returns:
+        bytes: Concatenated fixed-width big-endian encrypted blocks
+    """
+    block_size = plaintext_block_size(modulus)
+    encrypted_block_size = binary_block_size(modulus)
+
+    padded = bytes(data) + PADDING_MARKER
+    padded += b"\x00" * (-len(padded) % block_size)
+
+    view = memoryview(padded)
+    encrypted_blocks = []
+    for i in range(0, len(padded), block_size):
+        block_value = int.from_bytes(view[i : i + block_size], "big")
+        encrypted_block = pow(block_value, public_exponent, modulus)
+        encrypted_blocks.append(encrypted_block.to_bytes(encrypted_block_size, "big"))
+    return b"".join(encrypted_blocks)
+
+
+def decrypt_bytes(
+    modulus: int, private_exponent: Union[int, PrivateKey], encrypted_data: bytes
+) -> bytes:
+    """
+    Decrypt bytes encrypted with encrypt_bytes.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        private_exponent (int or PrivateKey): The RSA private exponent (d),
+            or a PrivateKey holding the CRT parameters
+        encrypted_data (bytes): The encrypted blocks
+
+    Returns:
+        bytes: The decrypted data
+
+    Raises:
+        ValueError: If decryption fails or the padding is invalid
+    """
+    block_size = plaintext_block_size(modulus)
+    encrypted_block_size = binary_block_size(modulus)
+    decrypt_block = block_exponentiator(modulus, private_exponent)
+
+    if not encrypted_data or len(encrypted_data) % encrypted_block_size:
+        raise ValueError("Decryption failed: ciphertext length is not whole blocks")
+
+    view = memoryview(encrypted_data)
+    decrypted_blocks = []
+    try:
+        for i in range(0, len(encrypted_data), encrypted_block_size):
+            block_value = int.from_bytes(view[i : i + encrypted_block_size], "big")
+            decrypted_block = decrypt_block(block_value)
+            decrypted_blocks.append(decrypted_block.to_bytes(block_size, "big"))
+    except OverflowError:
+        raise ValueError("Decryption failed: block value out of range")
+
+    padded = b"".join(decrypted_blocks)
+    data = padded.rstrip(b"\x00")
+    if not data.endswith(PADDING_MARKER):
+        raise ValueError("Decryption failed: invalid padding")
+    return data[:-1]
@@ -0,0 +1,652 @@
+"""
+Message encoding for RSA encryption.
+This module converts between text and integer blocks in a single pass using
+lookup tables built from the alphabet's character mappings, and caches the
+per-alphabet, per-modulus setup so repeated calls skip it.
+"""
+
+from functools import lru_cache
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from . import instrumentation
+from .exponentiation import make_exponentiator
+from .key_generation import PrivateKey
+from .memo import MemoCache, message_digest
+from .packing import (
+    PACKINGS,
+    create_radix_table,
+    pack_blocks,
+    radix_block_size,
+    unpack_blocks,
+)
+from .utils import calculate_block_size, create_char_mappings, iter_chunks
+from .vectorized import modulus_fits, numpy_pow_blocks, use_vectorized
+
+# Number of (alphabet, modulus) contexts kept by get_codec_context
+CODEC_CACHE_SIZE = 256
+
+
+def create_codec_tables(alphabet: str) -> Tuple[dict, Dict[str, str]]:
+    """
+    Build the lookup tables used to encode and decode messages.
+
+    Args:
+        alphabet (str): The alphabet to use for encoding
+
+    Returns:
+        tuple: (encoding_table, pair_table) - a ``str.translate`` table mapping
+            each character to its two-digit code, and a table mapping every
+            two-digit string to its character (or "" if unused)
+    """
+    char_to_num_map, num_to_char_map = create_char_mappings(alphabet)
+
+    encoding_table = str.maketrans(char_to_num_map)
+
+    # Every possible digit pair gets an entry so decoding never branches
+    pair_table = {str(i).zfill(2): "" for i in range(100)}
+    pair_table.update(
+        (pair, char) for pair, char in num_to_char_map.items() if len(pair) == 2
+    )
+
+    return encoding_table, pair_table
+
+
+def check_message_chars(message: str, alphabet: Iterable[str]) -> None:
+    """
+    Check that every character of a message is in the alphabet.
+
+    Args:
+        message (str): The message to check
+        alphabet (Iterable[str]): The alphabet, or a set of its characters
+
+    Raises:
+        ValueError: Naming the first character outside the alphabet
+    """
+    invalid_chars = set(message).difference(alphabet)
+    if invalid_chars:
+        char = next(char for char in message if char in invalid_chars)
+        raise ValueError(f"Error: Character '{char}' not in the alphabet!")
+
+
+def translate_message(
+    message: str, alphabet: Iterable[str], encoding_table: dict
+) -> str:
+    """
+    Map a message to its string of two-digit character codes.
+
+    Args:
+        message (str): The message to encode
+        alphabet (Iterable[str]): The alphabet, or a set of its characters
+        encoding_table (dict): Translate table from create_codec_tables
+
+    Returns:
+        str: The digits of the message
+
+    Raises:
+        ValueError: If the message contains characters outside the alphabet
+    """
+    check_message_chars(message, alphabet)
+    return message.translate(encoding_table)
+
+
+def split_digits(numeric_message: str, block_size: int) -> List[int]:
+    """
+    Split a digit string into integer blocks, zero-padding the last one.
+
+    Args:
+        numeric_message (str): Digits from translate_message
+        block_size (int): Number of digits per block
+
+    Returns:
+        List[int]: The block values
+    """
+    numeric_message += "0" * (-len(numeric_message) % block_size)
+    return [
+        int(numeric_message[i : i + block_size])
+        for i in range(0, len(numeric_message), block_size)
+    ]
+
+
+def encode_message(
+    message: str, alphabet: Iterable[str], encoding_table: dict, block_size: int
+) -> List[int]:
+    """
+    Encode a message into integer blocks of ``block_size`` digits.
+
+    The final block is padded with zeros, which decode to the first
+    character of the alphabet.
+
+    Args:
+        message (str): The message to encode
+        alphabet (Iterable[str]): The alphabet, or a set of its characters
+        encoding_table (dict): Translate table from create_codec_tables
+        block_size (int): Number of digits per block
+
+    Returns:
+        List[int]: The block values
+
+    Raises:
+        ValueError: If the message contains characters outside the alphabet
+    """
+    numeric_message = translate_message(message, alphabet, encoding_table)
+    return split_digits(numeric_message, block_size)
+
+
+def decode_blocks(
+    block_values: Iterable[int],
+    alphabet: str,
+    pair_table: dict,
+    block_size: int,
+    strip_padding: bool = True,
+) -> str:
+    """
+    Decode integer blocks back into a message.
+
+    The first character of the alphabet is treated as padding: it is dropped
+    from the last position of each block and stripped from the end of the
+    message.
+
+    Args:
+        block_values (Iterable[int]): Decrypted block values
+        alphabet (str): The alphabet used for encoding
+        pair_table (dict): Pair table from create_codec_tables
+        block_size (int): Number of digits per block
+        strip_padding (bool): Strip trailing padding from the result; disable
+            when decoding a message piece by piece
+
+    Returns:
+        str: The decoded message
+    """
+    padding_char = alphabet[0]
+    decoded_chars = []
+
+    for block_value in block_values:
+        digits = str(block_value).zfill(block_size)
+        chars = [
+            pair_table.get(digits[i : i + 2], "") for i in range(0, len(digits), 2)
+        ]
+        if chars[-1] == padding_char:
+            chars.pop()
+        decoded_chars.extend(chars)
+
+    decoded_message = "".join(decoded_chars)
+    if strip_padding:
+        decoded_message = decoded_message.rstrip(padding_char)
+    return decoded_message
+
+
+def make_key(modulus: int, exponent: Union[int, PrivateKey]) -> tuple:
+    """
+    Combine a modulus and exponent into a key for RSACodec.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        exponent (int or PrivateKey): The exponent, or a PrivateKey which is
+            returned as-is so the CRT path stays available
+
+    Returns:
+        tuple: (n, exponent) or the PrivateKey
+    """
+    if isinstance(exponent, PrivateKey):
+        return exponent
+    return (modulus, exponent)
+
+
+def block_exponentiator(
+    modulus: int, exponent: Union[int, PrivateKey], backend: Optional[str] = None
+) -> Callable[[int], int]:
+    """
+    Get the function that raises a single block value to the key's exponent.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        exponent (int or PrivateKey): The public or private exponent, or a
+            PrivateKey holding the CRT parameters
+        backend (str, optional): Exponentiation backend, see
+            rsa_encryption.exponentiation
+
+    Returns:
+        Callable[[int], int]: Block transformation function
+    """
+    return make_exponentiator(modulus, exponent, backend)
+
+
+class CodecContext:
+    """
+    Precomputed encoding state for one alphabet and modulus.
+
+    Holds the lookup tables and block sizes that every encryption or
+    decryption under the same alphabet and modulus would otherwise rebuild.
+    Use get_codec_context to share contexts between calls.
+    """
+
+    packing = "decimal"
+
+    def __init__(self, alphabet: str, modulus: int):
+        """
+        Args:
+            alphabet (str): The alphabet to use for encoding
+            modulus (int): The RSA modulus (n)
+        """
+        self.alphabet = alphabet
+        self.alphabet_chars = frozenset(alphabet)
+        self.modulus = modulus
+        self.encoding_table, self.pair_table = _alphabet_tables(alphabet)
+        self.block_size = calculate_block_size(modulus, len(alphabet))
+        self.encrypted_block_size = len(str(modulus))
+
+    def encode(self, message: str) -> List[int]:
+        """
+        Encode a message into block values below the modulus.
+
+        Args:
+            message (str): The message to encode
+
+        Returns:
+            List[int]: The block values
+
+        Raises:
+            ValueError: If message is empty or contains invalid characters
+        """
+        if len(message) == 0:
+            raise ValueError("Error: Empty message!")
+
+        block_values = encode_message(
+            message, self.alphabet_chars, self.encoding_table, self.block_size
+        )
+        if max(block_values) >= self.modulus:
+            raise ValueError("Error: Block value exceeds modulus!")
+        return block_values
+
+    def decode(self, block_values: Iterable[int], strip_padding: bool = True) -> str:
+        """
+        Decode block values into a message, see decode_blocks.
+
+        Args:
+            block_values (Iterable[int]): Decrypted block values
+            strip_padding (bool): Strip trailing padding from the result
+
+        Returns:
+            str: The decoded message
+        """
+        return decode_blocks(
+            block_values,
+            self.alphabet,
+            self.pair_table,
+            self.block_size,
+            strip_padding,
+        )
+
+    def parse_ciphertext(self, encrypted_message: str) -> List[int]:
+        """
+        Split a ciphertext of fixed-width decimal blocks into block values.
+
+        Args:
+            encrypted_message (str): The encrypted message
+
+        Returns:
+            List[int]: The encrypted block values
+
+        Raises:
+            ValueError: If a block is not a number
+        """
+        width = self.encrypted_block_size
+        return [int(block) for block in iter_chunks(encrypted_message, width)]
+
+    def format_ciphertext(self, block_values: Iterable[int]) -> str:
+        """
+        Join encrypted block values into fixed-width decimal blocks.
+
+        Args:
+            block_values (Iterable[int]): The encrypted block values
+
+        Returns:
+            str: The encrypted message as a string of digits
+        """
+        width = self.encrypted_block_size
+        return "".join([str(block_value).zfill(width) for block_value in block_values])
+
+
+class RadixCodecContext(CodecContext):
+    """
+    Codec context packing characters in base ``len(alphabet)``.
+
+    Blocks hold as many characters as fit below the modulus, see
+    rsa_encryption.packing; ``block_size`` counts characters rather than
+    digits. The ciphertext format is the same as for two-digit packing.
+    """
+
+    packing = "radix"
+
+    def __init__(self, alphabet: str, modulus: int):
+        """
+        Args:
+            alphabet (str): The alphabet to use for encoding
+            modulus (int): The RSA modulus (n)
+
+        Raises:
+            ValueError: If the alphabet is too small or too large to pack
+        """
+        self.alphabet = alphabet
+        self.alphabet_chars = frozenset(alphabet)
+        self.modulus = modulus
+        self.radix_table = _radix_tables(alphabet)
+        self.block_size = radix_block_size(modulus, len(alphabet))
+        self.encrypted_block_size = len(str(modulus))
+
+    def encode(self, message: str) -> List[int]:
+        """
+        Pack a message into block values below the modulus.
+
+        Args:
+            message (str): The message to encode
+
+        Returns:
+            List[int]: The block values
+
+        Raises:
+            ValueError: If message is empty or contains invalid characters
+        """
+        if len(message) == 0:
+            raise ValueError("Error: Empty message!")
+
+        check_message_chars(message, self.alphabet_chars)
+        return pack_blocks(message, self.alphabet, self.radix_table, self.block_size)
+
+    def decode(self, block_values: Iterable[int], strip_padding: bool = True) -> str:
+        """
+        Unpack block values into a message.
+
+        Args:
+            block_values (Iterable[int]): Decrypted block values
+            strip_padding (bool): Unused; packed blocks carry no padding
+
+        Returns:
+            str: The decoded message
+        """
+        return unpack_blocks(block_values, self.alphabet)
+
+
+# Contexts for the same alphabet under different moduli share their tables
+_alphabet_tables = lru_cache(maxsize=CODEC_CACHE_SIZE)(create_codec_tables)
+_radix_tables = lru_cache(maxsize=CODEC_CACHE_SIZE)(create_radix_table)
+
+_CONTEXT_TYPES = {"decimal": CodecContext, "radix": RadixCodecContext}
+
+
+def get_codec_context(
+    alphabet: str, modulus: int, packing: str = "decimal"
+) -> CodecContext:
+    """
+    Get the shared codec context for an alphabet, modulus and packing.
+
+    Contexts are kept in a bounded LRU cache, so repeated calls with the same
+    alphabet and modulus skip all table and block size setup.
+
+    Args:
+        alphabet (str): The alphabet to use for encoding
+        modulus (int): The RSA modulus (n)
+        packing (str): "decimal" for two digits per character, or "radix"
+            for base-``len(alphabet)`` blocks, see rsa_encryption.packing
+
+    Returns:
+        CodecContext: The cached context
+
+    Raises:
+        ValueError: If the packing is unknown
+    """
+    # One positional call, so (alphabet, n) and (alphabet, n, "decimal")
+    # share a cache entry
+    return _cached_context(alphabet, modulus, packing)
+
+
+@lru_cache(maxsize=CODEC_CACHE_SIZE)
+def _cached_context(alphabet: str, modulus: int, packing: str) -> CodecContext:
+    """Build a codec context; cached by get_codec_context."""
+    if packing not in PACKINGS:
+        raise ValueError(f"Error: Unknown packing '{packing}'!")
+    return _CONTEXT_TYPES[packing](alphabet, modulus)
+
+
+get_codec_context.cache_info = _cached_context.cache_info
+get_codec_context.cache_clear = _cached_context.cache_clear
+
+
+class RSACodec:
+    """
+    Encrypts or decrypts messages under one alphabet and key.
+
+    All per-key setup is done once when the codec is created, so reusing a
+    codec across many short messages only pays for the exponentiation.
+
+    Example:
+        public_key, private_key = generate_keys()
+        encrypted = RSACodec(alphabet, public_key).encrypt("hello")
+        decrypted = RSACodec(alphabet, private_key).decrypt(encrypted)
+    """
+
+    def __init__(
+        self,
+        alphabet: str,
+        key: tuple,
+        backend: Optional[str] = None,
+        cache: Optional[MemoCache] = None,
+        packing: str = "decimal",
+    ):
+        """
+        Args:
+            alphabet (str): The alphabet to use for encoding
+            key (tuple): Public key (n, e), private key (n, d), or a
+                PrivateKey to use the CRT path
+            backend (str, optional): Exponentiation backend, see
+                rsa_encryption.exponentiation
+            cache (MemoCache, optional): Cache of exponentiated blocks and
+                whole messages, see rsa_encryption.memo
+            packing (str): "decimal" or "radix", see get_codec_context
+        """
+        modulus, exponent = key
+        self.cache = cache
+        # The plain exponent identifies the key in cache entries
+        self.exponent_value = exponent
+        if isinstance(key, PrivateKey):
+            exponent = key
+
+        self.context = get_codec_context(alphabet, modulus, packing)
+        self.modulus = modulus
+        self.exponent = exponent
+        self.exponentiate_block = block_exponentiator(modulus, exponent, backend)
+        # Long messages under small moduli go through NumPy unless a backend
+        # was picked explicitly; NumPy itself is only imported for those
+        self.vectorize = backend is None and modulus_fits(modulus)
+
+    def encrypt_blocks(self, message: str) -> List[int]:
+        """
+        Encode and encrypt a message into encrypted block values.
+
+        Args:
+            message (str): The message to encrypt
+
+        Returns:
+            List[int]: The encrypted block values
+
+        Raises:
+            ValueError: If message is empty or contains invalid characters
+        """
+        recorder = instrumentation.active
+        if recorder is None:
+            return list(self._exponentiate_all(self.context.encode(message)))
+
+        start = perf_counter()
+        block_values = self.context.encode(message)
+        encoded = perf_counter()
+        encrypted_values = list(self._exponentiate_all(block_values))
+        end = perf_counter()
+        recorder.record("encode", encoded - start, len(block_values), len(message))
+        recorder.record("exponentiate", end - encoded, len(block_values))
+        return encrypted_values
+
+    def decrypt_blocks(
+        self, block_values: Iterable[int], strip_padding: bool = True
+    ) -> str:
+        """
+        Decrypt and decode encrypted block values into a message.
+
+        Args:
+            block_values (Iterable[int]): The encrypted block values
+            strip_padding (bool): Strip trailing padding from the result
+
+        Returns:
+            str: The decrypted message
+        """
+        recorder = instrumentation.active
+        if recorder is None:
+            return self.context.decode(
+                self._exponentiate_all(block_values), strip_padding
+            )
+
+        start = perf_counter()
+        decrypted_values = list(self._exponentiate_all(block_values))
+        exponentiated = perf_counter()
+        message = self.context.decode(decrypted_values, strip_padding)
+        end = perf_counter()
+        blocks = len(decrypted_values)
+        recorder.record("exponentiate", exponentiated - start, blocks)
+        recorder.record("decode", end - exponentiated, blocks, len(message))
+        return message
+
+    def exponentiate(self, block_values: Iterable[int]) -> List[int]:
+        """
+        Raise block values that are already encoded to the key's exponent.
+
+        Takes the same batch paths and cache as encrypt and decrypt, for
+        callers that encode the blocks themselves.
+
+        Args:
+            block_values (Iterable[int]): Block values below the modulus
+
+        Returns:
+            List[int]: The exponentiated block values, in input order
+
+        Raises:
+            ValueError: If a block value is not below the modulus
+        """
+        block_values = list(block_values)
+        if block_values and max(block_values) >= self.modulus:
+            raise ValueError("Error: Block value exceeds modulus!")
+        return list(self._exponentiate_all(block_values))
+
+    def _exponentiate_all(self, block_values: Iterable[int]) -> Iterable[int]:
+        """Exponentiate block values, skipping those in the cache."""
+        if self.cache is not None:
+            return self.cache.exponentiate(
+                self.modulus,
+                self.exponent_value,
+                list(block_values),
+                self._compute_all,
+            )
+        return self._compute_all(block_values)
+
+    def _compute_all(self, block_values: Iterable[int]) -> Iterable[int]:
+        """Exponentiate block values, as one batch for long messages."""
+        if self.vectorize:
+            block_values = list(block_values)
+            if use_vectorized(self.modulus, len(block_values)):
+                return numpy_pow_blocks(block_values, self.exponent, self.modulus)
+        return map(self.exponentiate_block, block_values)
+
+    def encrypt(self, message: str) -> str:
+        """
+        Encrypt a message into fixed-width decimal blocks.
+
+        Args:
+            message (str): The message to encrypt
+
+        Returns:
+            str: The encrypted message as a string of digits
+
+        Raises:
+            ValueError: If message is empty or contains invalid characters
+        """
+        if self.cache is None:
+            return self._encrypt(message)
+
+        key = self._message_key("encrypt", message)
+        encrypted_message = self.cache.get_message(key)
+        if encrypted_message is None:
+            encrypted_message = self._encrypt(message)
+            self.cache.put_message(key, encrypted_message)
+        return encrypted_message
+
+    def _encrypt(self, message: str) -> str:
+        """Encrypt a message without the whole-message cache."""
+        block_values = self.encrypt_blocks(message)
+        recorder = instrumentation.active
+        if recorder is None:
+            return self.context.format_ciphertext(block_values)
+
+        start = perf_counter()
+        encrypted_message = self.context.format_ciphertext(block_values)
+        recorder.record(
+            "format",
+            perf_counter() - start,
+            len(block_values),
+            len(encrypted_message),
+        )
+        return encrypted_message
+
+    def decrypt(self, encrypted_message: str, strip_padding: bool = True) -> str:
+        """
+        Decrypt a message of fixed-width decimal blocks.
+
+        Args:
+            encrypted_message (str): The encrypted message to decrypt
+            strip_padding (bool): Strip trailing padding from the result;
+                disable when decrypting a message piece by piece
+
+        Returns:
+            str: The decrypted message
+
+        Raises:
+            ValueError: If decryption fails or input is invalid
+        """
+        # Pieces of a longer message keep their padding, so are not cached
+        if self.cache is None or not strip_padding:
+            return self._decrypt(encrypted_message, strip_padding)
+
+        key = self._message_key("decrypt", encrypted_message)
+        message = self.cache.get_message(key)
+        if message is None:
+            message = self._decrypt(encrypted_message, strip_padding)
+            self.cache.put_message(key, message)
+        return message
+
+    def _decrypt(self, encrypted_message: str, strip_padding: bool) -> str:
+        """Decrypt a message without the whole-message cache."""
+        recorder = instrumentation.active
+        try:
+            if recorder is None:
+                block_values = self.context.parse_ciphertext(encrypted_message)
+            else:
+                start = perf_counter()
+                block_values = self.context.parse_ciphertext(encrypted_message)
+                recorder.record(
+                    "parse",
+                    perf_counter() - start,
+                    len(block_values),
+                    len(encrypted_message),
+                )
+        except ValueError as e:
+            raise ValueError(f"Decryption failed: {str(e)}")
+        return self.decrypt_blocks(block_values, strip_padding)
+
+    def _message_key(self, operation: str, text: str) -> tuple:
+        """Key of a whole-message cache entry."""
+        return (
+            operation,
+            self.context.packing,
+            self.context.alphabet,
+            self.modulus,
+            self.exponent_value,
+            message_digest(text),
+        )
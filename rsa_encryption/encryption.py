@@ -3,18 +3,37 @@ RSA Encryption
 This module encrypts a message using RSA encryption with improved block handling.
 """
 
-from .utils import calculate_block_size, create_char_mappings, split_into_chunks
+from itertools import repeat
+from typing import List, Optional, Sequence
 
+from .codec import RSACodec, get_codec_context, split_digits, translate_message
+from .memo import MemoCache
 
-def rsa_encrypt(alphabet: str, modulus: int, public_exponent: int, message: str) -> str:
+
+def rsa_encrypt(
+    alphabet: str,
+    modulus: int,
+    public_exponent: int,
+    message: str,
+    cache: Optional[MemoCache] = None,
+    packing: str = "decimal",
+) -> str:
     """
     Encrypt a message using RSA with improved padding and block handling.
 
+    The alphabet and modulus setup is cached between calls; use RSACodec
+    directly to also reuse the key setup across many messages.
+
     Args:
         alphabet (str): The alphabet to use for encoding
         modulus (int): The RSA modulus (n)
         public_exponent (int): The RSA public exponent (e)
         message (str): The message to encrypt
+        cache (MemoCache, optional): Cache that repeated blocks and messages
+            are answered from, see rsa_encryption.memo
+        packing (str): "decimal" for two digits per character, or "radix"
+            to pack characters in base len(alphabet), with fewer blocks;
+            see rsa_encryption.packing
 
     Returns:
         str: The encrypted message as a string of digits
@@ -22,39 +41,104 @@ def rsa_encrypt(alphabet: str, modulus: int, public_exponent: int, message: str)
     Raises:
         ValueError: If message is empty or contains invalid characters
     """
-    if len(message) == 0:
-        raise ValueError("Error: Empty message!")
+    codec = RSACodec(alphabet, (modulus, public_exponent), cache=cache, packing=packing)
+    return codec.encrypt(message)
+
+
+def _encrypt_for_recipient(
+    alphabet: str, public_key: tuple, block_values: List[int], packing: str
+) -> str:
+    """
+    Exponentiate and format already-encoded blocks for one recipient.
+
+    Args:
+        alphabet (str): The alphabet used for encoding
+        public_key (tuple): The recipient's (n, e)
+        block_values (List[int]): Blocks encoded for the key's block size
+        packing (str): The packing the blocks were encoded with
+
+    Returns:
+        str: The encrypted message as a string of digits
+
+    Raises:
+        ValueError: If a block value is not below the modulus
+    """
+    codec = RSACodec(alphabet, public_key, packing=packing)
+    return codec.context.format_ciphertext(codec.exponentiate(block_values))
+
+
+def rsa_encrypt_multi(
+    alphabet: str,
+    public_keys: Sequence[tuple],
+    message: str,
+    workers: Optional[int] = None,
+    packing: str = "decimal",
+) -> List[str]:
+    """
+    Encrypt one message for many recipients.
 
-    # Create character mappings
-    char_to_num_map, _ = create_char_mappings(alphabet)
+    The message is encoded once per distinct block size (and mapped to
+    digits only once), so recipients whose moduli give the same block size
+    share one encoding; only the exponentiation is done per recipient.
+
+    Args:
+        alphabet (str): The alphabet to use for encoding
+        public_keys (Sequence[tuple]): The recipients' (n, e) keys
+        message (str): The message to encrypt
+        workers (int, optional): Worker processes for the exponentiation;
+            used once the recipients' blocks add up to
+            batch.PARALLEL_BLOCK_THRESHOLD. In-process by default
+        packing (str): "decimal" or "radix", see rsa_encrypt
 
-    # Convert message to numeric form
-    numeric_message = ""
-    for char in message:
-        if char not in char_to_num_map:
-            raise ValueError(f"Error: Character '{char}' not in the alphabet!")
-        numeric_message += char_to_num_map[char]
+    Returns:
+        List[str]: The encrypted messages, in the order of public_keys
 
-    # Calculate safe block size
-    block_size = calculate_block_size(modulus, len(alphabet))
+    Raises:
+        ValueError: If message is empty or contains invalid characters
+    """
+    if len(message) == 0:
+        raise ValueError("Error: Empty message!")
+    if not public_keys:
+        return []
 
-    # Split message into blocks
-    blocks = split_into_chunks(numeric_message, block_size)
+    # Recipients sharing a block size share the block split
+    blocks_by_size = {}
+    numeric_message = None
+    jobs = []
+    for modulus, public_exponent in public_keys:
+        context = get_codec_context(alphabet, modulus, packing)
+        block_values = blocks_by_size.get(context.block_size)
+        if block_values is None:
+            if context.packing != "decimal":
+                block_values = context.encode(message)
+            else:
+                if numeric_message is None:
+                    numeric_message = translate_message(
+                        message, context.alphabet_chars, context.encoding_table
+                    )
+                block_values = split_digits(numeric_message, context.block_size)
+            blocks_by_size[context.block_size] = block_values
+        jobs.append(((modulus, public_exponent), block_values))
 
-    # Encrypt each block
-    encrypted_blocks = []
-    for block in blocks:
-        # Pad with first alphabet character (index 00) instead of zeros
-        if len(block) < block_size:
-            padding_char = "00"  # Use alphabet[0] index
-            block = block.ljust(block_size, padding_char[-1])
+    if workers is not None and workers > 1:
+        from .batch import PARALLEL_BLOCK_THRESHOLD
 
-        block_value = int(block)
-        if block_value >= modulus:
-            raise ValueError("Error: Block value exceeds modulus!")
+        total_blocks = sum(len(block_values) for _, block_values in jobs)
+        if total_blocks >= PARALLEL_BLOCK_THRESHOLD:
+            from concurrent.futures import ProcessPoolExecutor
 
-        encrypted_block = pow(block_value, public_exponent, modulus)
-        # Use consistent block size for encrypted output
-        encrypted_blocks.append(str(encrypted_block).zfill(len(str(modulus))))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(
+                    executor.map(
+                        _encrypt_for_recipient,
+                        repeat(alphabet),
+                        [key for key, _ in jobs],
+                        [block_values for _, block_values in jobs],
+                        repeat(packing),
+                    )
+                )
 
-    return "".join(encrypted_blocks)
+    return [
+        _encrypt_for_recipient(alphabet, key, block_values, packing)
+        for key, block_values in jobs
+    ]
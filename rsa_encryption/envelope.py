@@ -0,0 +1,139 @@
+"""
+RSA Envelope Encryption
+This module encrypts bulk data with a random session key and a symmetric
+stream cipher, and RSA-encrypts only the session key, so large payloads are
+not limited by modular exponentiation.
+"""
+
+import hashlib
+import hmac
+import secrets
+import struct
+from typing import Union
+
+from .byte_encryption import decrypt_bytes, encrypt_bytes
+from .formats import key_id
+from .key_generation import PrivateKey
+
+# Envelope header: magic, version, key id, length of the wrapped session key
+ENVELOPE_MAGIC = b"RSAE"
+ENVELOPE_VERSION = 1
+_HEADER = struct.Struct(">4sB8sH")
+HEADER_SIZE = _HEADER.size
+
+SESSION_KEY_SIZE = 32
+NONCE_SIZE = 16
+TAG_SIZE = 32
+
+# Bytes of keystream produced per SHAKE-256 call
+KEYSTREAM_SEGMENT_SIZE = 1 << 16
+
+
+def _derive_keys(session_key: bytes) -> tuple:
+    """Derive independent cipher and MAC keys from the session key."""
+    cipher_key = hmac.digest(session_key, b"envelope encryption", "sha256")
+    mac_key = hmac.digest(session_key, b"envelope authentication", "sha256")
+    return cipher_key, mac_key
+
+
+def _apply_keystream(cipher_key: bytes, nonce: bytes, data: bytes) -> bytes:
+    """
+    XOR data with a keystream; applying it twice restores the data.
+
+    Each segment of keystream is SHAKE-256 of the key, nonce and segment
+    index, and is XORed with the data as one big integer.
+
+    Args:
+        cipher_key (bytes): The derived cipher key
+        nonce (bytes): Random per-message nonce
+        data (bytes): The data to encrypt or decrypt
+
+    Returns:
+        bytes: The transformed data
+    """
+    view = memoryview(data)
+    prefix = cipher_key + nonce
+    segments = []
+    for index, start in enumerate(range(0, len(data), KEYSTREAM_SEGMENT_SIZE)):
+        segment = view[start : start + KEYSTREAM_SEGMENT_SIZE]
+        size = len(segment)
+        keystream = hashlib.shake_256(prefix + index.to_bytes(8, "big")).digest(size)
+        value = int.from_bytes(segment, "big") ^ int.from_bytes(keystream, "big")
+        segments.append(value.to_bytes(size, "big"))
+    return b"".join(segments)
+
+
+def encrypt_envelope(modulus: int, public_exponent: int, data: bytes) -> bytes:
+    """
+    Encrypt bytes with a fresh session key wrapped by the RSA public key.
+
+    Layout: header, RSA-encrypted session key, nonce, ciphertext and an
+    HMAC-SHA256 tag over everything before it.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        public_exponent (int): The RSA public exponent (e)
+        data (bytes): The data to encrypt
+
+    Returns:
+        bytes: The envelope
+    """
+    session_key = secrets.token_bytes(SESSION_KEY_SIZE)
+    nonce = secrets.token_bytes(NONCE_SIZE)
+    cipher_key, mac_key = _derive_keys(session_key)
+
+    wrapped_key = encrypt_bytes(modulus, public_exponent, session_key)
+    header = _HEADER.pack(
+        ENVELOPE_MAGIC, ENVELOPE_VERSION, key_id(modulus), len(wrapped_key)
+    )
+    body = header + wrapped_key + nonce + _apply_keystream(cipher_key, nonce, data)
+    return body + hmac.digest(mac_key, body, "sha256")
+
+
+def decrypt_envelope(
+    modulus: int, private_exponent: Union[int, PrivateKey], envelope: bytes
+) -> bytes:
+    """
+    Decrypt an envelope made by encrypt_envelope.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        private_exponent (int or PrivateKey): The RSA private exponent (d),
+            or a PrivateKey holding the CRT parameters
+        envelope (bytes): The envelope
+
+    Returns:
+        bytes: The decrypted data
+
+    Raises:
+        ValueError: If the envelope is malformed, was made for a different
+            key, or fails the integrity check
+    """
+    if len(envelope) < HEADER_SIZE:
+        raise ValueError("Decryption failed: envelope is too short for its header")
+
+    magic, version, envelope_key_id, wrapped_size = _HEADER.unpack_from(envelope)
+    if magic != ENVELOPE_MAGIC or version != ENVELOPE_VERSION:
+        raise ValueError("Decryption failed: not an RSA envelope")
+    if envelope_key_id != key_id(modulus):
+        raise ValueError("Decryption failed: envelope was made for a different key")
+
+    nonce_start = HEADER_SIZE + wrapped_size
+    data_start = nonce_start + NONCE_SIZE
+    if len(envelope) < data_start + TAG_SIZE:
+        raise ValueError("Decryption failed: envelope is truncated")
+
+    view = memoryview(envelope)
+    session_key = decrypt_bytes(
+        modulus, private_exponent, bytes(view[HEADER_SIZE:nonce_start])
+    )
+    if len(session_key) != SESSION_KEY_SIZE:
+        raise ValueError("Decryption failed: invalid session key")
+    cipher_key, mac_key = _derive_keys(session_key)
+
+    body, tag = view[:-TAG_SIZE], view[-TAG_SIZE:]
+    if not hmac.compare_digest(hmac.digest(mac_key, body, "sha256"), tag):
+        raise ValueError("Decryption failed: integrity check failed")
+
+    nonce = bytes(view[nonce_start:data_start])
+    return _apply_keystream(cipher_key, nonce, view[data_start:-TAG_SIZE])
@@ -0,0 +1,260 @@
+"""
+Modular Exponentiation Engine
+This module prepares a block exponentiation function once per key and
+exponent, with pluggable backends: built-in ``pow``, ``gmpy2.powmod`` when
+gmpy2 is installed, and a pure-Python sliding-window engine whose exponent
+recoding is precomputed.
+"""
+
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from .key_generation import PrivateKey
+
+try:
+    import gmpy2
+except ImportError:  # pragma: no cover - optional dependency
+    gmpy2 = None
+
+# A backend turns (modulus, exponent) into a function of one block value
+Backend = Callable[[int, int], Callable[[int], int]]
+
+# Number of prepared (modulus, exponent, backend) functions kept
+EXPONENTIATOR_CACHE_SIZE = 256
+
+# (minimum exponent bits, window bits), as used by common bignum libraries
+_WINDOW_SIZES = [(672, 6), (240, 5), (80, 4), (24, 3), (0, 1)]
+
+
+def window_bits_for(exponent_bits: int) -> int:
+    """
+    Choose a sliding-window width for an exponent size.
+
+    Args:
+        exponent_bits (int): Bit length of the exponent
+
+    Returns:
+        int: Window width in bits
+    """
+    for min_bits, window_bits in _WINDOW_SIZES:
+        if exponent_bits >= min_bits:
+            return window_bits
+    return 1
+
+
+class SlidingWindowPlan:
+    """
+    Sliding-window recoding of one exponent, computed once and reused.
+
+    The exponent is scanned once into (squarings, odd digit) steps; raising
+    a block to the exponent then only builds the small table of odd powers
+    of that block and replays the steps.
+
+    Example:
+        plan = SlidingWindowPlan(65537)
+        plan.power(block_value, modulus)
+    """
+
+    def __init__(self, exponent: int, window_bits: Optional[int] = None):
+        """
+        Args:
+            exponent (int): The exponent, must be positive
+            window_bits (int, optional): Window width; chosen from the
+                exponent size by default
+
+        Raises:
+            ValueError: If the exponent or window width is not positive
+        """
+        if exponent < 1:
+            raise ValueError("Error: Exponent must be positive!")
+        if window_bits is None:
+            window_bits = window_bits_for(exponent.bit_length())
+        if window_bits < 1:
+            raise ValueError("Error: Window width must be positive!")
+
+        self.exponent = exponent
+        self.window_bits = window_bits
+        self.steps, self.trailing_squarings = self._recode(exponent, window_bits)
+        self.max_digit = max(digit for _, digit in self.steps)
+
+    @staticmethod
+    def _recode(exponent: int, window_bits: int) -> Tuple[List[tuple], int]:
+        """Split the exponent, most significant bit first, into windows."""
+        steps = []
+        squarings = 0
+        i = exponent.bit_length() - 1
+        while i >= 0:
+            if not (exponent >> i) & 1:
+                squarings += 1
+                i -= 1
+                continue
+            # Longest window starting at bit i that ends in a set bit
+            j = max(i - window_bits + 1, 0)
+            while not (exponent >> j) & 1:
+                j += 1
+            width = i - j + 1
+            digit = (exponent >> j) & ((1 << width) - 1)
+            steps.append((squarings + width, digit))
+            squarings = 0
+            i = j - 1
+        return steps, squarings
+
+    def power(self, base: int, modulus: int) -> int:
+        """
+        Compute ``base ** exponent mod modulus``.
+
+        Args:
+            base (int): The base
+            modulus (int): The modulus
+
+        Returns:
+            int: The result
+        """
+        base %= modulus
+        square = base * base % modulus
+        odd_powers = [base]
+        for _ in range(self.max_digit // 2):
+            odd_powers.append(odd_powers[-1] * square % modulus)
+
+        steps = iter(self.steps)
+        _, digit = next(steps)
+        result = odd_powers[digit >> 1]
+        for squarings, digit in steps:
+            for _ in range(squarings):
+                result = result * result % modulus
+            result = result * odd_powers[digit >> 1] % modulus
+        for _ in range(self.trailing_squarings):
+            result = result * result % modulus
+        return result
+
+
+def _builtin_backend(modulus: int, exponent: int) -> Callable[[int], int]:
+    """Prepare built-in ``pow``, which needs no per-key setup."""
+
+    def exponentiate_block(block_value: int) -> int:
+        return pow(block_value, exponent, modulus)
+
+    return exponentiate_block
+
+
+def _window_backend(modulus: int, exponent: int) -> Callable[[int], int]:
+    """Prepare the pure-Python sliding-window engine."""
+    if exponent == 0:
+        return _builtin_backend(modulus, exponent)
+    power = SlidingWindowPlan(exponent).power
+
+    def exponentiate_block(block_value: int) -> int:
+        return power(block_value, modulus)
+
+    return exponentiate_block
+
+
+def _gmpy2_backend(modulus: int, exponent: int) -> Callable[[int], int]:
+    """Prepare ``gmpy2.powmod`` with the modulus and exponent converted once."""
+    powmod = gmpy2.powmod
+    mpz_modulus = gmpy2.mpz(modulus)
+    mpz_exponent = gmpy2.mpz(exponent)
+
+    def exponentiate_block(block_value: int) -> int:
+        return int(powmod(block_value, mpz_exponent, mpz_modulus))
+
+    return exponentiate_block
+
+
+BACKENDS: Dict[str, Backend] = {
+    "builtin": _builtin_backend,
+    "window": _window_backend,
+}
+if gmpy2 is not None:
+    BACKENDS["gmpy2"] = _gmpy2_backend
+
+_default_backend = "gmpy2" if "gmpy2" in BACKENDS else "builtin"
+
+
+def register_backend(name: str, backend: Backend) -> None:
+    """
+    Add an exponentiation backend.
+
+    Args:
+        name (str): Name to select the backend by
+        backend (Callable): Function taking (modulus, exponent) and returning
+            a function that raises one block value to the exponent
+    """
+    BACKENDS[name] = backend
+    _prepare.cache_clear()
+
+
+def get_default_backend() -> str:
+    """Name of the backend used when none is given."""
+    return _default_backend
+
+
+def set_default_backend(name: str) -> None:
+    """
+    Select the backend used when none is given.
+
+    Args:
+        name (str): One of BACKENDS
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    global _default_backend
+    if name not in BACKENDS:
+        raise ValueError(f"Error: Unknown exponentiation backend '{name}'!")
+    _default_backend = name
+
+
+@lru_cache(maxsize=EXPONENTIATOR_CACHE_SIZE)
+def _prepare(
+    modulus: int, exponent: Union[int, PrivateKey], backend: str
+) -> Callable[[int], int]:
+    """Build (and cache) the block function for one key and backend."""
+    prepare = BACKENDS[backend]
+
+    if not isinstance(exponent, PrivateKey):
+        return prepare(modulus, exponent)
+
+    if backend == "builtin":
+        return exponent.decrypt_block
+
+    # CRT with the backend doing the two half-size exponentiations
+    power_p = prepare(exponent.p, exponent.dp)
+    power_q = prepare(exponent.q, exponent.dq)
+    p, q, qinv = exponent.p, exponent.q, exponent.qinv
+
+    def decrypt_block(block_value: int) -> int:
+        m_one = power_p(block_value % p)
+        m_two = power_q(block_value % q)
+        return m_two + (qinv * (m_one - m_two)) % p * q
+
+    return decrypt_block
+
+
+def make_exponentiator(
+    modulus: int, exponent: Union[int, PrivateKey], backend: Optional[str] = None
+) -> Callable[[int], int]:
+    """
+    Get the function that raises block values to a key's exponent.
+
+    Prepared functions are cached per key and backend, so the per-key setup
+    is shared by every block of a message and by later messages.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        exponent (int or PrivateKey): The exponent, or a PrivateKey to use
+            the CRT parameters
+        backend (str, optional): One of BACKENDS; defaults to gmpy2 when it
+            is installed, otherwise built-in pow
+
+    Returns:
+        Callable[[int], int]: Block transformation function
+
+    Raises:
+        ValueError: If the backend is not available
+    """
+    if backend is None:
+        backend = _default_backend
+    elif backend not in BACKENDS:
+        raise ValueError(f"Error: Unknown exponentiation backend '{backend}'!")
+    return _prepare(modulus, exponent, backend)
@@ -0,0 +1,213 @@
+"""
+Fiat Batch RSA Decryption
+This module decrypts several ciphertexts under one modulus with a single
+full-size exponentiation, when each was encrypted with a different small,
+pairwise coprime public exponent (see generate_key_family).
+
+For ciphertexts c_i = m_i ** e_i, a product tree combines them into
+(m_1 * ... * m_k) ** E with E = e_1 * ... * e_k, one E-th root is
+taken with the private key, and the tree is walked back down to split the
+product into the individual m_i using only small exponents.
+"""
+
+from collections import defaultdict, deque
+from math import gcd
+from typing import List, Optional, Sequence, Tuple
+
+from .codec import get_codec_context
+from .key_generation import PrivateKey
+
+
+class _Node:
+    """Product tree node: value = (product of subtree messages) ** exponent."""
+
+    __slots__ = ("exponent", "value", "left", "right")
+
+    def __init__(self, exponent, value, left=None, right=None):
+        self.exponent = exponent
+        self.value = value
+        self.left = left
+        self.right = right
+
+
+def _build_tree(exponents: Sequence[int], values: Sequence[int], modulus: int):
+    """Combine ciphertexts pairwise up to the root of the product tree."""
+    if len(exponents) == 1:
+        return _Node(exponents[0], values[0])
+
+    middle = len(exponents) // 2
+    left = _build_tree(exponents[:middle], values[:middle], modulus)
+    right = _build_tree(exponents[middle:], values[middle:], modulus)
+    value = (
+        pow(left.value, right.exponent, modulus)
+        * pow(right.value, left.exponent, modulus)
+        % modulus
+    )
+    return _Node(left.exponent * right.exponent, value, left, right)
+
+
+def _split_tree(node: _Node, message: int, modulus: int, results: List[int]) -> None:
+    """Split a subtree's message product into the leaf messages."""
+    if node.left is None:
+        results.append(message)
+        return
+
+    left, right = node.left, node.right
+    # X = 0 mod E_left and X = 1 mod E_right, so that
+    # message ** X = v_left ** (X / E_left) * m_right * v_right ** ((X-1) / E_right)
+    x = left.exponent * pow(left.exponent, -1, right.exponent)
+    known = (
+        pow(left.value, x // left.exponent, modulus)
+        * pow(right.value, (x - 1) // right.exponent, modulus)
+        % modulus
+    )
+    right_message = pow(message, x, modulus) * pow(known, -1, modulus) % modulus
+    left_message = message * pow(right_message, -1, modulus) % modulus
+
+    _split_tree(left, left_message, modulus, results)
+    _split_tree(right, right_message, modulus, results)
+
+
+def _root(private_key: PrivateKey, value: int, exponent: int) -> int:
+    """Take the exponent-th root of value with the CRT parameters."""
+    p, q = private_key.p, private_key.q
+    m_one = pow(value, pow(exponent, -1, p - 1), p)
+    m_two = pow(value, pow(exponent, -1, q - 1), q)
+    return m_two + (private_key.qinv * (m_one - m_two)) % p * q
+
+
+def fiat_decrypt_blocks(
+    private_key: PrivateKey, exponents: Sequence[int], block_values: Sequence[int]
+) -> List[int]:
+    """
+    Decrypt one batch of blocks, each under a different public exponent.
+
+    Args:
+        private_key (PrivateKey): Private key with the primes of the modulus
+        exponents (Sequence[int]): Pairwise coprime public exponents, one per
+            block
+        block_values (Sequence[int]): Encrypted blocks, each invertible
+            modulo n
+
+    Returns:
+        List[int]: Decrypted block values, in input order
+
+    Raises:
+        ValueError: If the exponents are not pairwise coprime or do not match
+            the blocks
+    """
+    if len(exponents) != len(block_values):
+        raise ValueError("Error: Need one public exponent per block!")
+    if not block_values:
+        return []
+
+    product = 1
+    for exponent in exponents:
+        if gcd(product, exponent) != 1:
+            raise ValueError("Error: Batch exponents must be pairwise coprime!")
+        product *= exponent
+
+    modulus = private_key.n
+    tree = _build_tree(exponents, block_values, modulus)
+    results = []
+    _split_tree(tree, _root(private_key, tree.value, tree.exponent), modulus, results)
+    return results
+
+
+def decrypt_family_blocks(
+    private_key: PrivateKey,
+    encrypted_blocks: Sequence[Tuple[int, int]],
+    batch_size: Optional[int] = None,
+) -> List[int]:
+    """
+    Decrypt blocks encrypted under a key family, batching where possible.
+
+    Each batch takes at most one block per public exponent. Blocks that
+    cannot be batched (left-over exponents, or values sharing a factor with
+    n such as 0) are decrypted one at a time.
+
+    Args:
+        private_key (PrivateKey): Private key from generate_key_family
+        encrypted_blocks (Sequence[Tuple[int, int]]): (public exponent,
+            encrypted block value) pairs
+        batch_size (int, optional): Most blocks per batch; defaults to the
+            number of distinct exponents
+
+    Returns:
+        List[int]: Decrypted block values, in input order
+
+    Raises:
+        ValueError: If batch_size is given and is less than 1
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError("Error: Batch size must be at least 1!")
+
+    modulus = private_key.n
+    results = [None] * len(encrypted_blocks)
+    queues = defaultdict(deque)
+
+    for position, (exponent, block_value) in enumerate(encrypted_blocks):
+        if gcd(block_value, modulus) == 1:
+            queues[exponent].append(position)
+        else:
+            results[position] = _root(private_key, block_value, exponent)
+
+    while queues:
+        exponents = list(queues)[:batch_size]
+        positions = [queues[exponent].popleft() for exponent in exponents]
+        for exponent in exponents:
+            if not queues[exponent]:
+                del queues[exponent]
+
+        block_values = [encrypted_blocks[position][1] for position in positions]
+        for position, value in zip(
+            positions, fiat_decrypt_blocks(private_key, exponents, block_values)
+        ):
+            results[position] = value
+    return results
+
+
+def decrypt_family(
+    alphabet: str,
+    private_key: PrivateKey,
+    encrypted_messages: Sequence[Tuple[int, str]],
+    batch_size: Optional[int] = None,
+) -> List[str]:
+    """
+    Decrypt messages encrypted under the public keys of a key family.
+
+    Args:
+        alphabet (str): The alphabet used for encoding
+        private_key (PrivateKey): Private key from generate_key_family
+        encrypted_messages (Sequence[Tuple[int, str]]): (public exponent,
+            encrypted message) pairs
+        batch_size (int, optional): Most blocks per batch
+
+    Returns:
+        List[str]: The decrypted messages, in input order
+
+    Raises:
+        ValueError: If decryption fails or input is invalid
+    """
+    context = get_codec_context(alphabet, private_key.n)
+
+    encrypted_blocks = []
+    block_counts = []
+    try:
+        for exponent, encrypted_message in encrypted_messages:
+            block_values = context.parse_ciphertext(encrypted_message)
+            encrypted_blocks.extend((exponent, value) for value in block_values)
+            block_counts.append(len(block_values))
+    except ValueError as e:
+        raise ValueError(f"Decryption failed: {str(e)}")
+
+    decrypted_values = decrypt_family_blocks(private_key, encrypted_blocks, batch_size)
+
+    decrypted_messages = []
+    position = 0
+    for count in block_counts:
+        decrypted_messages.append(
+            context.decode(decrypted_values[position : position + count])
+        )
+        position += count
+    return decrypted_messages
@@ -0,0 +1,153 @@
+"""
+Ciphertext Formats
+This module serializes encrypted block values as zero-padded decimal digits,
+as fixed-width big-endian binary blocks behind a small header, or as the
+base64 text of the binary form.
+"""
+
+import base64
+import binascii
+import struct
+from typing import List, Union
+
+CIPHERTEXT_FORMATS = ("decimal", "binary", "base64")
+
+# Binary header: magic, version, block width in bytes, key id
+BINARY_MAGIC = b"RSAB"
+BINARY_VERSION = 1
+KEY_ID_SIZE = 8
+_HEADER = struct.Struct(f">4sBH{KEY_ID_SIZE}s")
+HEADER_SIZE = _HEADER.size
+
+
+def key_id(modulus: int) -> bytes:
+    """
+    Derive a short identifier for a key from its modulus.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        bytes: The first KEY_ID_SIZE bytes of the SHA-256 of the modulus
+    """
+    import hashlib
+
+    modulus_bytes = modulus.to_bytes((modulus.bit_length() + 7) // 8, "big")
+    return hashlib.sha256(modulus_bytes).digest()[:KEY_ID_SIZE]
+
+
+def binary_block_size(modulus: int) -> int:
+    """
+    Calculate the width of one binary ciphertext block.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        int: Number of bytes needed for any value below the modulus
+    """
+    return (modulus.bit_length() + 7) // 8
+
+
+def check_binary_header(data: bytes, modulus: int) -> int:
+    """
+    Validate the header of binary ciphertext.
+
+    Args:
+        data (bytes): Binary ciphertext, or any buffer starting with it
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        int: The block width in bytes; blocks start at HEADER_SIZE
+
+    Raises:
+        ValueError: If the header is missing or malformed, or the ciphertext
+            was made with a different key
+    """
+    if len(data) < HEADER_SIZE:
+        raise ValueError("Error: Ciphertext is too short for its header!")
+
+    magic, version, width, data_key_id = _HEADER.unpack_from(data)
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError("Error: Not a binary RSA ciphertext!")
+    if data_key_id != key_id(modulus) or width != binary_block_size(modulus):
+        raise ValueError("Error: Ciphertext was encrypted with a different key!")
+    return width
+
+
+def pack_ciphertext(
+    block_values: List[int], modulus: int, output_format: str = "decimal"
+) -> Union[str, bytes]:
+    """
+    Serialize encrypted block values.
+
+    Args:
+        block_values (List[int]): The encrypted block values
+        modulus (int): The RSA modulus (n)
+        output_format (str): One of CIPHERTEXT_FORMATS
+
+    Returns:
+        str or bytes: Digits for "decimal", bytes for "binary", and text for
+            "base64"
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if output_format == "decimal":
+        width = len(str(modulus))
+        return "".join([str(block_value).zfill(width) for block_value in block_values])
+
+    if output_format not in CIPHERTEXT_FORMATS:
+        raise ValueError(f"Error: Unknown ciphertext format '{output_format}'!")
+
+    width = binary_block_size(modulus)
+    header = _HEADER.pack(BINARY_MAGIC, BINARY_VERSION, width, key_id(modulus))
+    data = header + b"".join(
+        [block_value.to_bytes(width, "big") for block_value in block_values]
+    )
+
+    if output_format == "base64":
+        return base64.b64encode(data).decode("ascii")
+    return data
+
+
+def unpack_ciphertext(
+    data: Union[str, bytes], modulus: int, input_format: str = "decimal"
+) -> List[int]:
+    """
+    Parse serialized ciphertext back into encrypted block values.
+
+    Args:
+        data (str or bytes): Ciphertext as produced by pack_ciphertext
+        modulus (int): The RSA modulus (n)
+        input_format (str): One of CIPHERTEXT_FORMATS
+
+    Returns:
+        List[int]: The encrypted block values
+
+    Raises:
+        ValueError: If the format is unknown, the data is malformed, or the
+            ciphertext was made with a different key
+    """
+    if input_format == "decimal":
+        width = len(str(modulus))
+        return [int(data[i : i + width]) for i in range(0, len(data), width)]
+
+    if input_format not in CIPHERTEXT_FORMATS:
+        raise ValueError(f"Error: Unknown ciphertext format '{input_format}'!")
+
+    if input_format == "base64":
+        try:
+            data = base64.b64decode(data, validate=True)
+        except binascii.Error as e:
+            raise ValueError(f"Error: Invalid base64 ciphertext: {e}")
+
+    width = check_binary_header(data, modulus)
+    if (len(data) - HEADER_SIZE) % width:
+        raise ValueError("Error: Ciphertext is truncated!")
+
+    view = memoryview(data)
+    return [
+        int.from_bytes(view[i : i + width], "big")
+        for i in range(HEADER_SIZE, len(data), width)
+    ]
@@ -0,0 +1,208 @@
+"""
+Stage Timing Instrumentation
+This module records where encryption and decryption spend their time, split
+into stages, with block and byte counts, and exports the totals as JSON or
+in the Prometheus text format.
+
+Recording is opt-in. While no recorder is active, the codec only checks
+``instrumentation.active`` once per call and runs its normal path.
+
+Stages:
+    encode        alphabet mapping, chunking and int() of the plaintext
+    parse         chunking and int() of the ciphertext
+    exponentiate  modular exponentiation of every block
+    format        str() and zero padding of the encrypted blocks
+    decode        str() and alphabet mapping of the decrypted blocks
+
+RSACodec records them, and so everything built on it: rsa_encrypt,
+rsa_decrypt, the streaming functions and the binary formats.
+
+Byte counts are the characters of text going into or out of a stage, which
+equal bytes for ASCII alphabets. Work done in other processes (batch
+workers, the socket service's executor) is not recorded.
+
+Example:
+    with record_stages() as recorder:
+        rsa_encrypt(alphabet, n, e, message)
+    print(recorder.to_prometheus())
+"""
+
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+# The recorder that codec calls report to, or None when disabled
+active = None
+
+STAGES = ("encode", "parse", "exponentiate", "format", "decode")
+
+# Prometheus metrics: counter field -> (metric suffix, help text)
+_METRICS = {
+    "calls": ("calls_total", "Number of times each stage ran."),
+    "seconds": ("seconds_total", "Wall time spent in each stage."),
+    "blocks": ("blocks_total", "Blocks processed by each stage."),
+    "bytes": ("bytes_total", "Text bytes processed by each stage."),
+}
+
+
+class StageStats:
+    """Running totals for one stage."""
+
+    __slots__ = ("calls", "seconds", "blocks", "bytes")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.blocks = 0
+        self.bytes = 0
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class Recorder:
+    """
+    Collects per-stage timings, and passes each one on to registered hooks.
+
+    Hooks are called as ``hook(stage, seconds, blocks, size)`` after every
+    recorded stage, e.g. to feed a histogram or log slow calls.
+    """
+
+    def __init__(self, hooks: Optional[List[Callable]] = None):
+        """
+        Args:
+            hooks (List[Callable], optional): Hooks to call for every record
+        """
+        self.stages: Dict[str, StageStats] = {}
+        self.hooks = list(hooks or [])
+
+    def add_hook(self, hook: Callable) -> None:
+        """
+        Register a hook called as hook(stage, seconds, blocks, size).
+
+        Args:
+            hook (Callable): The hook
+        """
+        self.hooks.append(hook)
+
+    def record(self, stage: str, seconds: float, blocks: int = 0, size: int = 0):
+        """
+        Add one timing to a stage.
+
+        Args:
+            stage (str): Stage name, see STAGES
+            seconds (float): Wall time spent
+            blocks (int): Blocks processed
+            size (int): Bytes of text processed
+        """
+        stats = self.stages.get(stage)
+        if stats is None:
+            stats = self.stages[stage] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.blocks += blocks
+        stats.bytes += size
+        for hook in self.hooks:
+            hook(stage, seconds, blocks, size)
+
+    def reset(self) -> None:
+        """Clear all totals."""
+        self.stages.clear()
+
+    def to_dict(self) -> dict:
+        """
+        Totals per stage, in STAGES order.
+
+        Returns:
+            dict: {stage: {"calls", "seconds", "blocks", "bytes"}}
+        """
+        return {
+            stage: self.stages[stage].to_dict()
+            for stage in sorted(self.stages, key=_stage_order)
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Totals per stage as a JSON document."""
+        import json
+
+        return json.dumps({"stages": self.to_dict()}, indent=indent)
+
+    def to_prometheus(self, prefix: str = "rsa_stage") -> str:
+        """
+        Totals per stage in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix
+
+        Returns:
+            str: One counter family per field, labelled by stage
+        """
+        stages = self.to_dict()
+        lines = []
+        for field, (suffix, help_text) in _METRICS.items():
+            name = f"{prefix}_{suffix}"
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for stage, stats in stages.items():
+                lines.append(f'{name}{{stage="{stage}"}} {stats[field]}')
+        return "\n".join(lines) + "\n"
+
+    def format_table(self) -> str:
+        """Totals per stage as a human-readable table with time shares."""
+        stages = self.to_dict()
+        total = sum(stats["seconds"] for stats in stages.values()) or 1.0
+        lines = [f"{'stage':<13} {'calls':>6} {'ms':>10} {'share':>6} {'blocks':>8}"]
+        for stage, stats in stages.items():
+            lines.append(
+                f"{stage:<13} {stats['calls']:>6} {stats['seconds'] * 1000:>10.3f} "
+                f"{stats['seconds'] / total:>6.1%} {stats['blocks']:>8}"
+            )
+        return "\n".join(lines)
+
+
+def _stage_order(stage: str) -> tuple:
+    """Sort known stages in pipeline order, then others by name."""
+    return (STAGES.index(stage), "") if stage in STAGES else (len(STAGES), stage)
+
+
+def enable(recorder: Optional[Recorder] = None) -> Recorder:
+    """
+    Start recording codec stages.
+
+    Args:
+        recorder (Recorder, optional): Recorder to report to; a new one by
+            default
+
+    Returns:
+        Recorder: The active recorder
+    """
+    global active
+    active = recorder if recorder is not None else Recorder()
+    return active
+
+
+def disable() -> None:
+    """Stop recording codec stages."""
+    global active
+    active = None
+
+
+@contextmanager
+def record_stages(recorder: Optional[Recorder] = None) -> Iterator[Recorder]:
+    """
+    Record codec stages within a ``with`` block.
+
+    The previously active recorder, if any, is restored on exit.
+
+    Args:
+        recorder (Recorder, optional): Recorder to report to; a new one by
+            default
+
+    Yields:
+        Recorder: The active recorder
+    """
+    global active
+    previous = active
+    try:
+        yield enable(recorder)
+    finally:
+        active = previous
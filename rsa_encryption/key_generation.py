@@ -1,9 +1,17 @@
 """
 RSA Key Generation
-This module generates a pair of RSA keys using precomputed prime numbers.
-The primes are chosen to be large enough to handle our maximum message size.
+This module generates a pair of RSA keys, either from precomputed prime
+numbers or from freshly generated large primes of a requested size.
 """
 
+from typing import Optional
+
+# Standard RSA public exponent
+PUBLIC_EXPONENT = 65537
+
+# Smallest modulus size accepted by generate_keys(bits=...)
+MIN_KEY_BITS = 32
+
 # Larger prime numbers for better block handling
 PRIME_NUMBERS = [
     32749,
@@ -55,33 +63,259 @@ def gcd(a: int, b: int) -> int:
     return a
 
 
-def generate_keys() -> tuple:
+class PrivateKey(tuple):
+    """
+    RSA private key carrying the Chinese Remainder Theorem parameters.
+
+    The key unpacks and compares exactly like the legacy ``(n, d)`` tuple, so
+    existing code such as ``_, d = private_key`` keeps working, while
+    decryption can use the precomputed ``p``, ``q``, ``dP``, ``dQ`` and
+    ``qInv`` values to replace one full-size exponentiation with two
+    half-size ones.
+    """
+
+    def __new__(
+        cls,
+        modulus: int,
+        private_exp: int,
+        prime_one: int,
+        prime_two: int,
+        exp_one: int,
+        exp_two: int,
+        coefficient: int,
+    ):
+        key = super().__new__(cls, (modulus, private_exp))
+        key.n = modulus
+        key.d = private_exp
+        key.p = prime_one
+        key.q = prime_two
+        key.dp = exp_one
+        key.dq = exp_two
+        key.qinv = coefficient
+        return key
+
+    def __getnewargs__(self):
+        return (self.n, self.d, self.p, self.q, self.dp, self.dq, self.qinv)
+
+    @classmethod
+    def from_primes(
+        cls, prime_one: int, prime_two: int, private_exp: int
+    ) -> "PrivateKey":
+        """
+        Build a private key, deriving the CRT parameters from the primes.
+
+        Args:
+            prime_one (int): First prime factor of the modulus (p)
+            prime_two (int): Second prime factor of the modulus (q)
+            private_exp (int): The RSA private exponent (d)
+
+        Returns:
+            PrivateKey: Private key with precomputed CRT parameters
+        """
+        return cls(
+            prime_one * prime_two,
+            private_exp,
+            prime_one,
+            prime_two,
+            private_exp % (prime_one - 1),
+            private_exp % (prime_two - 1),
+            pow(prime_two, -1, prime_one),
+        )
+
+    def decrypt_block(self, block_value: int) -> int:
+        """
+        Compute ``block_value ** d mod n`` using the CRT parameters.
+
+        Args:
+            block_value (int): Encrypted block value
+
+        Returns:
+            int: Decrypted block value
+        """
+        m_one = pow(block_value, self.dp, self.p)
+        m_two = pow(block_value, self.dq, self.q)
+        return m_two + (self.qinv * (m_one - m_two)) % self.p * self.q
+
+
+def keys_to_dict(public_key: tuple, private_key: tuple) -> dict:
+    """
+    Serialize a key pair to the JSON structure used by key files.
+
+    Args:
+        public_key (tuple): Public key (n, e)
+        private_key (tuple): Private key (n, d) or PrivateKey
+
+    Returns:
+        dict: JSON-serializable key data
+    """
+    private_data = {"n": private_key[0], "d": private_key[1]}
+    if isinstance(private_key, PrivateKey):
+        private_data.update(
+            {
+                "p": private_key.p,
+                "q": private_key.q,
+                "dp": private_key.dp,
+                "dq": private_key.dq,
+                "qinv": private_key.qinv,
+            }
+        )
+
+    return {
+        "public_key": {"n": public_key[0], "e": public_key[1]},
+        "private_key": private_data,
+    }
+
+
+def private_key_from_dict(private_data: dict) -> tuple:
+    """
+    Load a private key from key file data.
+
+    Key files written before CRT support only hold ``n`` and ``d``; those
+    load as a plain ``(n, d)`` tuple.
+
+    Args:
+        private_data (dict): The ``private_key`` section of a key file
+
+    Returns:
+        tuple: PrivateKey if CRT parameters are present, otherwise (n, d)
+    """
+    if all(field in private_data for field in ("p", "q", "dp", "dq", "qinv")):
+        return PrivateKey(
+            private_data["n"],
+            private_data["d"],
+            private_data["p"],
+            private_data["q"],
+            private_data["dp"],
+            private_data["dq"],
+            private_data["qinv"],
+        )
+    return (private_data["n"], private_data["d"])
+
+
+def keys_from_dict(keys_data: dict) -> tuple:
+    """
+    Load a key pair from the JSON structure used by key files.
+
+    Args:
+        keys_data (dict): Key data as written by keys_to_dict
+
+    Returns:
+        tuple: ((n, e), private_key) - see private_key_from_dict
+    """
+    public_data = keys_data["public_key"]
+    return (
+        (public_data["n"], public_data["e"]),
+        private_key_from_dict(keys_data["private_key"]),
+    )
+
+
+def generate_keys(bits: Optional[int] = None) -> tuple:
     """
     Generate RSA key pair using randomly selected prime numbers.
-    This provides variation in key sizes while maintaining security.
+
+    Without a size, the primes are picked from PRIME_NUMBERS, giving a
+    modulus of about 30 bits. With a size, two fresh primes are generated so
+    that the modulus has exactly that many bits.
+
+    Args:
+        bits (int, optional): Modulus size in bits, e.g. 1024, 2048 or 4096
 
     Returns:
-        tuple: ((n, e), (n, d)) - public and private key pairs
+        tuple: ((n, e), PrivateKey) - public key and private key; the
+            private key unpacks like the (n, d) tuple
+
+    Raises:
+        ValueError: If bits is below MIN_KEY_BITS
     """
-    import random
+    import secrets
 
-    # Randomly select two different primes
-    selected_primes = random.sample(PRIME_NUMBERS, 2)
-    prime_one, prime_two = selected_primes
+    # Use standard RSA public exponent
+    public_exp = PUBLIC_EXPONENT
 
-    # Calculate modulus n (approximately 1.09 billion)
-    modulus = prime_one * prime_two
+    if bits is None:
+        # Randomly select two different primes
+        selected_primes = secrets.SystemRandom().sample(PRIME_NUMBERS, 2)
+        prime_one, prime_two = selected_primes
+    else:
+        prime_one, prime_two = _generate_prime_pair(bits, public_exp)
 
     # Calculate Euler's totient
     totient = (prime_one - 1) * (prime_two - 1)
 
-    # Use standard RSA public exponent
-    public_exp = 65537
-
     # Calculate private exponent
     private_exp = pow(public_exp, -1, totient)
 
-    return (modulus, public_exp), (modulus, private_exp)
+    # PrivateKey derives the modulus n = p * q along with the CRT parameters
+    private_key = PrivateKey.from_primes(prime_one, prime_two, private_exp)
+    return (private_key.n, public_exp), private_key
+
+
+def generate_key_family(count: int, bits: Optional[int] = None) -> tuple:
+    """
+    Generate one modulus with a family of small public exponents.
+
+    The exponents are the smallest odd primes coprime to the totient, so
+    they are pairwise coprime, as Fiat batch decryption requires. Small
+    exponents are only safe with randomized padding; like the rest of this
+    package, this is for experimentation.
+
+    Args:
+        count (int): Number of public exponents
+        bits (int, optional): Modulus size in bits, see generate_keys
+
+    Returns:
+        tuple: (public_keys, private_key) - a list of (n, e) pairs, one per
+            exponent, and a PrivateKey whose primes decrypt for all of them
+
+    Raises:
+        ValueError: If count is not positive or bits is below MIN_KEY_BITS
+    """
+    from .primes import SMALL_PRIMES
+
+    if count < 1:
+        raise ValueError("Error: Key family needs at least one exponent!")
+
+    _, private_key = generate_keys(bits)
+    totient = (private_key.p - 1) * (private_key.q - 1)
+
+    exponents = []
+    for prime in SMALL_PRIMES[1:]:
+        if totient % prime:
+            exponents.append(prime)
+            if len(exponents) == count:
+                break
+    else:
+        raise ValueError(f"Error: Could not find {count} small public exponents!")
+
+    return [(private_key.n, exponent) for exponent in exponents], private_key
+
+
+def _generate_prime_pair(bits: int, public_exp: int) -> tuple:
+    """
+    Generate two distinct primes whose product has exactly ``bits`` bits.
+
+    Args:
+        bits (int): Modulus size in bits
+        public_exp (int): Public exponent that must be invertible
+
+    Returns:
+        tuple: (p, q) - the two primes
+
+    Raises:
+        ValueError: If bits is below MIN_KEY_BITS
+    """
+    from .primes import generate_prime
+
+    if bits < MIN_KEY_BITS:
+        raise ValueError(f"Error: Key size must be at least {MIN_KEY_BITS} bits!")
+
+    while True:
+        prime_one = generate_prime(bits - bits // 2)
+        prime_two = generate_prime(bits // 2)
+        if prime_one == prime_two:
+            continue
+        if gcd(public_exp, (prime_one - 1) * (prime_two - 1)) == 1:
+            return prime_one, prime_two
 
 
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+"""
+RSA Key Pool
+This module keeps a bounded queue of ready key pairs, refilled in the
+background by worker processes, so callers can take a fresh key pair
+without waiting for prime generation.
+"""
+
+import json
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import List, Optional
+
+from .key_generation import generate_keys, keys_from_dict, keys_to_dict
+
+
+def generate_keys_many(
+    count: int, bits: Optional[int] = None, workers: Optional[int] = None
+) -> List[tuple]:
+    """
+    Generate several key pairs in parallel.
+
+    Args:
+        count (int): Number of key pairs to generate
+        bits (int, optional): Modulus size in bits, see generate_keys
+        workers (int, optional): Number of worker processes; defaults to the
+            CPU count. Values of 1 or less generate in-process.
+
+    Returns:
+        List[tuple]: ((n, e), private_key) pairs
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or count <= 1:
+        return [generate_keys(bits) for _ in range(count)]
+
+    with ProcessPoolExecutor(max_workers=min(workers, count)) as executor:
+        return list(executor.map(generate_keys, repeat(bits, count)))
+
+
+def save_keys(key_pairs: List[tuple], path: str) -> None:
+    """
+    Save key pairs to a JSON file as a list of key file entries.
+
+    Args:
+        key_pairs (List[tuple]): ((n, e), private_key) pairs
+        path (str): Output file
+    """
+    with open(path, "w") as f:
+        json.dump([keys_to_dict(*key_pair) for key_pair in key_pairs], f, indent=2)
+
+
+def load_keys(path: str) -> List[tuple]:
+    """
+    Load key pairs written by save_keys.
+
+    Args:
+        path (str): Input file
+
+    Returns:
+        List[tuple]: ((n, e), private_key) pairs
+    """
+    with open(path, "r") as f:
+        return [keys_from_dict(keys_data) for keys_data in json.load(f)]
+
+
+class KeyPool:
+    """
+    Bounded pool of pre-generated key pairs.
+
+    When the number of ready and in-flight key pairs drops below
+    ``low_water``, background worker processes generate enough new pairs to
+    bring it back up to ``high_water``. Taking a key pair from the pool is
+    O(1) as long as it is not empty.
+
+    Example:
+        with KeyPool(bits=2048, low_water=8, high_water=32) as pool:
+            public_key, private_key = pool.get()
+    """
+
+    def __init__(
+        self,
+        bits: Optional[int] = None,
+        low_water: int = 16,
+        high_water: int = 64,
+        workers: Optional[int] = None,
+    ):
+        """
+        Create a key pool; call start() (or use it as a context manager)
+        to begin filling it.
+
+        Args:
+            bits (int, optional): Modulus size in bits, see generate_keys
+            low_water (int): Refill when fewer key pairs than this remain
+            high_water (int): Maximum number of ready key pairs
+            workers (int, optional): Number of worker processes; defaults to
+                the CPU count
+
+        Raises:
+            ValueError: If the water marks are inconsistent
+        """
+        if high_water < 1 or not 0 <= low_water <= high_water:
+            raise ValueError("Error: Water marks must satisfy 0 <= low <= high!")
+
+        self.bits = bits
+        self.low_water = low_water
+        self.high_water = high_water
+        self.workers = workers or os.cpu_count() or 1
+
+        self._ready = deque()
+        # Reentrant, as done callbacks may run inline while _refill holds it
+        self._lock = threading.RLock()
+        # Notified when a key pair is added, a worker fails or the pool closes
+        self._changed = threading.Condition(self._lock)
+        self._pending = set()
+        self._executor = None
+        self._closed = False
+        self._error = None
+
+    def __enter__(self) -> "KeyPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of key pairs ready to be handed out."""
+        with self._lock:
+            return len(self._ready)
+
+    def start(self) -> None:
+        """Start the worker processes and fill the pool up to high_water."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            self._closed = False
+            self._error = None
+        self._refill(self.high_water)
+
+    def get(self, timeout: Optional[float] = None) -> tuple:
+        """
+        Take a key pair from the pool.
+
+        Args:
+            timeout (float, optional): Seconds to wait if the pool is empty;
+                waits indefinitely by default
+
+        Returns:
+            tuple: ((n, e), private_key)
+
+        Raises:
+            queue.Empty: If no key pair became ready within the timeout, or
+                the pool is empty and not started
+            Exception: The error of a failed worker, if the pool is empty
+        """
+        self._refill(self.low_water)
+        with self._changed:
+            self._changed.wait_for(self._can_take, timeout)
+            if self._ready:
+                key_pair = self._ready.popleft()
+            elif self._error is not None:
+                raise self._error
+            else:
+                raise queue.Empty
+        self._refill(self.low_water)
+        return key_pair
+
+    def close(self) -> None:
+        """Stop the worker processes, discarding key pairs not yet started."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+            pending = list(self._pending)
+            self._changed.notify_all()
+
+        if executor is not None:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def save(self, path: str) -> None:
+        """
+        Save the ready key pairs so a restarted service can reuse them.
+
+        The key pairs stay in this pool; save on shutdown, after close().
+
+        Args:
+            path (str): Output file
+        """
+        with self._lock:
+            key_pairs = list(self._ready)
+        save_keys(key_pairs, path)
+
+    def load(self, path: str) -> int:
+        """
+        Add key pairs saved by save() to the pool.
+
+        The file is removed once loaded so no key pair is handed out twice.
+        Key pairs beyond high_water are discarded.
+
+        Args:
+            path (str): Input file
+
+        Returns:
+            int: Number of key pairs added
+        """
+        key_pairs = load_keys(path)
+        with self._changed:
+            added = max(0, min(len(key_pairs), self.high_water - len(self._ready)))
+            self._ready.extend(key_pairs[:added])
+            self._changed.notify_all()
+        os.remove(path)
+        return added
+
+    def _refill(self, threshold: int) -> None:
+        """Queue background generation if ready plus in-flight < threshold."""
+        with self._lock:
+            if self._executor is None or self._closed or self._error is not None:
+                return
+            in_stock = len(self._ready) + len(self._pending)
+            if in_stock >= threshold:
+                return
+            for _ in range(self.high_water - in_stock):
+                future = self._executor.submit(generate_keys, self.bits)
+                self._pending.add(future)
+                future.add_done_callback(self._on_generated)
+
+    def _can_take(self) -> bool:
+        """Whether get() can return or raise without waiting."""
+        return bool(self._ready) or self._error is not None or self._executor is None
+
+    def _on_generated(self, future) -> None:
+        """Move a finished key pair from the workers into the pool."""
+        with self._changed:
+            self._pending.discard(future)
+            if self._closed or future.cancelled():
+                return
+            # A failed worker stops refilling, as retrying would fail again
+            error = future.exception()
+            if error is not None:
+                self._error = error
+            elif len(self._ready) < self.high_water:
+                self._ready.append(future.result())
+            self._changed.notify_all()
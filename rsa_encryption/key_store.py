@@ -0,0 +1,208 @@
+"""
+RSA Key Store
+This module keeps many key pairs in one indexed SQLite file, looked up by
+key id, with an in-memory LRU of parsed key objects so hot keys skip the
+database and JSON parsing entirely.
+"""
+
+import json
+import sqlite3
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from .formats import key_id as modulus_key_id
+from .key_generation import keys_to_dict, private_key_from_dict
+
+# Number of parsed key pairs kept in memory by default
+KEY_CACHE_SIZE = 1024
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS keys (key_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+)
+
+
+def default_key_id(public_key: tuple) -> str:
+    """
+    Derive a key id from the modulus.
+
+    Args:
+        public_key (tuple): Public key (n, e)
+
+    Returns:
+        str: Hex id matching the key id in binary ciphertext headers
+    """
+    return modulus_key_id(public_key[0]).hex()
+
+
+def _key_data(public_key: tuple, private_key: Optional[tuple]) -> str:
+    """Serialize a key pair, or a public key alone, to key file JSON."""
+    if private_key is None:
+        keys_data = {"public_key": {"n": public_key[0], "e": public_key[1]}}
+    else:
+        keys_data = keys_to_dict(public_key, private_key)
+    return json.dumps(keys_data, separators=(",", ":"))
+
+
+class KeyStore:
+    """
+    Indexed store of key pairs in a single SQLite file.
+
+    Lookups by key id hit an in-memory LRU of parsed key pairs (with their
+    CRT parameters) first, and fall back to an indexed SQLite query.
+
+    Example:
+        with KeyStore("keys.db") as store:
+            store.add(generate_keys(2048), "tenant-42")
+            public_key, private_key = store.get("tenant-42")
+    """
+
+    def __init__(self, path: str, cache_size: int = KEY_CACHE_SIZE):
+        """
+        Open (or create) a key store.
+
+        Args:
+            path (str): SQLite database file
+            cache_size (int): Number of parsed key pairs kept in memory
+        """
+        self.path = path
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def __enter__(self) -> "KeyStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of stored key pairs."""
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM keys").fetchone()
+        return count
+
+    def __contains__(self, key_id: str) -> bool:
+        if key_id in self._cache:
+            return True
+        row = self._connection.execute(
+            "SELECT 1 FROM keys WHERE key_id = ?", (key_id,)
+        ).fetchone()
+        return row is not None
+
+    def close(self) -> None:
+        """Close the database."""
+        self._connection.close()
+        self._cache.clear()
+
+    def add(self, key_pair: tuple, key_id: Optional[str] = None) -> str:
+        """
+        Store a key pair, replacing any pair with the same id.
+
+        Args:
+            key_pair (tuple): ((n, e), private_key); private_key may be None
+                for an encrypt-only public key
+            key_id (str, optional): Id to store it under; derived from the
+                modulus by default
+
+        Returns:
+            str: The key id
+        """
+        (key_id,) = self.add_many([key_pair], None if key_id is None else [key_id])
+        return key_id
+
+    def add_many(
+        self, key_pairs: Iterable[tuple], key_ids: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Store many key pairs in one transaction.
+
+        Args:
+            key_pairs (Iterable[tuple]): ((n, e), private_key) pairs
+            key_ids (Iterable[str], optional): Ids, one per pair; derived from
+                the moduli by default
+
+        Returns:
+            List[str]: The key ids, in input order
+        """
+        key_pairs = list(key_pairs)
+        if key_ids is None:
+            key_ids = [default_key_id(public_key) for public_key, _ in key_pairs]
+        else:
+            key_ids = list(key_ids)
+            if len(key_ids) != len(key_pairs):
+                raise ValueError("Error: Need one key id per key pair!")
+
+        rows = [
+            (key_id, _key_data(*key_pair))
+            for key_id, key_pair in zip(key_ids, key_pairs)
+        ]
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO keys (key_id, data) VALUES (?, ?)", rows
+            )
+        for key_id in key_ids:
+            self._cache.pop(key_id, None)
+        return key_ids
+
+    def get(self, key_id: str) -> Tuple[tuple, Optional[tuple]]:
+        """
+        Look up a key pair by id.
+
+        Args:
+            key_id (str): The key id
+
+        Returns:
+            tuple: ((n, e), private_key); private_key is a PrivateKey when the
+                CRT parameters are stored, (n, d) otherwise, or None for a
+                public key alone
+
+        Raises:
+            KeyError: If no key pair has this id
+        """
+        key_pair = self._cache.get(key_id)
+        if key_pair is not None:
+            self._cache.move_to_end(key_id)
+            return key_pair
+
+        row = self._connection.execute(
+            "SELECT data FROM keys WHERE key_id = ?", (key_id,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key_id)
+
+        keys_data = json.loads(row[0])
+        public_data = keys_data["public_key"]
+        private_data = keys_data.get("private_key")
+        key_pair = (
+            (public_data["n"], public_data["e"]),
+            None if private_data is None else private_key_from_dict(private_data),
+        )
+
+        self._cache[key_id] = key_pair
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return key_pair
+
+    def remove(self, key_id: str) -> None:
+        """
+        Delete a key pair.
+
+        Args:
+            key_id (str): The key id
+
+        Raises:
+            KeyError: If no key pair has this id
+        """
+        with self._connection:
+            cursor = self._connection.execute(
+                "DELETE FROM keys WHERE key_id = ?", (key_id,)
+            )
+        self._cache.pop(key_id, None)
+        if not cursor.rowcount:
+            raise KeyError(key_id)
+
+    def key_ids(self) -> List[str]:
+        """All stored key ids, in sorted order."""
+        rows = self._connection.execute("SELECT key_id FROM keys ORDER BY key_id")
+        return [key_id for (key_id,) in rows]
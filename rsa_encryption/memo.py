@@ -0,0 +1,217 @@
+"""
+Ciphertext Memoization
+This module caches exponentiated blocks, keyed on (modulus, exponent,
+block value), and whole messages, keyed on a hash of the message, so that
+repeated traffic skips ``pow()``. The scheme is deterministic, so a cached
+result is always the one a fresh computation would give.
+
+Pass a MemoCache to RSACodec, rsa_encrypt or rsa_decrypt to use it. The
+cache is not thread-safe; give each thread its own.
+"""
+
+import sys
+from collections import OrderedDict
+from typing import Callable, Hashable, List, Optional, Sequence
+
+# Default memory cap, in bytes
+MEMO_MAX_BYTES = 64 * 1024 * 1024
+
+# Approximate bytes an entry costs beyond its values: the dict slot, the key
+# and value tuples, and the linked list node of the OrderedDict
+_ENTRY_OVERHEAD = 200
+
+# Size of the message hash used as the whole-message key
+_DIGEST_SIZE = 16
+
+
+def message_digest(text: str) -> bytes:
+    """
+    Hash a message or ciphertext for the whole-message cache.
+
+    Args:
+        text (str): The message
+
+    Returns:
+        bytes: 128-bit BLAKE2b digest
+    """
+    import hashlib
+
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=_DIGEST_SIZE).digest()
+
+
+class MemoCache:
+    """
+    Bounded LRU cache of exponentiated blocks and whole messages.
+
+    Block and message entries share one least-recently-used order and one
+    size budget: once either ``max_entries`` or the approximate
+    ``max_bytes`` is exceeded, the oldest entries are evicted.
+
+    Example:
+        cache = MemoCache(max_bytes=16 * 1024 * 1024)
+        for record in records:
+            encrypted = rsa_encrypt(alphabet, n, e, record, cache=cache)
+        print(cache.stats())
+    """
+
+    def __init__(
+        self, max_entries: Optional[int] = None, max_bytes: int = MEMO_MAX_BYTES
+    ):
+        """
+        Create an empty cache.
+
+        Args:
+            max_entries (int, optional): Most entries kept; unlimited by
+                default
+            max_bytes (int): Approximate memory cap, in bytes
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if (max_entries is not None and max_entries < 1) or max_bytes < 1:
+            raise ValueError("Error: Cache limits must be positive!")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self.block_hits = 0
+        self.block_misses = 0
+        self.message_hits = 0
+        self.message_misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept."""
+        self._entries.clear()
+        self.size = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of blocks that skipped exponentiation."""
+        lookups = self.block_hits + self.block_misses
+        return self.block_hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        """
+        Counters and current size.
+
+        Returns:
+            dict: Hits, misses and evictions, entries, bytes and hit rate
+        """
+        return {
+            "block_hits": self.block_hits,
+            "block_misses": self.block_misses,
+            "message_hits": self.message_hits,
+            "message_misses": self.message_misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hit_rate": self.hit_rate,
+        }
+
+    def exponentiate(
+        self,
+        modulus: int,
+        exponent: int,
+        block_values: Sequence[int],
+        exponentiate_many: Callable[[List[int]], Sequence[int]],
+    ) -> List[int]:
+        """
+        Exponentiate blocks, computing only those not cached.
+
+        Misses are de-duplicated and passed to ``exponentiate_many`` in one
+        call, so repeats within a message are computed once too.
+
+        Args:
+            modulus (int): The RSA modulus (n)
+            exponent (int): The exponent, identifying the key with the modulus
+            block_values (Sequence[int]): Block values to transform
+            exponentiate_many (Callable): Computes a list of block values
+
+        Returns:
+            List[int]: Transformed block values, in input order
+        """
+        entries = self._entries
+        results = []
+        missing = {}
+
+        for position, block_value in enumerate(block_values):
+            key = (modulus, exponent, block_value)
+            entry = entries.get(key)
+            if entry is None:
+                missing.setdefault(block_value, []).append(position)
+                results.append(None)
+            else:
+                entries.move_to_end(key)
+                results.append(entry[0])
+
+        # A repeat of a missing block within the same call still skips pow()
+        self.block_hits += len(results) - len(missing)
+        self.block_misses += len(missing)
+        if not missing:
+            return results
+
+        missing_values = list(missing)
+        for block_value, result in zip(
+            missing_values, exponentiate_many(missing_values)
+        ):
+            for position in missing[block_value]:
+                results[position] = result
+            self._store(
+                (modulus, exponent, block_value),
+                result,
+                sys.getsizeof(block_value) + sys.getsizeof(result),
+            )
+        return results
+
+    def get_message(self, key: Hashable) -> Optional[str]:
+        """
+        Look up a whole-message result.
+
+        Args:
+            key (Hashable): Key from RSACodec, including the message digest
+
+        Returns:
+            str: The cached result, or None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.message_misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.message_hits += 1
+        return entry[0]
+
+    def put_message(self, key: Hashable, result: str) -> None:
+        """
+        Store a whole-message result.
+
+        Args:
+            key (Hashable): Key from RSACodec, including the message digest
+            result (str): The encrypted or decrypted message
+        """
+        self._store(key, result, _DIGEST_SIZE + sys.getsizeof(result))
+
+    def _store(self, key: Hashable, value, value_size: int) -> None:
+        """Add an entry and evict the oldest ones beyond the limits."""
+        entries = self._entries
+        size = _ENTRY_OVERHEAD + value_size
+        if size > self.max_bytes:
+            return
+
+        previous = entries.pop(key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        entries[key] = (value, size)
+        self.size += size
+
+        while self.size > self.max_bytes or (
+            self.max_entries is not None and len(entries) > self.max_entries
+        ):
+            _, (_, old_size) = entries.popitem(last=False)
+            self.size -= old_size
+            self.evictions += 1
@@ -0,0 +1,132 @@
+"""
+Montgomery Batch Exponentiation
+This module raises a whole vector of block values to the same exponent under
+the same modulus, keeping them in Montgomery form and stepping them through
+one precomputed sliding-window scan of the exponent together.
+"""
+
+from typing import List, Optional, Sequence, Union
+
+from .exponentiation import SlidingWindowPlan
+from .key_generation import PrivateKey
+
+
+class MontgomeryContext:
+    """
+    Montgomery arithmetic for one odd modulus.
+
+    With R = 2**k > modulus, a value x is stored as x * R mod modulus, and
+    products are reduced with shifts and masks instead of division.
+    """
+
+    def __init__(self, modulus: int):
+        """
+        Args:
+            modulus (int): An odd modulus greater than 1
+
+        Raises:
+            ValueError: If the modulus is even or less than 3
+        """
+        if modulus < 3 or modulus % 2 == 0:
+            raise ValueError("Error: Montgomery form needs an odd modulus > 1!")
+
+        self.modulus = modulus
+        self.shift = modulus.bit_length()
+        self.mask = (1 << self.shift) - 1
+        # -modulus^-1 mod R
+        self.inverse = -pow(modulus, -1, 1 << self.shift) & self.mask
+        self.r_squared = pow(1 << self.shift, 2, modulus)
+
+    def reduce(self, value: int) -> int:
+        """
+        Montgomery reduction: value * R^-1 mod modulus, for value < modulus * R.
+
+        Args:
+            value (int): The value to reduce
+
+        Returns:
+            int: The reduced value
+        """
+        factor = ((value & self.mask) * self.inverse) & self.mask
+        value = (value + factor * self.modulus) >> self.shift
+        return value - self.modulus if value >= self.modulus else value
+
+    def to_montgomery(self, value: int) -> int:
+        """Convert a value below the modulus into Montgomery form."""
+        return self.reduce(value * self.r_squared)
+
+    def from_montgomery(self, value: int) -> int:
+        """Convert a value out of Montgomery form."""
+        return self.reduce(value)
+
+    def pow_many(
+        self,
+        block_values: Sequence[int],
+        exponent: int,
+        plan: Optional[SlidingWindowPlan] = None,
+    ) -> List[int]:
+        """
+        Raise every block value to the exponent.
+
+        Args:
+            block_values (Sequence[int]): Values below the modulus
+            exponent (int): The exponent
+            plan (SlidingWindowPlan, optional): Precomputed plan for exponent
+
+        Returns:
+            List[int]: The results, in input order
+        """
+        if exponent == 0 or not block_values:
+            return [1 % self.modulus for _ in block_values]
+        if plan is None:
+            plan = SlidingWindowPlan(exponent)
+
+        reduce = self.reduce
+        bases = [self.to_montgomery(value % self.modulus) for value in block_values]
+
+        # Odd powers base^1, base^3, ... of every block
+        tables = [[base] for base in bases]
+        if plan.max_digit > 1:
+            squares = [reduce(base * base) for base in bases]
+            for _ in range(plan.max_digit // 2):
+                for table, square in zip(tables, squares):
+                    table.append(reduce(table[-1] * square))
+
+        steps = iter(plan.steps)
+        _, digit = next(steps)
+        results = [table[digit >> 1] for table in tables]
+        for squarings, digit in steps:
+            for _ in range(squarings):
+                results = [reduce(value * value) for value in results]
+            index = digit >> 1
+            results = [reduce(v * table[index]) for v, table in zip(results, tables)]
+        for _ in range(plan.trailing_squarings):
+            results = [reduce(value * value) for value in results]
+
+        return [reduce(value) for value in results]
+
+
+def montgomery_pow_blocks(
+    block_values: Sequence[int], exponent: Union[int, PrivateKey], modulus: int
+) -> List[int]:
+    """
+    Exponentiate many block values under one key in Montgomery form.
+
+    Args:
+        block_values (Sequence[int]): Block values to transform
+        exponent (int or PrivateKey): Exponent, or a PrivateKey to run both
+            CRT halves as batches
+        modulus (int): The RSA modulus (n), odd
+
+    Returns:
+        List[int]: Transformed block values, in input order
+    """
+    if not isinstance(exponent, PrivateKey):
+        return MontgomeryContext(modulus).pow_many(block_values, exponent)
+
+    p, q, qinv = exponent.p, exponent.q, exponent.qinv
+    ones = MontgomeryContext(p).pow_many([v % p for v in block_values], exponent.dp)
+    twos = MontgomeryContext(q).pow_many([v % q for v in block_values], exponent.dq)
+    return [
+        m_two + (qinv * (m_one - m_two)) % p * q for m_one, m_two in zip(ones, twos)
+    ]
@@ -0,0 +1,209 @@
+"""
+RSA Pipe Mode
+This module handles newline-delimited JSON requests from a stream until end
+of input, so one long-lived process can serve many messages without paying
+interpreter startup for each.
+
+Requests and responses use the same JSON objects as the socket service (see
+rsa_encryption.server), one per line. ``alphabet`` and ``key`` may be left
+out of a request when the pipe was opened with defaults::
+
+    {"id": 1, "op": "encrypt", "message": "hello"}
+    {"id": 2, "op": "decrypt", "message": "0724080455"}
+
+Requests are read in the chunks the operating system delivers, up to
+``flush_lines`` at a time; each such batch is grouped by operation, key and
+alphabet, processed, and its responses written in input order and flushed
+before more input is read. A caller that waits for each reply therefore
+never deadlocks, while a bulk producer gets large, bounded batches.
+"""
+
+import json
+from collections import defaultdict
+from typing import IO, Iterator, List, Optional
+
+from .protocol import BLOCK_OPS, generate_key_dict, parse_key, run_batch
+
+# Most responses written per flush
+PIPE_FLUSH_LINES = 1024
+
+# Bytes requested from the input per read
+PIPE_READ_SIZE = 64 * 1024
+
+
+def iter_line_batches(stream: IO[bytes], max_lines: int) -> Iterator[List[bytes]]:
+    """
+    Read lines in batches of what is already available, without waiting.
+
+    Args:
+        stream (IO[bytes]): Binary input with a ``read1`` method, e.g.
+            sys.stdin.buffer
+        max_lines (int): Most lines per batch
+
+    Yields:
+        List[bytes]: Complete lines, without their line endings
+    """
+    pending = b""
+    while True:
+        chunk = stream.read1(PIPE_READ_SIZE)
+        if not chunk:
+            break
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for start in range(0, len(lines), max_lines):
+            yield lines[start : start + max_lines]
+
+    # A last line without a line ending
+    if pending:
+        yield [pending]
+
+
+class PipeHandler:
+    """
+    Handles batches of NDJSON requests with optional default keys.
+
+    Example:
+        handler = PipeHandler(alphabet, public_key, private_key)
+        handler.serve(sys.stdin.buffer, sys.stdout)
+    """
+
+    def __init__(
+        self,
+        alphabet: Optional[str] = None,
+        public_key: Optional[tuple] = None,
+        private_key: Optional[tuple] = None,
+        flush_lines: int = PIPE_FLUSH_LINES,
+    ):
+        """
+        Set up the handler.
+
+        Args:
+            alphabet (str, optional): Alphabet for requests without one
+            public_key (tuple, optional): (n, e) for encrypt requests without
+                a key
+            private_key (tuple, optional): (n, d) or PrivateKey for decrypt
+                requests without a key
+            flush_lines (int): Most responses written per flush
+
+        Raises:
+            ValueError: If flush_lines is not positive
+        """
+        if flush_lines < 1:
+            raise ValueError("Error: Flush size must be at least 1!")
+
+        self.alphabet = alphabet
+        self.default_keys = {"encrypt": public_key, "decrypt": private_key}
+        self.flush_lines = flush_lines
+
+    def serve(self, input_stream: IO[bytes], output_stream: IO[str]) -> int:
+        """
+        Answer requests until the end of the input.
+
+        Args:
+            input_stream (IO[bytes]): Binary NDJSON request stream
+            output_stream (IO[str]): Text stream for NDJSON responses
+
+        Returns:
+            int: Number of requests handled
+        """
+        handled = 0
+        for lines in iter_line_batches(input_stream, self.flush_lines):
+            responses = self.handle_lines(lines)
+            if responses:
+                output_stream.write(
+                    "".join(
+                        json.dumps(response, separators=(",", ":")) + "\n"
+                        for response in responses
+                    )
+                )
+                output_stream.flush()
+                handled += len(responses)
+        return handled
+
+    def handle_lines(self, lines: List[bytes]) -> List[dict]:
+        """
+        Handle a batch of request lines; blank lines are skipped.
+
+        Args:
+            lines (List[bytes]): Raw request lines
+
+        Returns:
+            List[dict]: One response per request, in input order
+        """
+        responses = []
+        groups = defaultdict(list)
+
+        for line in lines:
+            if not line.strip():
+                continue
+            position = len(responses)
+            try:
+                request = json.loads(line)
+            except ValueError:
+                request = None
+            if not isinstance(request, dict):
+                responses.append(
+                    {"id": None, "ok": False, "error": "Error: Invalid request line!"}
+                )
+                continue
+
+            responses.append({"id": request.get("id")})
+            try:
+                group, message = self._parse_request(request)
+                if group is None:
+                    # Key generation is not batched
+                    self._finish(responses[position], True, generate_key_dict(message))
+                else:
+                    groups[group].append((position, message))
+            except (ValueError, TypeError) as e:
+                self._finish(responses[position], False, str(e))
+
+        for (op, alphabet, key), items in groups.items():
+            messages = [message for _, message in items]
+            # A group that fails as a whole, e.g. on a bad default key, only
+            # fails its own requests
+            try:
+                results = run_batch(op, alphabet, key, messages)
+            except Exception as e:
+                results = [(False, f"Error: {e}")] * len(items)
+            for (position, _), (ok, result) in zip(items, results):
+                self._finish(responses[position], ok, result)
+        return responses
+
+    def _parse_request(self, request: dict) -> tuple:
+        """
+        Validate a request and fill in the defaults.
+
+        Returns:
+            tuple: ((op, alphabet, key), message) for encrypt and decrypt, or
+                (None, bits) for key generation
+
+        Raises:
+            ValueError: If the request is invalid
+        """
+        op = request.get("op")
+        if op == "generate_keys":
+            return None, request.get("bits")
+        if op not in BLOCK_OPS:
+            raise ValueError(f"Error: Unknown operation '{op}'!")
+
+        alphabet = request.get("alphabet", self.alphabet)
+        message = request.get("message")
+        if not isinstance(alphabet, str) or not alphabet:
+            raise ValueError("Error: Request needs a non-empty alphabet!")
+        if not isinstance(message, str):
+            raise ValueError("Error: Request needs a message string!")
+
+        if "key" in request:
+            key = parse_key(op, request["key"])
+        else:
+            key = self.default_keys[op]
+            if key is None:
+                raise ValueError(f"Error: Request needs a key to {op}!")
+        return (op, alphabet, key), message
+
+    @staticmethod
+    def _finish(response: dict, ok: bool, result) -> None:
+        """Fill in the outcome of a request."""
+        response["ok"] = ok
+        response["result" if ok else "error"] = result
@@ -0,0 +1,156 @@
+"""
+Prime Generation
+This module finds large random primes by sieving a window of candidates
+against a table of small primes and running Miller-Rabin on the survivors.
+"""
+
+import secrets
+
+# Candidates divisible by any prime below this bound are rejected by the sieve
+SMALL_PRIME_BOUND = 20000
+
+# Number of odd candidates sieved per window
+SIEVE_WINDOW = 4096
+
+# Miller-Rabin rounds for small numbers; each round has at most a 1/4
+# false positive rate
+MILLER_RABIN_ROUNDS = 40
+
+
+def _small_primes(bound: int) -> list:
+    """
+    List all primes below the bound with the sieve of Eratosthenes.
+
+    Args:
+        bound (int): Exclusive upper bound
+
+    Returns:
+        list: Primes below the bound, in increasing order
+    """
+    is_prime = bytearray([1]) * bound
+    is_prime[0:2] = b"\x00\x00"
+    for number in range(2, int(bound**0.5) + 1):
+        if is_prime[number]:
+            is_prime[number * number :: number] = bytes(
+                len(range(number * number, bound, number))
+            )
+    return [number for number in range(bound) if is_prime[number]]
+
+
+SMALL_PRIMES = _small_primes(SMALL_PRIME_BOUND)
+
+# Odd small primes paired with the inverse of 2 modulo each, for sieving
+_SIEVE_PRIMES = [(prime, pow(2, -1, prime)) for prime in SMALL_PRIMES[1:]]
+
+
+def miller_rabin_rounds(bits: int) -> int:
+    """
+    Choose the number of Miller-Rabin rounds for random candidates.
+
+    Random large candidates are far less likely to fool a round than the
+    worst case, so fewer rounds reach a 2**-100 error bound (FIPS 186-4,
+    table C.2).
+
+    Args:
+        bits (int): Bit length of the candidate
+
+    Returns:
+        int: Number of rounds
+    """
+    if bits >= 1536:
+        return 4
+    if bits >= 1024:
+        return 5
+    if bits >= 512:
+        return 7
+    return MILLER_RABIN_ROUNDS
+
+
+def _miller_rabin(candidate: int, rounds: int) -> bool:
+    """
+    Run Miller-Rabin rounds with random bases on an odd candidate above 3.
+
+    Args:
+        candidate (int): Odd number to test
+        rounds (int): Number of rounds
+
+    Returns:
+        bool: False if the number is composite, True if it is probably prime
+    """
+    # Write candidate - 1 as 2**shift * odd_part
+    odd_part = candidate - 1
+    shift = 0
+    while odd_part % 2 == 0:
+        odd_part //= 2
+        shift += 1
+
+    for _ in range(rounds):
+        base = secrets.randbelow(candidate - 3) + 2
+        value = pow(base, odd_part, candidate)
+        if value in (1, candidate - 1):
+            continue
+        for _ in range(shift - 1):
+            value = pow(value, 2, candidate)
+            if value == candidate - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_probable_prime(candidate: int) -> bool:
+    """
+    Test a number for primality with trial division and Miller-Rabin.
+
+    Args:
+        candidate (int): Number to test
+
+    Returns:
+        bool: False if the number is composite, True if it is probably prime
+    """
+    if candidate < 2:
+        return False
+    for prime in SMALL_PRIMES:
+        if candidate % prime == 0:
+            return candidate == prime
+    return _miller_rabin(candidate, miller_rabin_rounds(candidate.bit_length()))
+
+
+def generate_prime(bits: int) -> int:
+    """
+    Generate a random prime with exactly the given number of bits.
+
+    The top two bits are set so that the product of two such primes has
+    exactly twice as many bits.
+
+    Args:
+        bits (int): Bit length of the prime
+
+    Returns:
+        int: A probable prime
+
+    Raises:
+        ValueError: If bits is too small to hold a prime above the sieve bound
+    """
+    if bits < SMALL_PRIME_BOUND.bit_length() + 1:
+        raise ValueError(f"Error: Prime size of {bits} bits is too small!")
+
+    rounds = miller_rabin_rounds(bits)
+    while True:
+        start = secrets.randbits(bits) | (0b11 << (bits - 2)) | 1
+
+        # Index k of the window stands for the odd candidate start + 2 * k
+        composite = bytearray(SIEVE_WINDOW)
+        for prime, half in _SIEVE_PRIMES:
+            offset = (-start * half) % prime
+            marks = len(range(offset, SIEVE_WINDOW, prime))
+            composite[offset::prime] = b"\x01" * marks
+
+        for index in range(SIEVE_WINDOW):
+            if composite[index]:
+                continue
+            candidate = start + 2 * index
+            if candidate.bit_length() != bits:
+                break
+            if _miller_rabin(candidate, rounds):
+                return candidate
@@ -0,0 +1,115 @@
+"""
+RSA Request Protocol
+This module holds the request handling shared by the socket service
+(rsa_encryption.server) and pipe mode (rsa_encryption.pipe): parsing request
+keys, running a batch of encrypt or decrypt requests, and key generation.
+"""
+
+from typing import List, Optional
+
+from .codec import block_exponentiator, get_codec_context
+from .key_generation import (
+    PrivateKey,
+    generate_keys,
+    keys_to_dict,
+    private_key_from_dict,
+)
+
+BLOCK_OPS = ("encrypt", "decrypt")
+
+# Fields of a private key object; n and d are required, the rest are CRT
+_PRIVATE_KEY_FIELDS = ("n", "d", "p", "q", "dp", "dq", "qinv")
+
+
+def run_batch(op: str, alphabet: str, key: tuple, messages: List[str]) -> list:
+    """
+    Encrypt or decrypt a batch of messages that share a key and alphabet.
+
+    Runs in the server's executor, or inline in pipe mode. Failures are
+    reported per message so one bad request does not fail the rest of its
+    batch.
+
+    Args:
+        op (str): "encrypt" or "decrypt"
+        alphabet (str): The alphabet to use for encoding
+        key (tuple): (n, e), (n, d) or a PrivateKey
+        messages (List[str]): The messages, or ciphertexts for decrypt
+
+    Returns:
+        list: (ok, result or error message) per message, in input order
+    """
+    modulus = key[0]
+    context = get_codec_context(alphabet, modulus)
+    # Keep a PrivateKey whole so decryption uses its CRT parameters
+    exponent = key if isinstance(key, PrivateKey) else key[1]
+    exponentiate_block = block_exponentiator(modulus, exponent)
+
+    results = []
+    for message in messages:
+        try:
+            if op == "encrypt":
+                block_values = list(map(exponentiate_block, context.encode(message)))
+                results.append((True, context.format_ciphertext(block_values)))
+            else:
+                try:
+                    block_values = context.parse_ciphertext(message)
+                except ValueError as e:
+                    raise ValueError(f"Decryption failed: {str(e)}")
+                results.append(
+                    (True, context.decode(list(map(exponentiate_block, block_values))))
+                )
+        except (ValueError, TypeError) as e:
+            results.append((False, str(e)))
+    return results
+
+
+def generate_key_dict(bits: Optional[int]) -> dict:
+    """
+    Generate a key pair and return it as a key file dict.
+
+    Args:
+        bits (int, optional): Modulus size in bits, see generate_keys
+
+    Returns:
+        dict: The key pair in the layout of keys_to_dict
+    """
+    return keys_to_dict(*generate_keys(bits))
+
+
+def parse_key(op: str, key_data: dict) -> tuple:
+    """
+    Turn the key of a request into a hashable key tuple.
+
+    Args:
+        op (str): "encrypt" or "decrypt"
+        key_data (dict): The request's key object: n and e to encrypt; n, d
+            and optionally the CRT fields to decrypt
+
+    Returns:
+        tuple: (n, e), (n, d) or a PrivateKey
+
+    Raises:
+        ValueError: If required key fields are missing or not integers, or
+            the modulus is not greater than 1
+    """
+    if not isinstance(key_data, dict):
+        raise ValueError("Error: Request key must be an object!")
+    try:
+        if op == "encrypt":
+            key = (int(key_data["n"]), int(key_data["e"]))
+        else:
+            key = private_key_from_dict(
+                {
+                    field: int(key_data[field])
+                    for field in _PRIVATE_KEY_FIELDS
+                    if field in key_data
+                }
+            )
+    except KeyError as e:
+        raise ValueError(f"Error: Request key is missing {e}!")
+    except (TypeError, ValueError):
+        raise ValueError("Error: Request key fields must be integers!")
+
+    if key[0] <= 1:
+        raise ValueError("Error: Request key modulus must be greater than 1!")
+    return key
@@ -0,0 +1,206 @@
+"""
+Random-Access Ciphertext Reader
+This module memory-maps a ciphertext file and decrypts only the blocks that
+cover a requested range, using the fixed block width to compute offsets.
+"""
+
+import mmap
+from typing import List, Optional
+
+from .codec import RSACodec
+from .formats import HEADER_SIZE, check_binary_header
+
+_WHITESPACE = b" \t\r\n"
+
+
+class CiphertextReader:
+    """
+    Memory-mapped reader for decimal or binary ciphertext files.
+
+    Blocks are read through ``memoryview`` slices of the mapping, so only
+    the blocks covering a requested range are touched and nothing else of
+    the file is copied.
+
+    Character positions refer to the original message: character i lives in
+    block i // chars_per_block. Unlike rsa_decrypt, a padding character at
+    the end of a block is kept; trailing padding is only stripped from a
+    range that runs to the end of the file.
+
+    Example:
+        with CiphertextReader("archive.enc", alphabet, private_key) as reader:
+            record = reader.read_chars(1_000_000, 1_000_080)
+    """
+
+    def __init__(
+        self, path: str, alphabet: str, key: tuple, input_format: str = "decimal"
+    ):
+        """
+        Open and map a ciphertext file.
+
+        Args:
+            path (str): Ciphertext file written by encrypt
+            alphabet (str): The alphabet used for encoding
+            key (tuple): Private key (n, d) or a PrivateKey
+            input_format (str): "decimal" or "binary"
+
+        Raises:
+            ValueError: If the format is unsupported or the file is empty,
+                truncated or made with a different key
+        """
+        if input_format not in ("decimal", "binary"):
+            raise ValueError(f"Error: Cannot map '{input_format}' ciphertext!")
+
+        self.codec = RSACodec(alphabet, key)
+        self.context = self.codec.context
+        self.chars_per_block = self.context.block_size // 2
+
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Error: Ciphertext file is empty!")
+        self._view = memoryview(self._mmap)
+
+        try:
+            self._parse_layout(input_format)
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_layout(self, input_format: str) -> None:
+        """Find where the blocks start, how wide they are and how many."""
+        end = len(self._view)
+        if input_format == "binary":
+            self._decimal = False
+            self._width = check_binary_header(self._view, self.codec.modulus)
+            self._offset = HEADER_SIZE
+        else:
+            self._decimal = True
+            self._width = self.context.encrypted_block_size
+            self._offset = 0
+            # Ignore a trailing newline or other whitespace
+            while end and self._view[end - 1] in _WHITESPACE:
+                end -= 1
+
+        if (end - self._offset) % self._width:
+            raise ValueError("Error: Ciphertext is truncated!")
+        self.block_count = (end - self._offset) // self._width
+
+    def __enter__(self) -> "CiphertextReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of blocks in the file."""
+        return self.block_count
+
+    @property
+    def char_count(self) -> int:
+        """Number of character positions, including final padding."""
+        return self.block_count * self.chars_per_block
+
+    def close(self) -> None:
+        """Release the mapping and close the file."""
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+            self._mmap.close()
+            self._file.close()
+
+    def encrypted_block(self, index: int) -> int:
+        """
+        Read one encrypted block value.
+
+        Args:
+            index (int): Block index, from 0
+
+        Returns:
+            int: The encrypted block value
+
+        Raises:
+            IndexError: If the index is out of range
+        """
+        if not 0 <= index < self.block_count:
+            raise IndexError("block index out of range")
+
+        start = self._offset + index * self._width
+        block = self._view[start : start + self._width]
+        if self._decimal:
+            try:
+                return int(block)
+            except ValueError:
+                raise ValueError(f"Decryption failed: block {index} is not a number")
+        return int.from_bytes(block, "big")
+
+    def decrypt_block_values(self, start: int, stop: int) -> List[int]:
+        """
+        Decrypt a range of blocks to their plaintext block values.
+
+        Args:
+            start (int): First block index
+            stop (int): Block index after the last one
+
+        Returns:
+            List[int]: Decrypted block values
+        """
+        start, stop, _ = slice(start, stop).indices(self.block_count)
+        exponentiate_block = self.codec.exponentiate_block
+        return [exponentiate_block(self.encrypted_block(i)) for i in range(start, stop)]
+
+    def read_blocks(self, start: int, stop: int) -> str:
+        """
+        Decrypt a range of blocks to text.
+
+        Args:
+            start (int): First block index
+            stop (int): Block index after the last one
+
+        Returns:
+            str: The characters held by those blocks
+        """
+        start, stop, _ = slice(start, stop).indices(self.block_count)
+        text = self._decode(self.decrypt_block_values(start, stop))
+        if stop == self.block_count:
+            text = text.rstrip(self.codec.context.alphabet[0])
+        return text
+
+    def read_chars(self, start: int, stop: Optional[int] = None) -> str:
+        """
+        Decrypt a range of characters of the original message.
+
+        Args:
+            start (int): First character position
+            stop (int, optional): Position after the last character; defaults
+                to the end of the message
+
+        Returns:
+            str: The requested characters
+        """
+        start, stop, _ = slice(start, stop).indices(self.char_count)
+        if start >= stop:
+            return ""
+
+        first_block = start // self.chars_per_block
+        last_block = (stop - 1) // self.chars_per_block + 1
+        text = self._decode(self.decrypt_block_values(first_block, last_block))
+
+        base = first_block * self.chars_per_block
+        text = text[start - base : stop - base]
+        if stop == self.char_count:
+            text = text.rstrip(self.codec.context.alphabet[0])
+        return text
+
+    def _decode(self, block_values: List[int]) -> str:
+        """Decode block values without dropping per-block padding."""
+        block_size = self.context.block_size
+        pair_table = self.context.pair_table
+        chars = []
+        for block_value in block_values:
+            digits = str(block_value).zfill(block_size)
+            chars.extend(
+                pair_table.get(digits[i : i + 2], "") for i in range(0, block_size, 2)
+            )
+        return "".join(chars)
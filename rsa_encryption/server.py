@@ -0,0 +1,447 @@
+"""
+RSA Service
+This module serves encrypt, decrypt and key generation requests over a local
+TCP or Unix socket, so clients avoid interpreter startup on every call.
+
+Each frame is a 4-byte big-endian length followed by that many bytes of
+UTF-8 JSON. Requests look like::
+
+    {"id": 1, "op": "encrypt", "alphabet": "abc ", "key": {"n": 1, "e": 3},
+     "message": "abc"}
+    {"id": 2, "op": "decrypt", "alphabet": "abc ", "key": {"n": 1, "d": 5},
+     "message": "0123"}
+    {"id": 3, "op": "generate_keys", "bits": 2048}
+
+where a decrypt key may also carry the CRT fields of a key file. Responses
+are ``{"id": ..., "ok": true, "result": ...}`` or
+``{"id": ..., "ok": false, "error": "..."}``.
+
+Concurrent encrypt/decrypt requests are collected into micro-batches, grouped
+by key and alphabet, and exponentiated in an executor so the event loop
+never stalls.
+
+Usage:
+    python -m rsa_encryption.server --port 8765
+    python -m rsa_encryption.server --unix /tmp/rsa.sock
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from .protocol import BLOCK_OPS, generate_key_dict, parse_key, run_batch
+
+_LENGTH = struct.Struct(">I")
+
+# Largest accepted frame; bigger ones close the connection
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Defaults for batching and backpressure
+MAX_BATCH_SIZE = 256
+BATCH_DELAY = 0.002
+MAX_QUEUE_DEPTH = 4096
+MAX_INFLIGHT_PER_CONNECTION = 64
+
+
+async def read_payload(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Read the payload of one length-prefixed frame.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from
+
+    Returns:
+        bytes: The payload, or None at end of stream
+
+    Raises:
+        ValueError: If the frame is larger than MAX_FRAME_SIZE
+    """
+    try:
+        header = await reader.readexactly(_LENGTH.size)
+    except asyncio.IncompleteReadError:
+        return None
+
+    (length,) = _LENGTH.unpack(header)
+    if length > MAX_FRAME_SIZE:
+        raise ValueError(f"Error: Frame of {length} bytes exceeds the limit!")
+    return await reader.readexactly(length)
+
+
+async def read_frame(reader: asyncio.StreamReader) -> Optional[dict]:
+    """
+    Read one length-prefixed JSON frame.
+
+    Args:
+        reader (asyncio.StreamReader): The stream to read from
+
+    Returns:
+        dict: The decoded frame, or None at end of stream
+
+    Raises:
+        ValueError: If the frame is too large or is not valid JSON
+    """
+    payload = await read_payload(reader)
+    return None if payload is None else json.loads(payload)
+
+
+def encode_frame(message: dict) -> bytes:
+    """
+    Encode a message as a length-prefixed JSON frame.
+
+    Args:
+        message (dict): The message to send
+
+    Returns:
+        bytes: The frame
+    """
+    payload = json.dumps(message, separators=(",", ":")).encode("utf-8")
+    return _LENGTH.pack(len(payload)) + payload
+
+
+def _resolve(future: asyncio.Future, result: tuple) -> None:
+    """Set the (ok, result) of a request unless it is already done."""
+    if not future.done():
+        future.set_result(result)
+
+
+class RSAServer:
+    """
+    Asyncio RSA service with micro-batching and backpressure.
+
+    Encrypt and decrypt requests wait up to ``batch_delay`` seconds to be
+    grouped with other requests (at most ``max_batch_size`` per batch). At
+    most ``max_queue_depth`` requests are accepted at once; beyond that new
+    requests are rejected with a "Server busy" error. Each connection may
+    have ``max_inflight`` requests outstanding before the server stops
+    reading from it, pushing back on the client through the socket.
+
+    Example:
+        server = RSAServer()
+        await server.start(port=8765)
+        await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        batch_delay: float = BATCH_DELAY,
+        max_queue_depth: int = MAX_QUEUE_DEPTH,
+        max_inflight: int = MAX_INFLIGHT_PER_CONNECTION,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Create a server; call start() to begin listening.
+
+        Args:
+            max_batch_size (int): Most requests exponentiated in one batch
+            batch_delay (float): Seconds to wait for a batch to fill
+            max_queue_depth (int): Most requests accepted at once
+            max_inflight (int): Most outstanding requests per connection
+            executor (Executor, optional): Executor for CPU-bound work; a
+                process pool is created (and shut down) by default
+            workers (int, optional): Processes in the default pool; defaults
+                to the CPU count
+        """
+        if max_batch_size < 1 or max_queue_depth < 1 or max_inflight < 1:
+            raise ValueError("Error: Batch, queue and in-flight limits must be >= 1!")
+
+        self.max_batch_size = max_batch_size
+        self.batch_delay = batch_delay
+        self.max_queue_depth = max_queue_depth
+        self.max_inflight = max_inflight
+
+        self._owns_executor = executor is None
+        self._executor = executor
+        self._workers = workers
+        self._queue = None
+        self._pending = 0
+        self._batcher = None
+        self._server = None
+        self._tasks = set()
+        self._connections = {}
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of accepted requests that have not been answered yet."""
+        return self._pending
+
+    async def start(
+        self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None
+    ) -> asyncio.AbstractServer:
+        """
+        Start listening on a TCP port, or on a Unix socket if path is given.
+
+        Args:
+            host (str): TCP host to bind
+            port (int): TCP port to bind; 0 picks a free port
+            path (str, optional): Unix socket path
+
+        Returns:
+            asyncio.AbstractServer: The listening server
+        """
+        self._open()
+        if path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_connection, host, port
+            )
+        return self._server
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop listening, close connections and shut the executor down."""
+        if self._server is not None:
+            self._server.close()
+
+        # Closing the transports ends each handler after its pending replies
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+        for task in [self._batcher, *self._tasks]:
+            if task is not None:
+                task.cancel()
+        await asyncio.gather(
+            *[task for task in [self._batcher, *self._tasks] if task is not None],
+            return_exceptions=True,
+        )
+        self._batcher = None
+        self._tasks.clear()
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def handle_request(self, request: dict) -> dict:
+        """
+        Handle one decoded request.
+
+        Args:
+            request (dict): The request frame
+
+        Returns:
+            dict: The response frame
+        """
+        request_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict):
+                raise ValueError("Error: Request must be an object!")
+            if self._pending >= self.max_queue_depth:
+                raise ValueError("Error: Server busy!")
+
+            self._pending += 1
+            try:
+                result = await self._dispatch(request)
+            finally:
+                self._pending -= 1
+        except (ValueError, TypeError) as e:
+            return {"id": request_id, "ok": False, "error": str(e)}
+        return {"id": request_id, "ok": True, "result": result}
+
+    def _open(self) -> None:
+        """Create the executor, queue and batching task if needed."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.ensure_future(self._batch_loop())
+
+    async def _dispatch(self, request: dict):
+        """Route a request to the batcher or straight to the executor."""
+        self._open()
+        op = request.get("op")
+        loop = asyncio.get_running_loop()
+
+        if op == "generate_keys":
+            return await loop.run_in_executor(
+                self._executor, generate_key_dict, request.get("bits")
+            )
+
+        if op not in BLOCK_OPS:
+            raise ValueError(f"Error: Unknown operation '{op}'!")
+
+        alphabet = request.get("alphabet")
+        message = request.get("message")
+        if not isinstance(alphabet, str) or not alphabet:
+            raise ValueError("Error: Request needs a non-empty alphabet!")
+        if not isinstance(message, str):
+            raise ValueError("Error: Request needs a message string!")
+
+        future = loop.create_future()
+        group = (op, alphabet, parse_key(op, request.get("key")))
+        self._queue.put_nowait((group, message, future))
+        ok, result = await future
+        if not ok:
+            raise ValueError(result)
+        return result
+
+    async def _batch_loop(self) -> None:
+        """Collect queued requests into batches and hand them to the executor."""
+        while True:
+            batch = [await self._queue.get()]
+            if self.batch_delay > 0 and self._queue.qsize() < self.max_batch_size:
+                await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # A failure here must not end the loop, or every later request
+            # would wait forever; fail this batch's requests instead
+            try:
+                groups: Dict[Tuple, list] = {}
+                for group, message, future in batch:
+                    try:
+                        groups.setdefault(group, []).append((message, future))
+                    except TypeError:
+                        _resolve(future, (False, "Error: Invalid request key!"))
+
+                for group, items in groups.items():
+                    task = asyncio.ensure_future(self._run_group(group, items))
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+            except Exception as e:
+                for _, _, future in batch:
+                    _resolve(future, (False, f"Error: {e}"))
+
+    async def _run_group(self, group: tuple, items: list) -> None:
+        """Exponentiate one group of a batch and resolve its futures."""
+        op, alphabet, key = group
+        messages = [message for message, _ in items]
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self._executor, run_batch, op, alphabet, key, messages
+            )
+        except Exception as e:
+            results = [(False, f"Error: {e}")] * len(items)
+
+        for (_, future), result in zip(items, results):
+            _resolve(future, result)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve one client, answering requests as they complete."""
+        self._connections[asyncio.current_task()] = writer
+        inflight = asyncio.Semaphore(self.max_inflight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(payload):
+            try:
+                try:
+                    request = json.loads(payload)
+                except ValueError:
+                    response = {"id": None, "ok": False, "error": "Error: Bad JSON!"}
+                else:
+                    response = await self.handle_request(request)
+                async with write_lock:
+                    writer.write(encode_frame(response))
+                    await writer.drain()
+            except (ConnectionError, asyncio.CancelledError):
+                pass
+            finally:
+                inflight.release()
+
+        try:
+            while True:
+                # Stop reading while the client has too many requests out
+                await inflight.acquire()
+                try:
+                    payload = await read_payload(reader)
+                except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+                    payload = None
+                if payload is None:
+                    inflight.release()
+                    break
+                task = asyncio.ensure_future(respond(payload))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._connections.pop(asyncio.current_task(), None)
+            for task in tasks:
+                task.cancel()
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+async def _serve(args) -> None:
+    """Run a server from command line arguments until interrupted."""
+    server = RSAServer(
+        max_batch_size=args.batch_size,
+        batch_delay=args.batch_delay,
+        max_queue_depth=args.max_queue,
+        max_inflight=args.max_inflight,
+        workers=args.workers,
+    )
+    listener = await server.start(args.host, args.port, args.unix)
+    for sock in listener.sockets:
+        print(f"Serving on {sock.getsockname()}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+        if args.unix and os.path.exists(args.unix):
+            os.remove(args.unix)
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="RSA encryption service")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP host to bind")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to bind")
+    parser.add_argument("--unix", help="Unix socket path (instead of TCP)")
+    parser.add_argument(
+        "--workers", "-w", type=int, help="Worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=MAX_BATCH_SIZE, help="Max batch size"
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=BATCH_DELAY,
+        help="Seconds to wait for a batch to fill",
+    )
+    parser.add_argument(
+        "--max-queue",
+        type=int,
+        default=MAX_QUEUE_DEPTH,
+        help="Requests accepted at once before rejecting as busy",
+    )
+    parser.add_argument(
+        "--max-inflight",
+        type=int,
+        default=MAX_INFLIGHT_PER_CONNECTION,
+        help="Outstanding requests per connection before reads pause",
+    )
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+RSA Signatures
+This module signs messages with the private key and verifies signatures with
+the public key, on the key pairs from generate_keys.
+
+Messages are hashed to a number below the modulus with SHAKE-256 from
+hashlib (a full-domain hash), and the signature is that number raised to the
+private exponent. Verification raises the signature to the public exponent
+and compares.
+
+Many signatures under one public key can also be checked together with the
+randomized small-exponent batch test: with random ``l``-bit exponents
+``r_i``, all signatures are accepted if
+
+    (s_1^r_1 * ... * s_k^r_k)^e == h_1^r_1 * ... * h_k^r_k  (mod n)
+
+so one full exponentiation replaces k of them, and an invalid signature gets
+through with probability at most 2^-l. The products are computed with a
+bucket multi-exponentiation, at about ``2 * l / w`` multiplications per
+signature for windows of ``w`` bits. That is cheaper than checking one by
+one only when the public exponent is wide: for the default e = 65537, a
+single check is 17 squarings, so verify_many checks such signatures one by
+one and keeps the batch test for keys where it pays.
+
+As with any small-exponent test for RSA, a signature multiplied by an
+element of order two, such as -s mod n, is not reliably rejected; it still
+shows the message was signed.
+"""
+
+import hashlib
+import secrets
+from typing import Callable, List, Sequence, Union
+
+from .codec import block_exponentiator
+from .key_generation import PrivateKey
+
+# Bits of the random batch exponents; an invalid batch passes with
+# probability at most 2^-BATCH_SECURITY_BITS
+BATCH_SECURITY_BITS = 64
+
+# Extra hash bytes beyond the modulus size, so reducing mod n is unbiased
+_HASH_EXTRA_BYTES = 8
+
+Message = Union[str, bytes]
+
+
+def hash_to_int(message: Message, modulus: int) -> int:
+    """
+    Hash a message to a number below the modulus.
+
+    Args:
+        message (str or bytes): The message; strings are encoded as UTF-8
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        int: The message representative
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    digest_size = (modulus.bit_length() + 7) // 8 + _HASH_EXTRA_BYTES
+    digest = hashlib.shake_256(message).digest(digest_size)
+    return int.from_bytes(digest, "big") % modulus
+
+
+def _signer(private_key: tuple) -> Callable[[Message], int]:
+    """Build the function that signs messages under one private key."""
+    modulus, private_exp = private_key
+    # Keep the whole key so the CRT parameters are used when available
+    if isinstance(private_key, PrivateKey):
+        private_exp = private_key
+    exponentiate = block_exponentiator(modulus, private_exp)
+
+    def sign_message(message: Message) -> int:
+        return exponentiate(hash_to_int(message, modulus))
+
+    return sign_message
+
+
+def sign(private_key: tuple, message: Message) -> int:
+    """
+    Sign a message.
+
+    Args:
+        private_key (tuple): Private key (n, d) or a PrivateKey
+        message (str or bytes): The message to sign
+
+    Returns:
+        int: The signature
+    """
+    return _signer(private_key)(message)
+
+
+def sign_many(private_key: tuple, messages: Sequence[Message]) -> List[int]:
+    """
+    Sign many messages under one private key.
+
+    Args:
+        private_key (tuple): Private key (n, d) or a PrivateKey
+        messages (Sequence[str or bytes]): The messages to sign
+
+    Returns:
+        List[int]: The signatures, in input order
+    """
+    return list(map(_signer(private_key), messages))
+
+
+def verify(public_key: tuple, message: Message, signature: int) -> bool:
+    """
+    Check one signature.
+
+    Args:
+        public_key (tuple): Public key (n, e)
+        message (str or bytes): The signed message
+        signature (int): The signature to check
+
+    Returns:
+        bool: True if the signature is valid for the message
+    """
+    modulus, public_exp = public_key
+    if not 0 < signature < modulus:
+        return False
+    return pow(signature, public_exp, modulus) == hash_to_int(message, modulus)
+
+
+def _window_bits(count: int) -> int:
+    """Bucket window size for a multi-exponentiation of count bases."""
+    return max(2, min(8, count.bit_length() - 3))
+
+
+def _multi_pow(
+    bases: Sequence[int], exponents: Sequence[int], modulus: int, exponent_bits: int
+) -> int:
+    """
+    Compute the product of ``base ** exponent`` modulo the modulus.
+
+    Uses the bucket method: per window of the exponents, each base is
+    multiplied into the bucket of its window digit, and the buckets are
+    combined with two running products, so every base costs one
+    multiplication per window instead of a full exponentiation.
+
+    Args:
+        bases (Sequence[int]): The bases
+        exponents (Sequence[int]): Non-negative exponents below
+            2^exponent_bits, one per base
+        modulus (int): The modulus
+        exponent_bits (int): Bit length bound of the exponents
+
+    Returns:
+        int: The product
+    """
+    window_bits = _window_bits(len(bases))
+    digit_mask = (1 << window_bits) - 1
+    result = 1
+
+    for shift in range(
+        (exponent_bits - 1) // window_bits * window_bits, -1, -window_bits
+    ):
+        if result != 1:
+            result = pow(result, 1 << window_bits, modulus)
+
+        buckets = [1] * (digit_mask + 1)
+        for base, exponent in zip(bases, exponents):
+            digit = (exponent >> shift) & digit_mask
+            if digit:
+                buckets[digit] = buckets[digit] * base % modulus
+
+        # running = product of buckets[d:], total = product of bucket^digit
+        running = total = 1
+        for digit in range(digit_mask, 0, -1):
+            if buckets[digit] != 1:
+                running = running * buckets[digit] % modulus
+            if running != 1:
+                total = total * running % modulus
+        result = result * total % modulus
+
+    return result
+
+
+def _batch_test(
+    public_key: tuple,
+    representatives: Sequence[int],
+    signatures: Sequence[int],
+    security_bits: int,
+) -> bool:
+    """Run the randomized small-exponent test on hashed messages."""
+    modulus, public_exp = public_key
+    exponents = [secrets.randbits(security_bits) for _ in signatures]
+    combined_signature = _multi_pow(signatures, exponents, modulus, security_bits)
+    combined_hash = _multi_pow(representatives, exponents, modulus, security_bits)
+    return pow(combined_signature, public_exp, modulus) == combined_hash
+
+
+def verify_batch(
+    public_key: tuple,
+    messages: Sequence[Message],
+    signatures: Sequence[int],
+    security_bits: int = BATCH_SECURITY_BITS,
+) -> bool:
+    """
+    Check many signatures under one public key with one exponentiation.
+
+    Args:
+        public_key (tuple): Public key (n, e)
+        messages (Sequence[str or bytes]): The signed messages
+        signatures (Sequence[int]): The signatures, one per message
+        security_bits (int): Bits of the random exponents; an invalid
+            signature passes with probability at most 2^-security_bits
+
+    Returns:
+        bool: True if every signature is valid
+
+    Raises:
+        ValueError: If the numbers of messages and signatures differ
+    """
+    if len(messages) != len(signatures):
+        raise ValueError("Error: Need one signature per message!")
+
+    modulus = public_key[0]
+    if not all(0 < signature < modulus for signature in signatures):
+        return False
+    if not signatures:
+        return True
+
+    representatives = [hash_to_int(message, modulus) for message in messages]
+    return _batch_test(public_key, representatives, signatures, security_bits)
+
+
+def batch_test_pays(public_exp: int, count: int, security_bits: int) -> bool:
+    """
+    Estimate whether the batch test beats checking count signatures singly.
+
+    Costs are counted in modular multiplications: a single check is one per
+    bit of the public exponent plus one per set bit, and the batch test two
+    per window of the random exponents, plus the bucket combining.
+
+    Args:
+        public_exp (int): The public exponent (e)
+        count (int): Number of signatures
+        security_bits (int): Bits of the random exponents
+
+    Returns:
+        bool: True if the batch test should be cheaper
+    """
+    if count < 2:
+        return False
+    window_bits = _window_bits(count)
+    windows = -(-security_bits // window_bits)
+    exponent_cost = public_exp.bit_length() + bin(public_exp).count("1")
+    batch_cost = 2 * windows * (count + (2 << window_bits)) + exponent_cost
+    return batch_cost < count * exponent_cost
+
+
+def verify_many(
+    public_key: tuple,
+    messages: Sequence[Message],
+    signatures: Sequence[int],
+    security_bits: int = BATCH_SECURITY_BITS,
+) -> List[bool]:
+    """
+    Check many signatures under one public key, reporting each one.
+
+    Where batch_test_pays, signatures are checked with the batch test, and
+    a failing batch is split in halves until the invalid signatures are
+    found; otherwise they are checked one by one.
+
+    Args:
+        public_key (tuple): Public key (n, e)
+        messages (Sequence[str or bytes]): The signed messages
+        signatures (Sequence[int]): The signatures, one per message
+        security_bits (int): Bits of the random exponents of the batch test
+
+    Returns:
+        List[bool]: Whether each signature is valid, in input order
+
+    Raises:
+        ValueError: If the numbers of messages and signatures differ
+    """
+    if len(messages) != len(signatures):
+        raise ValueError("Error: Need one signature per message!")
+
+    modulus, public_exp = public_key
+    results = [False] * len(signatures)
+    positions = [
+        position
+        for position, signature in enumerate(signatures)
+        if 0 < signature < modulus
+    ]
+    representatives = {
+        position: hash_to_int(messages[position], modulus) for position in positions
+    }
+
+    pending = [positions] if positions else []
+    while pending:
+        group = pending.pop()
+        if not batch_test_pays(public_exp, len(group), security_bits):
+            for position in group:
+                results[position] = (
+                    pow(signatures[position], public_exp, modulus)
+                    == representatives[position]
+                )
+        elif _batch_test(
+            public_key,
+            [representatives[position] for position in group],
+            [signatures[position] for position in group],
+            security_bits,
+        ):
+            for position in group:
+                results[position] = True
+        else:
+            middle = len(group) // 2
+            pending.extend((group[middle:], group[:middle]))
+
+    return results
@@ -0,0 +1,130 @@
+"""
+Streaming RSA Encryption and Decryption
+This module encrypts and decrypts file-like objects a window of blocks at a
+time, so memory use stays flat regardless of input size.
+"""
+
+from typing import IO, Iterator, Union
+
+from .codec import RSACodec, make_key
+from .key_generation import PrivateKey
+from .utils import drop_line_ending, read_in_chunks
+
+# Number of blocks read and processed per window
+STREAM_WINDOW_BLOCKS = 1024
+
+
+def rsa_encrypt_stream(
+    alphabet: str,
+    modulus: int,
+    public_exponent: int,
+    input_stream: IO[str],
+    window_blocks: int = STREAM_WINDOW_BLOCKS,
+    strip_line_ending: bool = False,
+) -> Iterator[str]:
+    """
+    Encrypt a text stream, yielding the ciphertext one window at a time.
+
+    Windows are aligned to block boundaries, so the joined output is
+    identical to rsa_encrypt on the whole input.
+
+    Args:
+        alphabet (str): The alphabet to use for encoding
+        modulus (int): The RSA modulus (n)
+        public_exponent (int): The RSA public exponent (e)
+        input_stream (IO[str]): Readable text stream holding the message
+        window_blocks (int): Number of blocks processed per window
+        strip_line_ending (bool): Leave out one line ending at the end of
+            the stream, as in text files
+
+    Yields:
+        str: Encrypted digits for each window
+
+    Raises:
+        ValueError: If the stream is empty or contains invalid characters
+    """
+    codec = RSACodec(alphabet, (modulus, public_exponent))
+    chars_per_block = codec.context.block_size // 2
+
+    # Characters kept back until more input shows they are not the end
+    held_chars = 2 if strip_line_ending else 0
+
+    pending = ""
+    is_empty = True
+    for chunk in read_in_chunks(input_stream, chars_per_block * window_blocks):
+        pending += chunk
+
+        # Only encrypt whole blocks; a partial block waits for more input
+        usable = max(0, len(pending) - held_chars)
+        usable -= usable % chars_per_block
+        if usable:
+            is_empty = False
+            yield codec.encrypt(pending[:usable])
+            pending = pending[usable:]
+
+    if strip_line_ending:
+        pending = drop_line_ending(pending)
+
+    if pending:
+        yield codec.encrypt(pending)
+    elif is_empty:
+        raise ValueError("Error: Empty message!")
+
+
+def rsa_decrypt_stream(
+    alphabet: str,
+    modulus: int,
+    private_exponent: Union[int, PrivateKey],
+    input_stream: IO[str],
+    window_blocks: int = STREAM_WINDOW_BLOCKS,
+) -> Iterator[str]:
+    """
+    Decrypt a text stream, yielding the plaintext one window at a time.
+
+    Whitespace in the stream (such as line breaks) is ignored. Trailing
+    padding characters are held back until more text follows them, so the
+    joined output matches rsa_decrypt on the whole input.
+
+    Args:
+        alphabet (str): The alphabet used for encoding
+        modulus (int): The RSA modulus (n)
+        private_exponent (int or PrivateKey): The RSA private exponent (d),
+            or a PrivateKey holding the CRT parameters
+        input_stream (IO[str]): Readable text stream holding the ciphertext
+        window_blocks (int): Number of blocks processed per window
+
+    Yields:
+        str: Decrypted text for each window
+
+    Raises:
+        ValueError: If decryption fails or input is invalid
+    """
+    codec = RSACodec(alphabet, make_key(modulus, private_exponent))
+    encrypted_block_size = codec.context.encrypted_block_size
+    padding_char = alphabet[0]
+
+    def decrypt_window(window: str) -> str:
+        return codec.decrypt(window, strip_padding=False)
+
+    pending = ""
+    held_padding = ""
+    for chunk in read_in_chunks(input_stream, encrypted_block_size * window_blocks):
+        pending += "".join(chunk.split())
+
+        usable = len(pending) - len(pending) % encrypted_block_size
+        if not usable:
+            continue
+
+        text = held_padding + decrypt_window(pending[:usable])
+        pending = pending[usable:]
+
+        # Padding is only dropped at the very end, so hold back a trailing run
+        stripped = text.rstrip(padding_char)
+        held_padding = text[len(stripped) :]
+        if stripped:
+            yield stripped
+
+    if pending:
+        stripped = (held_padding + decrypt_window(pending)).rstrip(padding_char)
+        if stripped:
+            yield stripped
@@ -3,7 +3,7 @@ Utility functions for RSA encryption system.
 """
 
 import math
-from typing import List, Tuple
+from typing import IO, Iterator, List, Tuple
 
 
 def calculate_block_size(modulus: int, alphabet_length: int) -> int:
@@ -43,6 +43,56 @@ def split_into_chunks(text: str, chunk_size: int) -> List[str]:
     return [text[i : i + chunk_size] for i in range(0, len(text), chunk_size)]
 
 
+def iter_chunks(text: str, chunk_size: int) -> Iterator[str]:
+    """
+    Lazily split a string into chunks of specified size.
+
+    Args:
+        text (str): String to split
+        chunk_size (int): Size of each chunk
+
+    Yields:
+        str: Successive string chunks
+    """
+    for i in range(0, len(text), chunk_size):
+        yield text[i : i + chunk_size]
+
+
+def read_in_chunks(stream: IO[str], chunk_size: int) -> Iterator[str]:
+    """
+    Read a file-like object in chunks without loading it all into memory.
+
+    Args:
+        stream (IO[str]): Readable file-like object
+        chunk_size (int): Maximum number of characters per read
+
+    Yields:
+        str: Successive chunks until the end of the stream
+    """
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def drop_line_ending(text: str) -> str:
+    """
+    Remove one trailing line ending, as text files end with one.
+
+    Args:
+        text (str): The text
+
+    Returns:
+        str: The text without a final "\\n" or "\\r\\n"
+    """
+    if text.endswith("\r\n"):
+        return text[:-2]
+    if text.endswith("\n"):
+        return text[:-1]
+    return text
+
+
 def create_char_mappings(alphabet: str) -> Tuple[dict, dict]:
     """
     Create character-to-number and number-to-character mappings.
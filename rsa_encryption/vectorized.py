@@ -0,0 +1,144 @@
+"""
+Vectorized Exponentiation for Small Moduli
+This module raises a whole array of block values to the same exponent with
+NumPy, running square-and-multiply on a ``uint64`` array instead of one
+Python ``pow`` call per block.
+
+It applies to moduli up to 2**32, such as the demo keys generate_keys makes
+without a size: every product of two values below the modulus then fits in
+64 bits. NumPy is optional; without it, or for larger moduli, callers keep
+the per-block path. It is imported on the first run long enough to
+vectorize, so short messages and one-shot commands never pay for it.
+"""
+
+from typing import List, Sequence, Union
+
+from .key_generation import PrivateKey
+
+# The numpy module once load_numpy has run, or None if it is not installed
+numpy = None
+_numpy_loaded = False
+
+# Largest modulus whose products of two residues fit in a uint64
+VECTORIZED_MAX_MODULUS = 1 << 32
+
+# Messages (or batches) with at least this many blocks are vectorized; below
+# it, NumPy's per-call overhead outweighs the Python pow calls it replaces.
+# Set to None to disable.
+VECTORIZED_BLOCK_THRESHOLD = 64
+
+
+def load_numpy():
+    """
+    Import NumPy on first use.
+
+    Returns:
+        module: The numpy module, or None if it is not installed
+    """
+    global numpy, _numpy_loaded
+    if not _numpy_loaded:
+        try:
+            import numpy as numpy_module
+        except ImportError:  # pragma: no cover - optional dependency
+            numpy_module = None
+        numpy = numpy_module
+        _numpy_loaded = True
+    return numpy
+
+
+def modulus_fits(modulus: int) -> bool:
+    """
+    Check whether a modulus is small enough to vectorize, without NumPy.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        bool: True if products of two residues fit in a uint64
+    """
+    return 1 < modulus <= VECTORIZED_MAX_MODULUS
+
+
+def can_vectorize(modulus: int) -> bool:
+    """
+    Check whether blocks under a modulus can be vectorized here.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        bool: True if the modulus fits and NumPy is installed
+    """
+    return modulus_fits(modulus) and load_numpy() is not None
+
+
+def use_vectorized(modulus: int, block_count: int) -> bool:
+    """
+    Check whether a run of blocks should take the vectorized path.
+
+    Args:
+        modulus (int): The RSA modulus (n)
+        block_count (int): Number of blocks to exponentiate
+
+    Returns:
+        bool: True if vectorizing is possible and the run is long enough
+    """
+    return (
+        VECTORIZED_BLOCK_THRESHOLD is not None
+        and block_count >= VECTORIZED_BLOCK_THRESHOLD
+        and can_vectorize(modulus)
+    )
+
+
+def pow_array(values, exponent: int, modulus: int):
+    """
+    Raise every value of a uint64 array to the exponent modulo the modulus.
+
+    Args:
+        values (numpy.ndarray): uint64 values
+        exponent (int): Non-negative exponent, shared by all values
+        modulus (int): Modulus of at most VECTORIZED_MAX_MODULUS
+
+    Returns:
+        numpy.ndarray: The results, as uint64
+    """
+    modulus = numpy.uint64(modulus)
+    base = values % modulus
+    result = numpy.ones_like(base)
+    while exponent:
+        if exponent & 1:
+            result = result * base % modulus
+        exponent >>= 1
+        if exponent:
+            base = base * base % modulus
+    return result
+
+
+def numpy_pow_blocks(
+    block_values: Sequence[int], exponent: Union[int, PrivateKey], modulus: int
+) -> List[int]:
+    """
+    Exponentiate many block values under one key as a NumPy array.
+
+    Args:
+        block_values (Sequence[int]): Block values to transform, below the
+            modulus
+        exponent (int or PrivateKey): Exponent, or a PrivateKey
+        modulus (int): The RSA modulus (n)
+
+    Returns:
+        List[int]: Transformed block values, in input order
+
+    Raises:
+        ValueError: If NumPy is missing or the modulus is too large
+    """
+    if not can_vectorize(modulus):
+        raise ValueError("Error: Vectorized exponentiation needs NumPy and n <= 2^32!")
+
+    if isinstance(exponent, PrivateKey):
+        # Array operations cost the same for CRT's half-size moduli, so the
+        # two CRT halves would only double the work
+        exponent = exponent.d
+
+    values = numpy.array(block_values, dtype=numpy.uint64)
+    return pow_array(values, exponent, modulus).tolist()
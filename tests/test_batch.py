@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import batch
+from rsa_encryption.batch import decrypt_many, encrypt_many
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+
+
+class TestBatch(unittest.TestCase):
+    """Test cases for batch encryption and decryption."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+        _, self.priv_exp = self.private_key
+        self.messages = ["hello world", "z", "the quick brown fox", "batch " * 20]
+
+    def test_encrypt_many_matches_single(self):
+        """Test that batch encryption matches per-message encryption."""
+        expected = [
+            rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message)
+            for message in self.messages
+        ]
+        result = encrypt_many(
+            self.alphabet, self.modulus, self.pub_exp, self.messages, workers=1
+        )
+        self.assertEqual(result, expected)
+
+    def test_decrypt_many_matches_single(self):
+        """Test that batch decryption matches per-message decryption."""
+        encrypted = encrypt_many(
+            self.alphabet, self.modulus, self.pub_exp, self.messages, workers=1
+        )
+        expected = [
+            rsa_decrypt(self.alphabet, self.modulus, self.priv_exp, message)
+            for message in encrypted
+        ]
+        for private_exponent in [self.priv_exp, self.private_key]:
+            with self.subTest(private_exponent=type(private_exponent).__name__):
+                result = decrypt_many(
+                    self.alphabet,
+                    self.modulus,
+                    private_exponent,
+                    encrypted,
+                    workers=1,
+                )
+                self.assertEqual(result, expected)
+
+    def test_process_pool_preserves_order(self):
+        """Test that results from the process pool come back in order."""
+        expected_encrypted = encrypt_many(
+            self.alphabet, self.modulus, self.pub_exp, self.messages, workers=1
+        )
+        expected_decrypted = decrypt_many(
+            self.alphabet, self.modulus, self.private_key, expected_encrypted, workers=1
+        )
+
+        with mock.patch.object(batch, "PARALLEL_BLOCK_THRESHOLD", 0):
+            encrypted = encrypt_many(
+                self.alphabet, self.modulus, self.pub_exp, self.messages, workers=2
+            )
+            decrypted = decrypt_many(
+                self.alphabet, self.modulus, self.private_key, encrypted, workers=2
+            )
+        self.assertEqual(encrypted, expected_encrypted)
+        self.assertEqual(decrypted, expected_decrypted)
+
+    def test_encrypt_many_rejects_empty_message(self):
+        """Test that an empty message in the batch raises ValueError."""
+        with self.assertRaises(ValueError):
+            encrypt_many(self.alphabet, self.modulus, self.pub_exp, ["ok", ""])
+
+    def test_decrypt_many_invalid_input(self):
+        """Test that malformed ciphertext raises ValueError."""
+        with self.assertRaises(ValueError):
+            decrypt_many(self.alphabet, self.modulus, self.priv_exp, ["abc"])
+
+
+if __name__ == "__main__":
+    unittest.main()
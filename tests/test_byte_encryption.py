@@ -0,0 +1,66 @@
+import os
+import unittest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.byte_encryption import (
+    decrypt_bytes,
+    encrypt_bytes,
+    plaintext_block_size,
+)
+from rsa_encryption.formats import binary_block_size
+from rsa_encryption.key_generation import generate_keys
+
+
+class TestByteEncryption(unittest.TestCase):
+    """Test cases for byte-oriented RSA encryption."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+
+    def test_round_trip(self):
+        """Test that arbitrary bytes round-trip exactly."""
+        block_size = plaintext_block_size(self.modulus)
+        test_cases = [
+            b"",
+            b"\x00",
+            b"\x80",
+            b"hello world",
+            "número ünïcode ✓".encode("utf-8"),
+            b"\x00" * block_size,
+            b"trailing zeros\x00\x00",
+            os.urandom(1000),
+        ]
+
+        for data in test_cases:
+            for private_exponent in [self.private_key, self.private_key.d]:
+                with self.subTest(data=data[:16], exponent=type(private_exponent)):
+                    encrypted = encrypt_bytes(self.modulus, self.pub_exp, data)
+                    self.assertEqual(
+                        decrypt_bytes(self.modulus, private_exponent, encrypted), data
+                    )
+
+    def test_block_layout(self):
+        """Test that ciphertext is a whole number of modulus-width blocks."""
+        public_key, private_key = generate_keys(1024)
+        n, e = public_key
+        self.assertEqual(plaintext_block_size(n), 127)
+
+        encrypted = encrypt_bytes(n, e, b"x" * 254)
+        self.assertEqual(len(encrypted), 3 * binary_block_size(n))
+        self.assertEqual(decrypt_bytes(n, private_key, encrypted), b"x" * 254)
+
+    def test_decrypt_invalid_input(self):
+        """Test that malformed ciphertext raises ValueError."""
+        encrypted = encrypt_bytes(self.modulus, self.pub_exp, b"hello")
+        for data in [b"", encrypted[:-1], b"\xff" * len(encrypted)]:
+            with self.subTest(data=data):
+                with self.assertRaises(ValueError):
+                    decrypt_bytes(self.modulus, self.private_key, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+import random
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import (
+    CODEC_CACHE_SIZE,
+    RSACodec,
+    create_codec_tables,
+    decode_blocks,
+    encode_message,
+    get_codec_context,
+)
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.utils import create_char_mappings, split_into_chunks
+
+
+def legacy_encode(alphabet, message, block_size):
+    """Reference implementation of the original per-character encoding."""
+    char_to_num_map, _ = create_char_mappings(alphabet)
+    numeric_message = ""
+    for char in message:
+        numeric_message += char_to_num_map[char]
+    return [
+        int(block.ljust(block_size, "0"))
+        for block in split_into_chunks(numeric_message, block_size)
+    ]
+
+
+def legacy_decode(alphabet, block_values, block_size):
+    """Reference implementation of the original digit-pair decoding."""
+    _, num_to_char_map = create_char_mappings(alphabet)
+    decrypted_message = ""
+    for block_value in block_values:
+        decrypted_block = str(block_value).zfill(block_size)
+        for i in range(0, len(decrypted_block), 2):
+            pair = decrypted_block[i : i + 2]
+            if pair in num_to_char_map:
+                char = num_to_char_map[pair]
+                if char != alphabet[0] or i < len(decrypted_block) - 2:
+                    decrypted_message += char
+    return decrypted_message.rstrip(alphabet[0])
+
+
+class TestCodec(unittest.TestCase):
+    """Test cases for the table-driven message codec."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.encoding_table, self.pair_table = create_codec_tables(self.alphabet)
+        self.rng = random.Random(1234)
+
+    def test_encode_matches_legacy(self):
+        """Test that encoding matches the original implementation."""
+        for block_size in [2, 4, 8, 10]:
+            for length in [1, 3, 4, 17, 200]:
+                message = "".join(self.rng.choices(self.alphabet, k=length))
+                with self.subTest(block_size=block_size, message=message):
+                    self.assertEqual(
+                        encode_message(
+                            message, self.alphabet, self.encoding_table, block_size
+                        ),
+                        legacy_encode(self.alphabet, message, block_size),
+                    )
+
+    def test_decode_matches_legacy(self):
+        """Test that decoding matches the original implementation."""
+        for block_size in [2, 4, 8]:
+            for _ in range(50):
+                block_values = [
+                    self.rng.randrange(10 ** (block_size + 1))
+                    for _ in range(self.rng.randint(1, 6))
+                ]
+                with self.subTest(block_size=block_size, blocks=block_values):
+                    self.assertEqual(
+                        decode_blocks(
+                            block_values, self.alphabet, self.pair_table, block_size
+                        ),
+                        legacy_decode(self.alphabet, block_values, block_size),
+                    )
+
+    def test_encode_invalid_character(self):
+        """Test that the first invalid character is reported."""
+        with self.assertRaisesRegex(ValueError, "'!'"):
+            encode_message("hi!?", self.alphabet, self.encoding_table, 8)
+
+    def test_decode_empty(self):
+        """Test that decoding no blocks gives an empty message."""
+        self.assertEqual(decode_blocks([], self.alphabet, self.pair_table, 8), "")
+
+
+class TestRSACodec(unittest.TestCase):
+    """Test cases for the cached codec context and RSACodec."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+
+    def test_codec_matches_functions(self):
+        """Test that RSACodec matches rsa_encrypt and rsa_decrypt."""
+        encryptor = RSACodec(self.alphabet, self.public_key)
+        decryptor = RSACodec(self.alphabet, self.private_key)
+
+        for message in ["hello world", "z", "the quick brown fox"]:
+            with self.subTest(message=message):
+                encrypted = encryptor.encrypt(message)
+                self.assertEqual(
+                    encrypted,
+                    rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message),
+                )
+                self.assertEqual(
+                    decryptor.decrypt(encrypted),
+                    rsa_decrypt(
+                        self.alphabet, self.modulus, self.private_key, encrypted
+                    ),
+                )
+
+    def test_codec_accepts_legacy_private_key(self):
+        """Test that a plain (n, d) tuple works as a decryption key."""
+        encrypted = RSACodec(self.alphabet, self.public_key).encrypt("hello")
+        legacy_codec = RSACodec(self.alphabet, tuple(self.private_key))
+        self.assertEqual(legacy_codec.decrypt(encrypted), "hello")
+
+    def test_exponentiate_encoded_blocks(self):
+        """Test exponentiating blocks encoded outside the codec."""
+        encryptor = RSACodec(self.alphabet, self.public_key)
+        block_values = encryptor.context.encode("hello world")
+        self.assertEqual(
+            encryptor.exponentiate(block_values),
+            encryptor.encrypt_blocks("hello world"),
+        )
+        with self.assertRaises(ValueError):
+            encryptor.exponentiate([self.modulus])
+
+    def test_context_is_shared(self):
+        """Test that repeated (alphabet, modulus) pairs reuse one context."""
+        first = RSACodec(self.alphabet, self.public_key)
+        second = RSACodec(self.alphabet, self.private_key)
+        self.assertIs(first.context, second.context)
+        self.assertIs(first.context, get_codec_context(self.alphabet, self.modulus))
+
+    def test_context_cache_is_bounded(self):
+        """Test that the context cache evicts beyond its size."""
+        self.assertEqual(get_codec_context.cache_info().maxsize, CODEC_CACHE_SIZE)
+
+    def test_codec_invalid_input(self):
+        """Test that invalid input raises ValueError."""
+        with self.assertRaises(ValueError):
+            RSACodec(self.alphabet, self.public_key).encrypt("")
+        with self.assertRaises(ValueError):
+            RSACodec(self.alphabet, self.private_key).decrypt("abc")
+
+
+if __name__ == "__main__":
+    unittest.main()
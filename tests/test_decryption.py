@@ -85,6 +85,20 @@ class TestDecryption(unittest.TestCase):
                         self.alphabet, self.modulus, self.priv_exp, invalid_input
                     )
 
+    def test_decrypt_with_private_key_object(self):
+        """Test that the CRT path gives the same result as the (n, d) path."""
+        message = "the quick brown fox"
+        encrypted = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message)
+
+        crt_result = rsa_decrypt(
+            self.alphabet, self.modulus, self.private_key, encrypted
+        )
+        legacy_result = rsa_decrypt(
+            self.alphabet, self.modulus, self.priv_exp, encrypted
+        )
+        self.assertEqual(crt_result, message)
+        self.assertEqual(crt_result, legacy_result)
+
 
 if __name__ == "__main__":
     unittest.main()
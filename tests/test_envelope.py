@@ -0,0 +1,80 @@
+import os
+import unittest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.envelope import (
+    HEADER_SIZE,
+    KEYSTREAM_SEGMENT_SIZE,
+    TAG_SIZE,
+    decrypt_envelope,
+    encrypt_envelope,
+)
+from rsa_encryption.key_generation import generate_keys
+
+
+class TestEnvelope(unittest.TestCase):
+    """Test cases for hybrid RSA envelope encryption."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+
+    def test_round_trip(self):
+        """Test that arbitrary bytes round-trip exactly."""
+        test_cases = [
+            b"",
+            b"hello world",
+            "número ünïcode ✓".encode("utf-8"),
+            os.urandom(KEYSTREAM_SEGMENT_SIZE * 2 + 17),
+        ]
+
+        for data in test_cases:
+            for private_exponent in [self.private_key, self.private_key.d]:
+                with self.subTest(size=len(data), exponent=type(private_exponent)):
+                    envelope = encrypt_envelope(self.modulus, self.pub_exp, data)
+                    self.assertEqual(
+                        decrypt_envelope(self.modulus, private_exponent, envelope),
+                        data,
+                    )
+
+    def test_envelopes_are_randomized(self):
+        """Test that each envelope uses a fresh session key and nonce."""
+        first = encrypt_envelope(self.modulus, self.pub_exp, b"same message")
+        second = encrypt_envelope(self.modulus, self.pub_exp, b"same message")
+        self.assertNotEqual(first, second)
+
+    def test_tampering_detected(self):
+        """Test that modifying any part of the envelope is rejected."""
+        envelope = encrypt_envelope(self.modulus, self.pub_exp, b"hello world")
+
+        for position in [HEADER_SIZE, len(envelope) - TAG_SIZE - 1, len(envelope) - 1]:
+            with self.subTest(position=position):
+                tampered = bytearray(envelope)
+                tampered[position] ^= 1
+                with self.assertRaisesRegex(ValueError, "Decryption failed"):
+                    decrypt_envelope(self.modulus, self.private_key, bytes(tampered))
+
+    def test_wrong_key(self):
+        """Test that an envelope for another key is rejected."""
+        envelope = encrypt_envelope(self.modulus, self.pub_exp, b"hello world")
+        while True:
+            _, other_private_key = generate_keys()
+            if other_private_key.n != self.modulus:
+                break
+        with self.assertRaisesRegex(ValueError, "different key"):
+            decrypt_envelope(other_private_key.n, other_private_key, envelope)
+
+    def test_malformed(self):
+        """Test that truncated or foreign data is rejected."""
+        envelope = encrypt_envelope(self.modulus, self.pub_exp, b"hello world")
+        for data in [b"", b"RSAE", b"XXXX" + envelope[4:], envelope[: HEADER_SIZE + 4]]:
+            with self.subTest(data=data[:8]):
+                with self.assertRaises(ValueError):
+                    decrypt_envelope(self.modulus, self.private_key, data)
+
+
+if __name__ == "__main__":
+    unittest.main()
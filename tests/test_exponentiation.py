@@ -0,0 +1,120 @@
+import random
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.exponentiation import (
+    BACKENDS,
+    SlidingWindowPlan,
+    get_default_backend,
+    make_exponentiator,
+    register_backend,
+    set_default_backend,
+)
+from rsa_encryption.key_generation import generate_keys
+
+
+class TestSlidingWindowPlan(unittest.TestCase):
+    """Test cases for the precomputed sliding-window engine."""
+
+    def test_matches_pow(self):
+        """Test that the plan agrees with built-in pow."""
+        rng = random.Random(42)
+        modulus = rng.getrandbits(256) | 1
+        exponents = [1, 2, 3, 65537, 2**64, 2**64 - 1, rng.getrandbits(512)]
+
+        for exponent in exponents:
+            for window_bits in [None, 1, 4, 6]:
+                plan = SlidingWindowPlan(exponent, window_bits)
+                for base in [0, 1, 2, modulus - 1, rng.randrange(modulus)]:
+                    with self.subTest(exponent=exponent, window=window_bits):
+                        self.assertEqual(
+                            plan.power(base, modulus), pow(base, exponent, modulus)
+                        )
+
+    def test_invalid_arguments(self):
+        """Test that non-positive exponents and windows are rejected."""
+        with self.assertRaises(ValueError):
+            SlidingWindowPlan(0)
+        with self.assertRaises(ValueError):
+            SlidingWindowPlan(65537, 0)
+
+
+class TestExponentiator(unittest.TestCase):
+    """Test cases for backend selection and per-key preparation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.public_key, self.private_key = generate_keys(256)
+        self.modulus, self.pub_exp = self.public_key
+        self.blocks = [random.Random(7).randrange(self.modulus) for _ in range(20)]
+
+    def test_backends_agree(self):
+        """Test that every backend matches pow, with and without CRT."""
+        private_exp = self.private_key.d
+        cases = [
+            (self.pub_exp, self.pub_exp),
+            (private_exp, private_exp),
+            (self.private_key, private_exp),
+        ]
+
+        for backend in BACKENDS:
+            for exponent, plain_exponent in cases:
+                with self.subTest(backend=backend, exponent=type(exponent)):
+                    exponentiate = make_exponentiator(self.modulus, exponent, backend)
+                    self.assertEqual(
+                        [exponentiate(block) for block in self.blocks],
+                        [pow(b, plain_exponent, self.modulus) for b in self.blocks],
+                    )
+
+    def test_preparation_is_cached(self):
+        """Test that the same key and backend reuse one prepared function."""
+        first = make_exponentiator(self.modulus, self.private_key, "window")
+        second = make_exponentiator(self.modulus, self.private_key, "window")
+        self.assertIs(first, second)
+
+    def test_codec_backend(self):
+        """Test that RSACodec round-trips on a non-default backend."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz "
+        encrypted = RSACodec(alphabet, self.public_key, "window").encrypt("hello")
+        self.assertEqual(
+            encrypted, RSACodec(alphabet, self.public_key, "builtin").encrypt("hello")
+        )
+        self.assertEqual(
+            RSACodec(alphabet, self.private_key, "window").decrypt(encrypted), "hello"
+        )
+
+    def test_register_and_select_backend(self):
+        """Test plugging in a backend and making it the default."""
+        calls = []
+
+        def counting_backend(modulus, exponent):
+            def exponentiate_block(block_value):
+                calls.append(block_value)
+                return pow(block_value, exponent, modulus)
+
+            return exponentiate_block
+
+        previous = get_default_backend()
+        register_backend("counting", counting_backend)
+        try:
+            set_default_backend("counting")
+            self.assertEqual(make_exponentiator(self.modulus, 3)(2), 8)
+            self.assertEqual(calls, [2])
+        finally:
+            set_default_backend(previous)
+            del BACKENDS["counting"]
+
+    def test_unknown_backend(self):
+        """Test that unknown backends are rejected."""
+        with self.assertRaises(ValueError):
+            make_exponentiator(self.modulus, self.pub_exp, "missing")
+        with self.assertRaises(ValueError):
+            set_default_backend("missing")
+
+
+if __name__ == "__main__":
+    unittest.main()
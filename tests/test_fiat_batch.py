@@ -0,0 +1,97 @@
+import random
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.fiat_batch import (
+    decrypt_family,
+    decrypt_family_blocks,
+    fiat_decrypt_blocks,
+)
+from rsa_encryption.key_generation import generate_key_family
+
+
+class TestFiatBatch(unittest.TestCase):
+    """Test cases for Fiat batch RSA decryption."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = random.Random(5)
+        self.public_keys, self.private_key = generate_key_family(8, 256)
+        self.modulus = self.private_key.n
+        self.exponents = [e for _, e in self.public_keys]
+
+    def encrypt(self, messages, exponents):
+        """Encrypt each message block under its exponent."""
+        return [pow(m, e, self.modulus) for m, e in zip(messages, exponents)]
+
+    def test_batch_matches_messages(self):
+        """Test batches of every size up to the family size."""
+        for size in range(1, len(self.exponents) + 1):
+            with self.subTest(size=size):
+                exponents = self.exponents[:size]
+                messages = [self.rng.randrange(2, self.modulus) for _ in exponents]
+                self.assertEqual(
+                    fiat_decrypt_blocks(
+                        self.private_key, exponents, self.encrypt(messages, exponents)
+                    ),
+                    messages,
+                )
+
+    def test_rejects_bad_batches(self):
+        """Test that repeated exponents or mismatched lengths are rejected."""
+        with self.assertRaises(ValueError):
+            fiat_decrypt_blocks(self.private_key, [3, 3], [2, 3])
+        with self.assertRaises(ValueError):
+            fiat_decrypt_blocks(self.private_key, [3, 5], [2])
+
+    def test_family_blocks_any_order(self):
+        """Test mixed exponents, repeats and non-invertible blocks."""
+        pairs = [
+            (self.rng.choice(self.exponents), self.rng.randrange(self.modulus))
+            for _ in range(40)
+        ]
+        pairs += [(self.exponents[0], 0), (self.exponents[1], 1)]
+        encrypted = [(e, pow(m, e, self.modulus)) for e, m in pairs]
+
+        for batch_size in [None, 1, 3]:
+            with self.subTest(batch_size=batch_size):
+                self.assertEqual(
+                    decrypt_family_blocks(self.private_key, encrypted, batch_size),
+                    [m for _, m in pairs],
+                )
+
+    def test_rejects_bad_batch_size(self):
+        """Test that batch sizes below 1 raise ValueError."""
+        encrypted = [(self.exponents[0], 2)]
+        for batch_size in [0, -1]:
+            with self.subTest(batch_size=batch_size):
+                with self.assertRaises(ValueError):
+                    decrypt_family_blocks(self.private_key, encrypted, batch_size)
+
+    def test_decrypt_family_messages(self):
+        """Test that messages match rsa_decrypt with each exponent's key."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz "
+        totient = (self.private_key.p - 1) * (self.private_key.q - 1)
+        messages = ["hello world", "the quick brown fox", "zebra", "batch rsa"]
+
+        encrypted = []
+        expected = []
+        for (n, e), message in zip(self.public_keys, messages):
+            ciphertext = rsa_encrypt(alphabet, n, e, message)
+            encrypted.append((e, ciphertext))
+            expected.append(rsa_decrypt(alphabet, n, pow(e, -1, totient), ciphertext))
+
+        self.assertEqual(
+            decrypt_family(alphabet, self.private_key, encrypted), expected
+        )
+        with self.assertRaises(ValueError):
+            decrypt_family(alphabet, self.private_key, [(3, "abc")])
+
+
+if __name__ == "__main__":
+    unittest.main()
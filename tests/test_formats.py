@@ -0,0 +1,96 @@
+import base64
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.formats import (
+    HEADER_SIZE,
+    binary_block_size,
+    key_id,
+    pack_ciphertext,
+    unpack_ciphertext,
+)
+from rsa_encryption.key_generation import generate_keys
+
+
+class TestFormats(unittest.TestCase):
+    """Test cases for ciphertext serialization formats."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+        self.message = "the quick brown fox"
+        self.block_values = RSACodec(self.alphabet, self.public_key).encrypt_blocks(
+            self.message
+        )
+
+    def test_decimal_matches_rsa_encrypt(self):
+        """Test that the decimal format is the existing digit string."""
+        packed = pack_ciphertext(self.block_values, self.modulus, "decimal")
+        self.assertEqual(
+            packed,
+            rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, self.message),
+        )
+        self.assertEqual(
+            unpack_ciphertext(packed, self.modulus, "decimal"), self.block_values
+        )
+
+    def test_binary_round_trip(self):
+        """Test that binary ciphertext round-trips and decrypts."""
+        packed = pack_ciphertext(self.block_values, self.modulus, "binary")
+        width = binary_block_size(self.modulus)
+
+        self.assertIsInstance(packed, bytes)
+        self.assertEqual(len(packed), HEADER_SIZE + width * len(self.block_values))
+        self.assertIn(key_id(self.modulus), packed[:HEADER_SIZE])
+
+        block_values = unpack_ciphertext(packed, self.modulus, "binary")
+        self.assertEqual(block_values, self.block_values)
+        decryptor = RSACodec(self.alphabet, self.private_key)
+        self.assertEqual(decryptor.decrypt_blocks(block_values), self.message)
+
+    def test_base64_round_trip(self):
+        """Test that base64 ciphertext is the encoded binary form."""
+        packed = pack_ciphertext(self.block_values, self.modulus, "base64")
+        self.assertEqual(
+            base64.b64decode(packed),
+            pack_ciphertext(self.block_values, self.modulus, "binary"),
+        )
+        self.assertEqual(
+            unpack_ciphertext(packed, self.modulus, "base64"), self.block_values
+        )
+
+    def test_binary_is_smaller_than_decimal(self):
+        """Test that large-key binary ciphertext is well under decimal size."""
+        public_key, _ = generate_keys(1024)
+        block_values = RSACodec(self.alphabet, public_key).encrypt_blocks("a" * 500)
+        decimal = pack_ciphertext(block_values, public_key[0], "decimal")
+        binary = pack_ciphertext(block_values, public_key[0], "binary")
+        self.assertLess(len(binary) * 2, len(decimal))
+
+    def test_unpack_rejects_bad_input(self):
+        """Test that malformed or mismatched ciphertext raises ValueError."""
+        packed = pack_ciphertext(self.block_values, self.modulus, "binary")
+        other_modulus = generate_keys(64)[0][0]
+        cases = [
+            (packed[:-1], self.modulus, "binary"),
+            (packed[:5], self.modulus, "binary"),
+            (b"XXXX" + packed[4:], self.modulus, "binary"),
+            (packed, other_modulus, "binary"),
+            ("not base64!", self.modulus, "base64"),
+            (packed, self.modulus, "hex"),
+        ]
+        for data, modulus, input_format in cases:
+            with self.subTest(data=data[:8], input_format=input_format):
+                with self.assertRaises(ValueError):
+                    unpack_ciphertext(data, modulus, input_format)
+
+
+if __name__ == "__main__":
+    unittest.main()
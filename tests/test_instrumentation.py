@@ -0,0 +1,96 @@
+import io
+import json
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import instrumentation
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.instrumentation import Recorder, record_stages
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.streaming import rsa_decrypt_stream
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for per-stage timing instrumentation."""
+
+    def setUp(self):
+        """Set up a key pair."""
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.public_exp = self.public_key
+
+    def test_disabled_by_default(self):
+        """Test that nothing is recorded outside record_stages."""
+        self.assertIsNone(instrumentation.active)
+        with record_stages() as recorder:
+            self.assertIs(instrumentation.active, recorder)
+        self.assertIsNone(instrumentation.active)
+
+        rsa_encrypt(ALPHABET, self.modulus, self.public_exp, "hello")
+        self.assertEqual(recorder.stages, {})
+
+    def test_encrypt_and_decrypt_stages(self):
+        """Test stage names, block counts and byte counts."""
+        message = "hello world"
+        with record_stages() as recorder:
+            encrypted = rsa_encrypt(ALPHABET, self.modulus, self.public_exp, message)
+        stages = recorder.to_dict()
+        self.assertEqual(list(stages), ["encode", "exponentiate", "format"])
+        blocks = stages["encode"]["blocks"]
+        self.assertGreater(blocks, 0)
+        self.assertEqual(stages["exponentiate"]["blocks"], blocks)
+        self.assertEqual(stages["encode"]["bytes"], len(message))
+        self.assertEqual(stages["format"]["bytes"], len(encrypted))
+
+        with record_stages() as recorder:
+            decrypted = rsa_decrypt(ALPHABET, self.modulus, self.private_key, encrypted)
+        self.assertEqual(decrypted, message)
+        stages = recorder.to_dict()
+        self.assertEqual(list(stages), ["parse", "exponentiate", "decode"])
+        self.assertEqual(stages["decode"]["bytes"], len(message))
+        self.assertTrue(all(stats["calls"] == 1 for stats in stages.values()))
+
+    def test_streaming_is_recorded(self):
+        """Test that streamed decryption reports one call per window."""
+        message = "stream me " * 50
+        encrypted = rsa_encrypt(ALPHABET, self.modulus, self.public_exp, message)
+        with record_stages() as recorder:
+            decrypted = "".join(
+                rsa_decrypt_stream(
+                    ALPHABET,
+                    self.modulus,
+                    self.private_key,
+                    io.StringIO(encrypted),
+                    window_blocks=16,
+                )
+            )
+        self.assertEqual(decrypted, message)
+        self.assertGreater(recorder.stages["parse"].calls, 1)
+
+    def test_hooks_and_exports(self):
+        """Test hooks, JSON and Prometheus output."""
+        seen = []
+        recorder = Recorder(hooks=[lambda *record: seen.append(record)])
+        with record_stages(recorder):
+            rsa_encrypt(ALPHABET, self.modulus, self.public_exp, "hello")
+        self.assertEqual([record[0] for record in seen], list(recorder.to_dict()))
+
+        data = json.loads(recorder.to_json())
+        self.assertEqual(data["stages"]["encode"]["calls"], 1)
+
+        prometheus = recorder.to_prometheus()
+        self.assertIn("# TYPE rsa_stage_seconds_total counter", prometheus)
+        self.assertIn('rsa_stage_blocks_total{stage="exponentiate"}', prometheus)
+        self.assertIn("exponentiate", recorder.format_table())
+
+        recorder.reset()
+        self.assertEqual(recorder.to_dict(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,7 +5,15 @@ import os
 # Add parent directory to path to import rsa_encryption
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from rsa_encryption.key_generation import generate_keys, gcd, PRIME_NUMBERS
+from rsa_encryption.key_generation import (
+    generate_key_family,
+    generate_keys,
+    gcd,
+    keys_to_dict,
+    private_key_from_dict,
+    PrivateKey,
+    PRIME_NUMBERS,
+)
 
 
 class TestKeyGeneration(unittest.TestCase):
@@ -66,6 +74,89 @@ class TestKeyGeneration(unittest.TestCase):
         # Test if d is the multiplicative inverse of e mod totient
         self.assertEqual((d * e) % totient, 1)
 
+    def test_private_key_crt_parameters(self):
+        """Test that the private key carries valid CRT parameters."""
+        _, private_key = generate_keys()
+
+        self.assertIsInstance(private_key, PrivateKey)
+        self.assertEqual(private_key.p * private_key.q, private_key.n)
+        self.assertEqual(private_key.dp, private_key.d % (private_key.p - 1))
+        self.assertEqual(private_key.dq, private_key.d % (private_key.q - 1))
+        self.assertEqual((private_key.qinv * private_key.q) % private_key.p, 1)
+
+    def test_private_key_behaves_like_tuple(self):
+        """Test that the private key still unpacks as (n, d)."""
+        _, private_key = generate_keys()
+        n, d = private_key
+
+        self.assertEqual(len(private_key), 2)
+        self.assertEqual(private_key, (n, d))
+        self.assertEqual((private_key.n, private_key.d), (n, d))
+
+    def test_crt_block_decryption_matches_pow(self):
+        """Test that CRT decryption matches plain modular exponentiation."""
+        public_key, private_key = generate_keys()
+        n, e = public_key
+
+        for value in [0, 1, 2, 12345, n // 2, n - 1]:
+            with self.subTest(value=value):
+                encrypted = pow(value, e, n)
+                self.assertEqual(private_key.decrypt_block(encrypted), value)
+                self.assertEqual(
+                    private_key.decrypt_block(encrypted),
+                    pow(encrypted, private_key.d, n),
+                )
+
+    def test_key_dict_round_trip(self):
+        """Test that serialized keys load back with their CRT parameters."""
+        public_key, private_key = generate_keys()
+        keys_data = keys_to_dict(public_key, private_key)
+
+        loaded = private_key_from_dict(keys_data["private_key"])
+        self.assertIsInstance(loaded, PrivateKey)
+        self.assertEqual(loaded.__getnewargs__(), private_key.__getnewargs__())
+
+    def test_generate_keys_with_bits(self):
+        """Test that generated large keys have the requested size."""
+        for bits in [64, 512]:
+            with self.subTest(bits=bits):
+                public_key, private_key = generate_keys(bits)
+                n, e = public_key
+
+                self.assertEqual(n.bit_length(), bits)
+                self.assertNotEqual(private_key.p, private_key.q)
+                totient = (private_key.p - 1) * (private_key.q - 1)
+                self.assertEqual((private_key.d * e) % totient, 1)
+
+    def test_generate_keys_rejects_tiny_sizes(self):
+        """Test that key sizes below the minimum raise ValueError."""
+        with self.assertRaises(ValueError):
+            generate_keys(16)
+
+    def test_generate_key_family(self):
+        """Test that a key family shares one modulus with coprime exponents."""
+        for bits in [None, 256]:
+            with self.subTest(bits=bits):
+                public_keys, private_key = generate_key_family(6, bits)
+                totient = (private_key.p - 1) * (private_key.q - 1)
+                exponents = [e for _, e in public_keys]
+
+                self.assertEqual(len(public_keys), 6)
+                self.assertEqual({n for n, _ in public_keys}, {private_key.n})
+                for i, e in enumerate(exponents):
+                    self.assertEqual(gcd(e, totient), 1)
+                    for other in exponents[i + 1 :]:
+                        self.assertEqual(gcd(e, other), 1)
+
+        with self.assertRaises(ValueError):
+            generate_key_family(0)
+
+    def test_legacy_key_dict_loads_as_tuple(self):
+        """Test that key data without CRT parameters loads as (n, d)."""
+        loaded = private_key_from_dict({"n": 1081897847, "d": 12345})
+        self.assertNotIsInstance(loaded, PrivateKey)
+        self.assertEqual(loaded, (1081897847, 12345))
+
 
 if __name__ == "__main__":
     unittest.main()
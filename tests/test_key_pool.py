@@ -0,0 +1,90 @@
+import queue
+import tempfile
+import time
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import PrivateKey
+from rsa_encryption.key_pool import KeyPool, generate_keys_many, load_keys, save_keys
+
+
+class TestKeyPool(unittest.TestCase):
+    """Test cases for the pre-generated key pool."""
+
+    def assertValidKeyPair(self, key_pair):
+        public_key, private_key = key_pair
+        n, e = public_key
+        self.assertIsInstance(private_key, PrivateKey)
+        self.assertEqual(private_key.n, n)
+        self.assertEqual(pow(pow(12345, e, n), private_key.d, n), 12345)
+
+    def test_generate_keys_many(self):
+        """Test bulk key generation in-process and with workers."""
+        for workers in [1, 2]:
+            with self.subTest(workers=workers):
+                key_pairs = generate_keys_many(3, workers=workers)
+                self.assertEqual(len(key_pairs), 3)
+                for key_pair in key_pairs:
+                    self.assertValidKeyPair(key_pair)
+
+    def test_save_and_load_keys(self):
+        """Test that saved key pairs load back unchanged."""
+        key_pairs = generate_keys_many(2, workers=1)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keys.json")
+            save_keys(key_pairs, path)
+            self.assertEqual(load_keys(path), key_pairs)
+
+    def test_pool_hands_out_keys(self):
+        """Test that the pool fills in the background and refills."""
+        with KeyPool(low_water=2, high_water=4, workers=1) as pool:
+            key_pairs = [pool.get(timeout=30) for _ in range(6)]
+
+        for key_pair in key_pairs:
+            self.assertValidKeyPair(key_pair)
+
+    def test_pool_persistence(self):
+        """Test that a saved pool warms up a new pool."""
+        with KeyPool(low_water=1, high_water=3, workers=1) as pool:
+            deadline = time.monotonic() + 30
+            while len(pool) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "pool.json")
+            pool.save(path)
+
+            restored = KeyPool(low_water=1, high_water=3)
+            self.assertEqual(restored.load(path), 3)
+            self.assertFalse(os.path.exists(path))
+            self.assertValidKeyPair(restored.get(timeout=0))
+
+    def test_empty_pool_times_out(self):
+        """Test that an unstarted, empty pool raises queue.Empty."""
+        with self.assertRaises(queue.Empty):
+            KeyPool(low_water=1, high_water=2).get(timeout=0.01)
+
+    def test_unstarted_pool_does_not_block(self):
+        """Test that an unstarted, empty pool raises instead of waiting."""
+        with self.assertRaises(queue.Empty):
+            KeyPool(low_water=1, high_water=2).get()
+
+    def test_worker_error_reaches_get(self):
+        """Test that a failed worker raises its error from get()."""
+        with KeyPool(bits=16, low_water=1, high_water=2, workers=1) as pool:
+            with self.assertRaises(ValueError):
+                pool.get(timeout=30)
+            with self.assertRaises(ValueError):
+                pool.get()
+
+    def test_invalid_water_marks(self):
+        """Test that inconsistent water marks raise ValueError."""
+        with self.assertRaises(ValueError):
+            KeyPool(low_water=5, high_water=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
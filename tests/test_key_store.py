@@ -0,0 +1,92 @@
+import os
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import PrivateKey, generate_keys
+from rsa_encryption.key_store import KeyStore, default_key_id
+
+
+class TestKeyStore(unittest.TestCase):
+    """Test cases for the SQLite key store."""
+
+    def setUp(self):
+        """Open a store in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "keys.db")
+        self.store = KeyStore(self.path, cache_size=2)
+
+    def tearDown(self):
+        """Close and remove the store."""
+        self.store.close()
+        self.temp_dir.cleanup()
+
+    def test_add_and_get(self):
+        """Test that stored key pairs come back with their CRT parameters."""
+        key_pair = generate_keys()
+        key_id = self.store.add(key_pair, "tenant-1")
+        public_key, private_key = self.store.get(key_id)
+
+        self.assertEqual(key_id, "tenant-1")
+        self.assertEqual(public_key, key_pair[0])
+        self.assertIsInstance(private_key, PrivateKey)
+        self.assertEqual(private_key.__getnewargs__(), key_pair[1].__getnewargs__())
+        self.assertIn("tenant-1", self.store)
+        self.assertNotIn("tenant-2", self.store)
+
+    def test_default_ids_and_persistence(self):
+        """Test derived ids, bulk adds and reopening the file."""
+        key_pairs = [generate_keys() for _ in range(5)]
+        key_ids = self.store.add_many(key_pairs)
+        self.assertEqual(key_ids, [default_key_id(pub) for pub, _ in key_pairs])
+        self.store.close()
+
+        self.store = KeyStore(self.path)
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual(self.store.key_ids(), sorted(key_ids))
+        for key_id, key_pair in zip(key_ids, key_pairs):
+            with self.subTest(key_id=key_id):
+                self.assertEqual(self.store.get(key_id), key_pair)
+
+    def test_cache_is_bounded_and_invalidated(self):
+        """Test that the LRU stays bounded and replaced keys are reloaded."""
+        key_pairs = [generate_keys() for _ in range(3)]
+        key_ids = self.store.add_many(key_pairs, ["a", "b", "c"])
+        for key_id in key_ids:
+            self.store.get(key_id)
+        self.assertLessEqual(len(self.store._cache), 2)
+        self.assertIs(self.store.get("c"), self.store.get("c"))
+
+        replacement = generate_keys()
+        self.store.add(replacement, "c")
+        self.assertEqual(self.store.get("c"), replacement)
+
+    def test_public_key_only(self):
+        """Test storing an encrypt-only public key."""
+        public_key, _ = generate_keys()
+        self.store.add((public_key, None), "public")
+        self.assertEqual(self.store.get("public"), (public_key, None))
+
+    def test_missing_keys(self):
+        """Test that unknown ids raise KeyError."""
+        with self.assertRaises(KeyError):
+            self.store.get("missing")
+        with self.assertRaises(KeyError):
+            self.store.remove("missing")
+
+        self.store.add(generate_keys(), "gone")
+        self.store.get("gone")
+        self.store.remove("gone")
+        with self.assertRaises(KeyError):
+            self.store.get("gone")
+
+    def test_mismatched_ids(self):
+        """Test that key ids must match the key pairs one to one."""
+        with self.assertRaises(ValueError):
+            self.store.add_many([generate_keys()], ["a", "b"])
+
+
+if __name__ == "__main__":
+    unittest.main()
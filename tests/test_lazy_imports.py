@@ -0,0 +1,77 @@
+import os
+import subprocess
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a light command must not pull in
+HEAVY_MODULES = ["rsa_encryption.codec", "json", "multiprocessing", "sqlite3", "numpy"]
+
+
+def loaded_modules(code):
+    """Run code in a fresh interpreter and return the modules it loaded."""
+    script = f"import sys\n{code}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(unittest.TestCase):
+    """Test cases for lazy imports in the package and the CLI."""
+
+    def test_package_import_is_lazy(self):
+        """Test that importing the package does not load the codec."""
+        modules = loaded_modules("import rsa_encryption")
+        for module in HEAVY_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_public_names_load_on_access(self):
+        """Test that public names resolve through the lazy loader."""
+        import rsa_encryption
+        from rsa_encryption.encryption import rsa_encrypt
+
+        self.assertIs(rsa_encryption.rsa_encrypt, rsa_encrypt)
+        for name in rsa_encryption.__all__:
+            with self.subTest(name=name):
+                self.assertTrue(callable(getattr(rsa_encryption, name)))
+                self.assertIn(name, dir(rsa_encryption))
+        with self.assertRaises(AttributeError):
+            rsa_encryption.no_such_name
+
+    def test_cli_light_commands(self):
+        """Test that building the CLI parser imports no heavy modules."""
+        modules = loaded_modules(
+            "sys.argv = ['main.py', 'alphabet-info']\n"
+            "import main\n"
+            "main.main()"
+        )
+        for module in HEAVY_MODULES:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+    def test_generate_keys_without_store(self):
+        """Test that generate-keys loads the key store only when asked to."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "keys.json")
+            modules = loaded_modules(
+                f"sys.argv = ['main.py', 'generate-keys', '--output', {path!r}]\n"
+                "import main\n"
+                "main.main()"
+            )
+        for module in ["rsa_encryption.key_store", "sqlite3"]:
+            with self.subTest(module=module):
+                self.assertNotIn(module, modules)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.memo import MemoCache
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+class TestMemoCache(unittest.TestCase):
+    """Test cases for block and message memoization."""
+
+    def setUp(self):
+        """Set up a key pair."""
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.public_exp = self.public_key
+
+    def test_results_match_uncached(self):
+        """Test that cached encryption and decryption give the same output."""
+        cache = MemoCache()
+        for message in ["hello world", "hello world", "hello there", "world"]:
+            with self.subTest(message=message):
+                encrypted = rsa_encrypt(
+                    ALPHABET, self.modulus, self.public_exp, message, cache=cache
+                )
+                self.assertEqual(
+                    encrypted,
+                    rsa_encrypt(ALPHABET, self.modulus, self.public_exp, message),
+                )
+                decrypted = rsa_decrypt(
+                    ALPHABET, self.modulus, self.private_key, encrypted, cache=cache
+                )
+                self.assertEqual(decrypted, message)
+
+    def test_repeated_blocks_skip_pow(self):
+        """Test that repeats within and across messages are cache hits."""
+        calls = []
+        codec = RSACodec(ALPHABET, self.public_key, cache=MemoCache())
+        exponentiate_block = codec.exponentiate_block
+
+        def counting_block(value):
+            calls.append(value)
+            return exponentiate_block(value)
+
+        codec.exponentiate_block = counting_block
+        codec.vectorize = False
+
+        block_count = len(codec.context.encode("the same words " * 20))
+        codec.encrypt_blocks("the same words " * 20)
+        self.assertLess(len(calls), block_count)
+        self.assertEqual(len(calls), len(set(calls)))
+
+        calls.clear()
+        codec.encrypt_blocks("the same words " * 20)
+        self.assertEqual(calls, [])
+        stats = codec.cache.stats()
+        self.assertEqual(stats["block_hits"] + stats["block_misses"], 2 * block_count)
+        self.assertGreater(codec.cache.hit_rate, 0.5)
+
+    def test_whole_message_fast_path(self):
+        """Test that a repeated message is answered without its blocks."""
+        cache = MemoCache()
+        codec = RSACodec(ALPHABET, self.public_key, cache=cache)
+        first = codec.encrypt("identical short message")
+        block_lookups = cache.block_hits + cache.block_misses
+
+        self.assertEqual(codec.encrypt("identical short message"), first)
+        self.assertEqual(cache.message_hits, 1)
+        self.assertEqual(cache.message_misses, 1)
+        self.assertEqual(cache.block_hits + cache.block_misses, block_lookups)
+
+        # Other alphabets and keys do not share entries
+        other = RSACodec(ALPHABET + "0", self.public_key, cache=cache)
+        other.encrypt("identical short message")
+        self.assertEqual(cache.message_misses, 2)
+
+    def test_eviction_limits(self):
+        """Test the entry and memory caps and the eviction counter."""
+        cache = MemoCache(max_entries=10)
+        codec = RSACodec(ALPHABET, self.public_key, cache=cache)
+        codec.encrypt("a long message with many different blocks in it")
+        self.assertLessEqual(len(cache), 10)
+        self.assertGreater(cache.evictions, 0)
+
+        cache = MemoCache(max_bytes=2000)
+        codec = RSACodec(ALPHABET, self.public_key, cache=cache)
+        codec.encrypt("a long message with many different blocks in it")
+        self.assertLessEqual(cache.size, 2000)
+        self.assertGreater(len(cache), 0)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.size), (0, 0))
+        with self.assertRaises(ValueError):
+            MemoCache(max_entries=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
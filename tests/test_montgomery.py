@@ -0,0 +1,90 @@
+import random
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec, get_codec_context
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.montgomery import MontgomeryContext, montgomery_pow_blocks
+
+
+class TestMontgomery(unittest.TestCase):
+    """Test cases for Montgomery batch exponentiation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.rng = random.Random(99)
+
+    def test_conversion_round_trip(self):
+        """Test that values survive conversion into and out of Montgomery form."""
+        modulus = self.rng.getrandbits(128) | 1
+        context = MontgomeryContext(modulus)
+        for value in [0, 1, modulus - 1, self.rng.randrange(modulus)]:
+            with self.subTest(value=value):
+                montgomery = context.to_montgomery(value)
+                self.assertEqual(context.from_montgomery(montgomery), value)
+
+    def test_pow_many_matches_pow(self):
+        """Test that batch exponentiation agrees with built-in pow."""
+        for bits in [8, 64, 257]:
+            modulus = self.rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+            context = MontgomeryContext(modulus)
+            blocks = [0, 1, modulus - 1] + [
+                self.rng.randrange(modulus) for _ in range(10)
+            ]
+            for exponent in [0, 1, 2, 65537, self.rng.getrandbits(bits)]:
+                with self.subTest(bits=bits, exponent=exponent):
+                    self.assertEqual(
+                        context.pow_many(blocks, exponent),
+                        [pow(block, exponent, modulus) for block in blocks],
+                    )
+
+    def test_key_blocks_match_pow(self):
+        """Test public, private and CRT batches against pow."""
+        for bits in [None, 256]:
+            public_key, private_key = generate_keys(bits)
+            modulus, public_exp = public_key
+            blocks = [self.rng.randrange(modulus) for _ in range(30)]
+            cases = [
+                (public_exp, public_exp),
+                (private_key.d, private_key.d),
+                (private_key, private_key.d),
+            ]
+            for exponent, plain_exponent in cases:
+                with self.subTest(bits=bits, exponent=type(exponent)):
+                    self.assertEqual(
+                        montgomery_pow_blocks(blocks, exponent, modulus),
+                        [pow(block, plain_exponent, modulus) for block in blocks],
+                    )
+
+    def test_matches_codec(self):
+        """Test that codec blocks round-trip through the batch engine."""
+        alphabet = "abcdefghijklmnopqrstuvwxyz "
+        public_key, private_key = generate_keys()
+        modulus, public_exp = public_key
+        message = "the quick brown fox jumps over the lazy dog"
+        context = get_codec_context(alphabet, modulus)
+
+        encrypted_values = montgomery_pow_blocks(
+            context.encode(message), public_exp, modulus
+        )
+        encrypted = context.format_ciphertext(encrypted_values)
+        self.assertEqual(encrypted, RSACodec(alphabet, public_key).encrypt(message))
+
+        decrypted_values = montgomery_pow_blocks(
+            context.parse_ciphertext(encrypted), private_key, modulus
+        )
+        self.assertEqual(context.decode(decrypted_values), message)
+
+    def test_invalid_modulus(self):
+        """Test that even or tiny moduli are rejected."""
+        for modulus in [1, 2, 100]:
+            with self.subTest(modulus=modulus):
+                with self.assertRaises(ValueError):
+                    MontgomeryContext(modulus)
+
+
+if __name__ == "__main__":
+    unittest.main()
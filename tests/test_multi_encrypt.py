@@ -0,0 +1,65 @@
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import batch
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt, rsa_encrypt_multi
+from rsa_encryption.key_generation import generate_keys
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+class TestMultiRecipientEncryption(unittest.TestCase):
+    """Test cases for encrypting one message for many recipients."""
+
+    def setUp(self):
+        """Set up key pairs with two different block sizes."""
+        self.key_pairs = [generate_keys() for _ in range(3)]
+        self.key_pairs.append(generate_keys(512))
+        self.public_keys = [public_key for public_key, _ in self.key_pairs]
+
+    def test_matches_single_recipient(self):
+        """Test that every result equals a separate rsa_encrypt call."""
+        message = "hello world this is the news"
+        encrypted_messages = rsa_encrypt_multi(ALPHABET, self.public_keys, message)
+
+        self.assertEqual(len(encrypted_messages), len(self.public_keys))
+        for (n, e), encrypted in zip(self.public_keys, encrypted_messages):
+            self.assertEqual(encrypted, rsa_encrypt(ALPHABET, n, e, message))
+
+    def test_each_recipient_decrypts(self):
+        """Test that each recipient recovers the message with its own key."""
+        message = "meet me there tonight"
+        encrypted_messages = rsa_encrypt_multi(ALPHABET, self.public_keys, message)
+
+        for (public_key, private_key), encrypted in zip(
+            self.key_pairs, encrypted_messages
+        ):
+            decrypted = rsa_decrypt(ALPHABET, public_key[0], private_key, encrypted)
+            self.assertEqual(decrypted, message)
+
+    def test_invalid_input(self):
+        """Test that invalid messages raise errors like rsa_encrypt."""
+        with self.assertRaises(ValueError):
+            rsa_encrypt_multi(ALPHABET, self.public_keys, "")
+        with self.assertRaises(ValueError):
+            rsa_encrypt_multi(ALPHABET, self.public_keys, "hello!")
+        self.assertEqual(rsa_encrypt_multi(ALPHABET, [], "hello"), [])
+
+    def test_parallel_matches_serial(self):
+        """Test that worker processes give the same results."""
+        message = "the quick brown fox jumps over the lazy dog"
+        serial = rsa_encrypt_multi(ALPHABET, self.public_keys, message)
+        with mock.patch.object(batch, "PARALLEL_BLOCK_THRESHOLD", 1):
+            parallel = rsa_encrypt_multi(
+                ALPHABET, self.public_keys, message, workers=2
+            )
+        self.assertEqual(parallel, serial)
+
+
+if __name__ == "__main__":
+    unittest.main()
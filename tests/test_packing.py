@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec, get_codec_context
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.packing import (
+    create_radix_table,
+    pack_blocks,
+    radix_block_size,
+    unpack_blocks,
+)
+
+BASIC = "abcdefghijklmnopqrstuvwxyz "
+NUMERIC = "0123456789 "
+# More characters than two decimal digits can address
+CJK = "".join(chr(0x4E00 + i) for i in range(300))
+
+
+class TestRadixPacking(unittest.TestCase):
+    """Test cases for the base-len(alphabet) packing functions."""
+
+    def test_block_size_is_largest_that_fits(self):
+        """Test that k characters always fit and k + 1 may not."""
+        for base in (2, 11, 27, 300):
+            for modulus in (base + 1, 10**6 + 3, 2**64 - 59, 2**2048 - 1):
+                with self.subTest(base=base, modulus=modulus):
+                    chars = radix_block_size(modulus, base)
+                    largest = sum(base**i for i in range(1, chars + 1))
+                    self.assertLess(largest, modulus)
+                    self.assertGreaterEqual(largest + base ** (chars + 1), modulus)
+
+    def test_block_size_limits(self):
+        """Test the smallest and largest alphabets that can be packed."""
+        with self.assertRaises(ValueError):
+            radix_block_size(1000, 1)
+        with self.assertRaises(ValueError):
+            radix_block_size(27, 27)
+
+    def test_round_trip(self):
+        """Test packing and unpacking, including short final blocks."""
+        for alphabet in (BASIC, NUMERIC, CJK):
+            table = create_radix_table(alphabet)
+            for message in (alphabet[0], alphabet[::-1] * 3, alphabet[0] * 20):
+                with self.subTest(size=len(alphabet), message=message[:10]):
+                    blocks = pack_blocks(message, alphabet, table, 7)
+                    self.assertEqual(len(blocks), -(-len(message) // 7))
+                    self.assertEqual(unpack_blocks(blocks, alphabet), message)
+
+
+class TestRadixCodec(unittest.TestCase):
+    """Test cases for encryption with radix packing."""
+
+    def setUp(self):
+        """Set up a demo and a 1024-bit key pair."""
+        self.key_pairs = [generate_keys(), generate_keys(1024)]
+
+    def test_encrypt_decrypt(self):
+        """Test round trips, including messages ending in the first character."""
+        for public_key, private_key in self.key_pairs:
+            n, e = public_key
+            for alphabet, message in (
+                (BASIC, "hello world"),
+                (BASIC, "banana"),
+                (NUMERIC, "0123 4567 8900"),
+                (CJK, CJK[::7] * 5),
+            ):
+                with self.subTest(bits=n.bit_length(), message=message[:10]):
+                    encrypted = rsa_encrypt(alphabet, n, e, message, packing="radix")
+                    decrypted = rsa_decrypt(
+                        alphabet, n, private_key, encrypted, packing="radix"
+                    )
+                    self.assertEqual(decrypted, message)
+
+    def test_fewer_blocks(self):
+        """Test that radix packing needs fewer blocks than two-digit codes."""
+        for public_key, _ in self.key_pairs:
+            for alphabet in (BASIC, NUMERIC):
+                message = alphabet * 40
+                decimal = RSACodec(alphabet, public_key).encrypt_blocks(message)
+                radix = RSACodec(alphabet, public_key, packing="radix")
+                self.assertLess(len(radix.encrypt_blocks(message)), len(decimal))
+
+    def test_invalid_input(self):
+        """Test errors for bad messages and packings."""
+        n, e = self.key_pairs[0][0]
+        with self.assertRaises(ValueError):
+            rsa_encrypt(BASIC, n, e, "", packing="radix")
+        with self.assertRaises(ValueError):
+            rsa_encrypt(BASIC, n, e, "hello!", packing="radix")
+        with self.assertRaises(ValueError):
+            get_codec_context(BASIC, n, "octal")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import io
+import json
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.pipe import PipeHandler, iter_line_batches
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+def serve(handler, requests):
+    """Run requests through a handler and return the decoded responses."""
+    lines = [r if isinstance(r, str) else json.dumps(r) for r in requests]
+    output = io.StringIO()
+    handled = handler.serve(io.BytesIO("\n".join(lines).encode("utf-8")), output)
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    assert handled == len(responses)
+    return responses
+
+
+class TestPipe(unittest.TestCase):
+    """Test cases for the NDJSON pipe mode."""
+
+    def setUp(self):
+        """Set up a key pair and a handler with default keys."""
+        self.public_key, self.private_key = generate_keys()
+        self.handler = PipeHandler(ALPHABET, self.public_key, self.private_key)
+
+    def test_round_trip_with_default_keys(self):
+        """Test encrypt and decrypt requests that rely on the defaults."""
+        messages = ["hello world", "bulk record", "z"]
+        encrypted = serve(
+            self.handler,
+            [{"id": i, "op": "encrypt", "message": m} for i, m in enumerate(messages)],
+        )
+        self.assertEqual([r["id"] for r in encrypted], [0, 1, 2])
+        self.assertTrue(all(r["ok"] for r in encrypted))
+
+        n, e = self.public_key
+        for message, response in zip(messages, encrypted):
+            self.assertEqual(response["result"], rsa_encrypt(ALPHABET, n, e, message))
+
+        decrypted = serve(
+            self.handler,
+            [
+                {"id": r["id"], "op": "decrypt", "message": r["result"]}
+                for r in encrypted
+            ],
+        )
+        self.assertEqual([r["result"] for r in decrypted], messages)
+
+    def test_request_keys_and_alphabet_override_defaults(self):
+        """Test that a request's own key and alphabet take precedence."""
+        (n, e), private_key = generate_keys()
+        request = {
+            "id": "x",
+            "op": "encrypt",
+            "alphabet": "abc ",
+            "key": {"n": n, "e": e},
+            "message": "cab",
+        }
+        (response,) = serve(self.handler, [request])
+        self.assertEqual(response["result"], rsa_encrypt("abc ", n, e, "cab"))
+        self.assertEqual(rsa_decrypt("abc ", n, private_key, response["result"]), "cab")
+
+    def test_errors_are_per_request(self):
+        """Test that bad requests get error responses in their place."""
+        responses = serve(
+            PipeHandler(ALPHABET),
+            [
+                "not json",
+                "",
+                "[1, 2]",
+                {"id": 1, "op": "frobnicate"},
+                {"id": 2, "op": "encrypt", "message": "no key"},
+                {"id": 3, "op": "decrypt", "key": {"n": 1}, "message": "1"},
+                {"id": 4, "op": "generate_keys"},
+            ],
+        )
+        self.assertEqual([r["id"] for r in responses], [None, None, 1, 2, 3, 4])
+        self.assertEqual([r["ok"] for r in responses], [False] * 5 + [True])
+        self.assertIn("public_key", responses[-1]["result"])
+
+    def test_bad_keys_do_not_fail_other_requests(self):
+        """Test that requests with unusable keys fail alone."""
+        n, e = self.public_key
+        good = {"op": "encrypt", "key": {"n": n, "e": e}, "message": "hello"}
+        responses = serve(
+            # Requests without a key fall back to an unusable default
+            PipeHandler(ALPHABET, (0, 3), self.private_key),
+            [
+                dict(good, id=1),
+                {"id": 2, "op": "encrypt", "key": {"n": 0, "e": 3}, "message": "x"},
+                {"id": 3, "op": "encrypt", "key": {"n": -5, "e": 3}, "message": "x"},
+                {"id": 4, "op": "encrypt", "message": "x"},
+                dict(good, id=5),
+            ],
+        )
+        self.assertEqual([r["id"] for r in responses], [1, 2, 3, 4, 5])
+        self.assertEqual(
+            [r["ok"] for r in responses], [True, False, False, False, True]
+        )
+        expected = rsa_encrypt(ALPHABET, n, e, "hello")
+        self.assertEqual(responses[0]["result"], expected)
+        self.assertEqual(responses[-1]["result"], expected)
+
+    def test_line_batches_are_bounded(self):
+        """Test that batches never exceed the flush size."""
+        data = b"".join(b'{"id": %d}\n' % i for i in range(10)) + b'{"id": 10}'
+        batches = list(iter_line_batches(io.BytesIO(data), 4))
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertEqual(
+            [json.loads(line)["id"] for batch in batches for line in batch],
+            list(range(11)),
+        )
+
+        with self.assertRaises(ValueError):
+            PipeHandler(flush_lines=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import PRIME_NUMBERS
+from rsa_encryption.primes import SMALL_PRIMES, generate_prime, is_probable_prime
+
+
+class TestPrimes(unittest.TestCase):
+    """Test cases for prime generation."""
+
+    def test_small_primes_table(self):
+        """Test the sieve of small primes."""
+        self.assertEqual(SMALL_PRIMES[:10], [2, 3, 5, 7, 11, 13, 17, 19, 23, 29])
+        for prime in SMALL_PRIMES[:200]:
+            with self.subTest(prime=prime):
+                self.assertTrue(all(prime % d for d in range(2, prime)))
+
+    def test_is_probable_prime_known_values(self):
+        """Test primality on known primes and composites."""
+        for prime in PRIME_NUMBERS + [2, 3, 2**61 - 1, 2**127 - 1]:
+            with self.subTest(prime=prime):
+                self.assertTrue(is_probable_prime(prime))
+
+        # Includes Carmichael numbers and a product of two large primes
+        composites = [0, 1, 4, 561, 41041, 825265, 32749 * 32771, (2**61 - 1) ** 2]
+        for composite in composites:
+            with self.subTest(composite=composite):
+                self.assertFalse(is_probable_prime(composite))
+
+    def test_generate_prime_bit_length(self):
+        """Test that generated primes have exactly the requested size."""
+        for bits in [16, 64, 256]:
+            with self.subTest(bits=bits):
+                prime = generate_prime(bits)
+                self.assertEqual(prime.bit_length(), bits)
+                self.assertTrue(is_probable_prime(prime))
+
+    def test_generate_prime_rejects_tiny_sizes(self):
+        """Test that sizes below the sieve bound raise ValueError."""
+        with self.assertRaises(ValueError):
+            generate_prime(8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import os
+import random
+import tempfile
+import unittest
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.formats import pack_ciphertext
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.random_access import CiphertextReader
+
+
+class TestCiphertextReader(unittest.TestCase):
+    """Test cases for the memory-mapped random-access reader."""
+
+    def setUp(self):
+        """Write a decimal and a binary ciphertext file."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+        rng = random.Random(3)
+        self.message = "".join(rng.choices("bcdefghijklmnopqrstuvwxyz ", k=1001))
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.decimal_path = os.path.join(self.temp_dir.name, "message.enc")
+        with open(self.decimal_path, "w") as f:
+            f.write(
+                rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, self.message)
+            )
+            f.write("\n")
+
+        block_values = RSACodec(self.alphabet, self.public_key).encrypt_blocks(
+            self.message
+        )
+        self.binary_path = os.path.join(self.temp_dir.name, "message.bin")
+        with open(self.binary_path, "wb") as f:
+            f.write(pack_ciphertext(block_values, self.modulus, "binary"))
+        self.block_count = len(block_values)
+
+    def tearDown(self):
+        """Remove the ciphertext files."""
+        self.temp_dir.cleanup()
+
+    def test_read_chars(self):
+        """Test that character ranges match the original message."""
+        ranges = [(0, 10), (7, 8), (500, 600), (990, None), (0, None)]
+        for path, input_format in [
+            (self.decimal_path, "decimal"),
+            (self.binary_path, "binary"),
+        ]:
+            with CiphertextReader(
+                path, self.alphabet, self.private_key, input_format
+            ) as reader:
+                self.assertEqual(len(reader), self.block_count)
+                for start, stop in ranges:
+                    with self.subTest(format=input_format, start=start, stop=stop):
+                        self.assertEqual(
+                            reader.read_chars(start, stop), self.message[start:stop]
+                        )
+
+    def test_read_blocks(self):
+        """Test that block ranges decode to the matching characters."""
+        with CiphertextReader(
+            self.decimal_path, self.alphabet, self.private_key
+        ) as reader:
+            per_block = reader.chars_per_block
+            self.assertEqual(
+                reader.read_blocks(2, 4), self.message[2 * per_block : 4 * per_block]
+            )
+            self.assertEqual(reader.read_blocks(0, len(reader)), self.message)
+            with self.assertRaises(IndexError):
+                reader.encrypted_block(len(reader))
+
+    def test_invalid_files(self):
+        """Test that empty, truncated or foreign files are rejected."""
+        empty_path = os.path.join(self.temp_dir.name, "empty.enc")
+        open(empty_path, "w").close()
+        truncated_path = os.path.join(self.temp_dir.name, "truncated.enc")
+        with open(self.decimal_path) as source, open(truncated_path, "w") as f:
+            f.write(source.read().strip()[:-1])
+
+        for path, input_format in [
+            (empty_path, "decimal"),
+            (truncated_path, "decimal"),
+            (self.decimal_path, "binary"),
+            (self.decimal_path, "base64"),
+        ]:
+            with self.subTest(path=os.path.basename(path), format=input_format):
+                with self.assertRaises(ValueError):
+                    CiphertextReader(
+                        path, self.alphabet, self.private_key, input_format
+                    )
+
+
+if __name__ == "__main__":
+    unittest.main()
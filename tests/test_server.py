@@ -0,0 +1,227 @@
+import asyncio
+import os
+import tempfile
+import unittest
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys, keys_to_dict
+from rsa_encryption.server import RSAServer, encode_frame, read_frame
+
+
+class TestRSAServer(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the asyncio RSA service."""
+
+    async def asyncSetUp(self):
+        """Set up a server on a free port with an in-process executor."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        public_key, private_key = generate_keys()
+        self.modulus, self.pub_exp = public_key
+        self.private_key = private_key
+        key_data = keys_to_dict(public_key, private_key)
+        self.public_key_data = key_data["public_key"]
+        self.private_key_data = key_data["private_key"]
+
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.server = RSAServer(executor=self.executor)
+        listener = await self.server.start(port=0)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        """Stop the server and its executor."""
+        await self.server.close()
+        self.executor.shutdown(wait=True)
+
+    async def request(self, reader, writer, request):
+        """Send one request and wait for its response."""
+        writer.write(encode_frame(request))
+        await writer.drain()
+        return await read_frame(reader)
+
+    def encrypt_request(self, request_id, message):
+        """Build an encrypt request."""
+        return {
+            "id": request_id,
+            "op": "encrypt",
+            "alphabet": self.alphabet,
+            "key": self.public_key_data,
+            "message": message,
+        }
+
+    async def test_encrypt_decrypt_round_trip(self):
+        """Test that the service matches rsa_encrypt and rsa_decrypt."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            response = await self.request(
+                reader, writer, self.encrypt_request(1, "hello world")
+            )
+            self.assertEqual(response["id"], 1)
+            self.assertTrue(response["ok"])
+            self.assertEqual(
+                response["result"],
+                rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, "hello world"),
+            )
+
+            response = await self.request(
+                reader,
+                writer,
+                {
+                    "id": 2,
+                    "op": "decrypt",
+                    "alphabet": self.alphabet,
+                    "key": self.private_key_data,
+                    "message": response["result"],
+                },
+            )
+            self.assertEqual(response, {"id": 2, "ok": True, "result": "hello world"})
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    async def test_concurrent_requests_are_batched(self):
+        """Test that pipelined requests on one connection all get answers."""
+        messages = [f"message {chr(98 + i % 25)}" for i in range(100)]
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            for i, message in enumerate(messages):
+                writer.write(encode_frame(self.encrypt_request(i, message)))
+            await writer.drain()
+
+            responses = {}
+            for _ in messages:
+                response = await read_frame(reader)
+                responses[response["id"]] = response
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        for i, message in enumerate(messages):
+            with self.subTest(message=message):
+                self.assertTrue(responses[i]["ok"])
+                self.assertEqual(
+                    rsa_decrypt(
+                        self.alphabet,
+                        self.modulus,
+                        self.private_key,
+                        responses[i]["result"],
+                    ),
+                    message,
+                )
+
+    async def test_errors_are_per_request(self):
+        """Test that a bad request fails alone and the connection stays open."""
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        try:
+            writer.write(encode_frame(self.encrypt_request(1, "hello!")))
+            writer.write(encode_frame(self.encrypt_request(2, "hello")))
+            bad, good = await read_frame(reader), await read_frame(reader)
+            unknown = await self.request(reader, writer, {"id": 3, "op": "sign"})
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        responses = {response["id"]: response for response in [bad, good, unknown]}
+        self.assertFalse(responses[1]["ok"])
+        self.assertIn("not in the alphabet", responses[1]["error"])
+        self.assertTrue(responses[2]["ok"])
+        self.assertFalse(responses[3]["ok"])
+        self.assertIn("Unknown operation", responses[3]["error"])
+
+    async def test_malformed_key_does_not_stop_batching(self):
+        """Test that a bad key fails alone and later requests are served."""
+        bad_keys = [{"n": [1], "d": 3}, {"n": "x", "d": 3}, {"d": 3}]
+        for request_id, key in enumerate(bad_keys):
+            response = await asyncio.wait_for(
+                self.server.handle_request(
+                    {
+                        "id": request_id,
+                        "op": "decrypt",
+                        "alphabet": self.alphabet,
+                        "key": key,
+                        "message": "0123456789",
+                    }
+                ),
+                timeout=5,
+            )
+            self.assertFalse(response["ok"])
+            self.assertIn("Request key", response["error"])
+
+        response = await asyncio.wait_for(
+            self.server.handle_request(self.encrypt_request(9, "hello")), timeout=5
+        )
+        self.assertTrue(response["ok"])
+
+    async def test_batch_errors_do_not_stop_batching(self):
+        """Test that a group that cannot be batched fails with an error."""
+        loop = asyncio.get_running_loop()
+        self.server._open()
+        future = loop.create_future()
+        # An unhashable group, as a key that slipped past validation would be
+        self.server._queue.put_nowait((("decrypt", self.alphabet, [1]), "", future))
+        ok, error = await asyncio.wait_for(future, timeout=5)
+        self.assertFalse(ok)
+        self.assertIn("Invalid request key", error)
+
+        response = await asyncio.wait_for(
+            self.server.handle_request(self.encrypt_request(1, "hello")), timeout=5
+        )
+        self.assertTrue(response["ok"])
+
+    async def test_decrypt_with_legacy_key(self):
+        """Test decryption with a key of only n and d, without CRT fields."""
+        encrypted = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, "hello")
+        response = await self.server.handle_request(
+            {
+                "id": 1,
+                "op": "decrypt",
+                "alphabet": self.alphabet,
+                "key": {"n": self.modulus, "d": self.private_key.d},
+                "message": encrypted,
+            }
+        )
+        self.assertEqual(response, {"id": 1, "ok": True, "result": "hello"})
+
+    async def test_generate_keys(self):
+        """Test key generation through the service."""
+        response = await self.server.handle_request({"id": 1, "op": "generate_keys"})
+        self.assertTrue(response["ok"])
+        self.assertIn("public_key", response["result"])
+        self.assertIn("private_key", response["result"])
+
+    async def test_queue_depth_limit(self):
+        """Test that requests beyond the queue depth are rejected as busy."""
+        self.server.max_queue_depth = 1
+        first, second = await asyncio.gather(
+            self.server.handle_request(self.encrypt_request(1, "hello")),
+            self.server.handle_request(self.encrypt_request(2, "hello")),
+        )
+        self.assertTrue(first["ok"])
+        self.assertFalse(second["ok"])
+        self.assertIn("busy", second["error"])
+        self.assertEqual(self.server.queue_depth, 0)
+
+    @unittest.skipUnless(hasattr(asyncio, "open_unix_connection"), "needs Unix sockets")
+    async def test_unix_socket(self):
+        """Test serving over a Unix socket."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "rsa.sock")
+            server = RSAServer(executor=self.executor)
+            await server.start(path=path)
+            try:
+                reader, writer = await asyncio.open_unix_connection(path)
+                response = await self.request(
+                    reader, writer, self.encrypt_request(1, "hello")
+                )
+                writer.close()
+                await writer.wait_closed()
+            finally:
+                await server.close()
+        self.assertTrue(response["ok"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.key_generation import PrivateKey, gcd, generate_keys
+from rsa_encryption.signing import (
+    _multi_pow,
+    batch_test_pays,
+    sign,
+    sign_many,
+    verify,
+    verify_batch,
+    verify_many,
+)
+
+
+def wide_exponent_keys(bits):
+    """Build a key pair whose public exponent is as wide as the modulus."""
+    _, private_key = generate_keys(bits)
+    totient = (private_key.p - 1) * (private_key.q - 1)
+    public_exp = totient // 3 | 1
+    while gcd(public_exp, totient) != 1:
+        public_exp += 2
+    private_exp = pow(public_exp, -1, totient)
+    return (
+        (private_key.n, public_exp),
+        PrivateKey.from_primes(private_key.p, private_key.q, private_exp),
+    )
+
+
+class TestSigning(unittest.TestCase):
+    """Test cases for signing and single verification."""
+
+    def setUp(self):
+        """Set up a key pair and messages."""
+        self.public_key, self.private_key = generate_keys(512)
+        self.messages = [f"record {i}".encode() for i in range(40)]
+
+    def test_sign_and_verify(self):
+        """Test that signatures verify for their own message only."""
+        signature = sign(self.private_key, "hello")
+        self.assertTrue(verify(self.public_key, "hello", signature))
+        self.assertTrue(verify(self.public_key, b"hello", signature))
+        self.assertFalse(verify(self.public_key, "hullo", signature))
+        self.assertFalse(verify(self.public_key, "hello", signature + 1))
+        self.assertFalse(verify(self.public_key, "hello", 0))
+        self.assertFalse(verify(self.public_key, "hello", self.public_key[0]))
+
+    def test_plain_private_key(self):
+        """Test that an (n, d) tuple signs like the CRT key."""
+        n, d = self.private_key
+        self.assertEqual(sign((n, d), "hello"), sign(self.private_key, "hello"))
+
+    def test_sign_many(self):
+        """Test that sign_many equals signing one message at a time."""
+        signatures = sign_many(self.private_key, self.messages)
+        self.assertEqual(
+            signatures, [sign(self.private_key, m) for m in self.messages]
+        )
+
+
+class TestBatchVerification(unittest.TestCase):
+    """Test cases for the randomized small-exponent batch test."""
+
+    def setUp(self):
+        """Set up key pairs with a small and a wide public exponent."""
+        self.key_pairs = [generate_keys(512), wide_exponent_keys(512)]
+        self.messages = [f"record {i}".encode() for i in range(64)]
+
+    def test_multi_pow(self):
+        """Test the bucket multi-exponentiation against pow()."""
+        modulus = self.key_pairs[0][0][0]
+        bases = [3 + 7 * i for i in range(50)]
+        exponents = [(i * 0x9E3779B97F4A7C15) % (1 << 64) for i in range(50)]
+        expected = 1
+        for base, exponent in zip(bases, exponents):
+            expected = expected * pow(base, exponent, modulus) % modulus
+        self.assertEqual(_multi_pow(bases, exponents, modulus, 64), expected)
+
+    def test_valid_batch(self):
+        """Test that a batch of valid signatures passes."""
+        for public_key, private_key in self.key_pairs:
+            signatures = sign_many(private_key, self.messages)
+            self.assertTrue(verify_batch(public_key, self.messages, signatures))
+            self.assertEqual(
+                verify_many(public_key, self.messages, signatures),
+                [True] * len(self.messages),
+            )
+
+    def test_invalid_signatures_found(self):
+        """Test that the batch fails and verify_many names the bad ones."""
+        for public_key, private_key in self.key_pairs:
+            signatures = sign_many(private_key, self.messages)
+            signatures[5] = signatures[6]
+            signatures[40] = signatures[40] * 2 % public_key[0]
+            signatures[63] = 0
+
+            self.assertFalse(verify_batch(public_key, self.messages, signatures))
+            results = verify_many(public_key, self.messages, signatures)
+            self.assertEqual(
+                [i for i, valid in enumerate(results) if not valid], [5, 40, 63]
+            )
+
+    def test_batch_used_only_when_cheaper(self):
+        """Test the cost model for small and wide public exponents."""
+        self.assertFalse(batch_test_pays(65537, 1000, 64))
+        self.assertTrue(batch_test_pays(self.key_pairs[1][0][1], 1000, 64))
+        self.assertFalse(batch_test_pays(self.key_pairs[1][0][1], 1, 64))
+
+    def test_mismatched_lengths(self):
+        """Test that messages and signatures must pair up."""
+        public_key = self.key_pairs[0][0]
+        with self.assertRaises(ValueError):
+            verify_batch(public_key, self.messages, [1])
+        with self.assertRaises(ValueError):
+            verify_many(public_key, self.messages, [1])
+        self.assertTrue(verify_batch(public_key, [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
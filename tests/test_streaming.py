@@ -0,0 +1,112 @@
+import io
+import random
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption.decryption import rsa_decrypt
+from rsa_encryption.encryption import rsa_encrypt
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.streaming import rsa_decrypt_stream, rsa_encrypt_stream
+
+
+class TestStreaming(unittest.TestCase):
+    """Test cases for streaming encryption and decryption."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.alphabet = "abcdefghijklmnopqrstuvwxyz "
+        self.public_key, self.private_key = generate_keys()
+        self.modulus, self.pub_exp = self.public_key
+        rng = random.Random(42)
+        self.messages = [
+            "hello world",
+            "z",
+            "".join(rng.choices(self.alphabet, k=1001)),
+            "trailing pad aaaa",
+        ]
+
+    def encrypt_stream(self, message, window_blocks, strip_line_ending=False):
+        return "".join(
+            rsa_encrypt_stream(
+                self.alphabet,
+                self.modulus,
+                self.pub_exp,
+                io.StringIO(message),
+                window_blocks,
+                strip_line_ending,
+            )
+        )
+
+    def decrypt_stream(self, encrypted, window_blocks):
+        return "".join(
+            rsa_decrypt_stream(
+                self.alphabet,
+                self.modulus,
+                self.private_key,
+                io.StringIO(encrypted),
+                window_blocks,
+            )
+        )
+
+    def test_encrypt_stream_matches_rsa_encrypt(self):
+        """Test that streamed ciphertext matches whole-message encryption."""
+        for message in self.messages:
+            expected = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message)
+            for window_blocks in [1, 3, 1024]:
+                with self.subTest(message=message[:20], window=window_blocks):
+                    self.assertEqual(
+                        self.encrypt_stream(message, window_blocks), expected
+                    )
+
+    def test_decrypt_stream_matches_rsa_decrypt(self):
+        """Test that streamed plaintext matches whole-message decryption."""
+        for message in self.messages:
+            encrypted = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message)
+            expected = rsa_decrypt(
+                self.alphabet, self.modulus, self.private_key, encrypted
+            )
+            for window_blocks in [1, 3, 1024]:
+                with self.subTest(message=message[:20], window=window_blocks):
+                    self.assertEqual(
+                        self.decrypt_stream(encrypted, window_blocks), expected
+                    )
+
+    def test_decrypt_stream_ignores_line_breaks(self):
+        """Test that wrapped ciphertext decrypts the same as unwrapped."""
+        encrypted = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, "hello")
+        wrapped = "\n".join(encrypted[i : i + 7] for i in range(0, len(encrypted), 7))
+        self.assertEqual(self.decrypt_stream(wrapped + "\n", 2), "hello")
+
+    def test_encrypt_stream_empty_input(self):
+        """Test that an empty stream raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.encrypt_stream("", 4)
+        with self.assertRaises(ValueError):
+            self.encrypt_stream("\n", 4, strip_line_ending=True)
+
+    def test_encrypt_stream_strips_line_ending(self):
+        """Test that one final line ending is left out when requested."""
+        for message in self.messages:
+            expected = rsa_encrypt(self.alphabet, self.modulus, self.pub_exp, message)
+            for ending in ["\n", "\r\n"]:
+                for window_blocks in [1, 3]:
+                    with self.subTest(message=message[:20], ending=ending):
+                        self.assertEqual(
+                            self.encrypt_stream(message + ending, window_blocks, True),
+                            expected,
+                        )
+
+        with self.assertRaises(ValueError):
+            self.encrypt_stream("hello\n\n", 2, strip_line_ending=True)
+
+    def test_decrypt_stream_invalid_input(self):
+        """Test that malformed ciphertext raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.decrypt_stream("not a ciphertext", 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
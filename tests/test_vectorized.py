@@ -0,0 +1,101 @@
+import random
+import unittest
+import sys
+import os
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_encryption import vectorized
+from rsa_encryption.batch import decrypt_many, encrypt_many
+from rsa_encryption.codec import RSACodec
+from rsa_encryption.key_generation import generate_keys
+from rsa_encryption.vectorized import (
+    VECTORIZED_MAX_MODULUS,
+    can_vectorize,
+    numpy_pow_blocks,
+    use_vectorized,
+)
+
+ALPHABET = "abcdefghijklmnopqrstuvwxyz "
+
+
+class TestVectorizedSelection(unittest.TestCase):
+    """Test cases for choosing the vectorized path."""
+
+    def test_large_moduli_are_not_vectorized(self):
+        """Test that moduli above 2^32 keep the per-block path."""
+        self.assertFalse(can_vectorize(VECTORIZED_MAX_MODULUS + 1))
+        self.assertFalse(use_vectorized(VECTORIZED_MAX_MODULUS + 1, 10**6))
+        self.assertFalse(RSACodec(ALPHABET, generate_keys(64)[0]).vectorize)
+
+    def test_short_runs_and_explicit_backends(self):
+        """Test the block threshold and that a chosen backend is kept."""
+        public_key, _ = generate_keys()
+        self.assertFalse(use_vectorized(public_key[0], 1))
+        self.assertFalse(RSACodec(ALPHABET, public_key, backend="window").vectorize)
+
+    def test_round_trip_without_numpy(self):
+        """Test that long messages round-trip when NumPy is unavailable."""
+        public_key, private_key = generate_keys()
+        # No "a": the first alphabet character is dropped at block ends
+        message = "one pow per block " * 100
+        with mock.patch.object(vectorized, "load_numpy", return_value=None):
+            self.assertFalse(use_vectorized(public_key[0], 10**6))
+            encrypted = RSACodec(ALPHABET, public_key).encrypt(message)
+            decrypted = RSACodec(ALPHABET, private_key).decrypt(encrypted)
+        self.assertEqual(decrypted, message)
+
+
+@unittest.skipUnless(vectorized.load_numpy() is not None, "NumPy is not installed")
+class TestNumpyPowBlocks(unittest.TestCase):
+    """Test cases for NumPy exponentiation."""
+
+    def setUp(self):
+        """Set up a demo key pair and random blocks."""
+        self.public_key, self.private_key = generate_keys()
+        self.modulus = self.public_key[0]
+        rng = random.Random(0)
+        self.blocks = [rng.randrange(self.modulus) for _ in range(1000)]
+
+    def test_matches_pow(self):
+        """Test public, private and CRT exponents against pow()."""
+        n, e = self.public_key
+        d = self.private_key.d
+        for exponent, expected_exponent in ((e, e), (d, d), (self.private_key, d)):
+            with self.subTest(exponent=expected_exponent):
+                self.assertEqual(
+                    numpy_pow_blocks(self.blocks, exponent, n),
+                    [pow(block, expected_exponent, n) for block in self.blocks],
+                )
+        self.assertEqual(numpy_pow_blocks([0, 1, n - 1], 0, n), [1, 1, 1])
+
+    def test_largest_modulus(self):
+        """Test that products near 2^64 do not overflow."""
+        modulus = VECTORIZED_MAX_MODULUS - 5
+        blocks = [modulus - 1, modulus - 2, 2**31]
+        self.assertEqual(
+            numpy_pow_blocks(blocks, 65537, modulus),
+            [pow(block, 65537, modulus) for block in blocks],
+        )
+
+    def test_codec_and_batch_use_numpy(self):
+        """Test that codecs and batches vectorize and still round-trip."""
+        n, e = self.public_key
+        codec = RSACodec(ALPHABET, self.public_key)
+        self.assertTrue(codec.vectorize)
+
+        messages = ["bulk numpy blocks " * 40, "short", "more bulk vectors " * 30]
+        encrypted = encrypt_many(ALPHABET, n, e, messages, workers=1)
+        self.assertEqual(encrypted, [codec.encrypt(m) for m in messages])
+        self.assertEqual(
+            decrypt_many(ALPHABET, n, self.private_key, encrypted, workers=1),
+            messages,
+        )
+
+        with self.assertRaises(ValueError):
+            numpy_pow_blocks(self.blocks, 3, VECTORIZED_MAX_MODULUS + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()